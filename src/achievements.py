@@ -1,31 +1,61 @@
 import pygame
 from fish import FISH_DATABASE
+from render import DirtyTracker
+from utils import scaled, get_overlay
+from fonts import get_font, render_text
+from game_clock import game_clock
+from settings import SIMULATION_RATE
+
+
+# Catching a fish of a rarity advances every "<tier> or rarer" stat at or below it
+RARITY_TIER_STATS = {
+    'common': (),
+    'uncommon': ('uncommon_plus',),
+    'rare': ('uncommon_plus', 'rare_plus'),
+    'epic': ('uncommon_plus', 'rare_plus', 'epic_plus'),
+    'legendary': ('uncommon_plus', 'rare_plus', 'epic_plus', 'legendary_plus'),
+    'mythic': ('uncommon_plus', 'rare_plus', 'epic_plus', 'legendary_plus', 'mythic_count'),
+}
 
 
 class Achievement:
     """Represents a single achievement"""
 
-    def __init__(self, id, name, description, requirement, reward_gold, icon="🏆"):
+    def __init__(self, id, name, description, stat, threshold, reward_gold, icon="🏆"):
         self.id = id
         self.name = name
         self.description = description
-        self.requirement = requirement  # Function that checks if achieved
+        self.stat = stat  # Stat key this achievement depends on
+        self.threshold = threshold  # Unlocked once stats[stat] >= threshold (True for flags)
         self.reward_gold = reward_gold
         self.icon = icon
         self.unlocked = False
         self.progress = 0  # For tracking partial progress
         self.date_unlocked = None
 
+    def requirement(self, stats):
+        """Check if the achievement is earned with the given stats"""
+        return stats.get(self.stat, 0) >= self.threshold
+
 
 class AchievementSystem:
     """Manages all achievements and tracks progress"""
 
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock or game_clock
         self.achievements = {}
         self.total_rewards_earned = 0
         self.newly_unlocked = []  # Recently unlocked achievements to display
         self.notification_timer = 0
 
+        # Incremental evaluation: running stats, and per stat the achievements that
+        # depend on it sorted by threshold with a cursor at the first locked one
+        self.stats = {}
+        self.ladders = {}  # stat -> [Achievement] in ascending threshold order
+        self.cursors = {}  # stat -> index of the first locked achievement in its ladder
+        self.changed_stats = set()
+        self.unlocked_count = 0
+
         # Initialize all achievements
         self.create_achievements()
 
@@ -35,156 +65,189 @@ class AchievementSystem:
         # Beginner achievements
         self.add_achievement(Achievement(
             "first_catch", "First Catch!", "Catch your first fish",
-            lambda stats: stats['total_catches'] >= 1,
+            'total_catches', 1,
             50, "🎣"
         ))
 
         self.add_achievement(Achievement(
             "early_fisher", "Early Fisher", "Catch 10 fish",
-            lambda stats: stats['total_catches'] >= 10,
+            'total_catches', 10,
             100, "🐟"
         ))
 
         self.add_achievement(Achievement(
             "experienced_angler", "Experienced Angler", "Catch 50 fish",
-            lambda stats: stats['total_catches'] >= 50,
+            'total_catches', 50,
             250, "🎯"
         ))
 
         self.add_achievement(Achievement(
             "master_fisher", "Master Fisher", "Catch 100 fish",
-            lambda stats: stats['total_catches'] >= 100,
+            'total_catches', 100,
             500, "⭐"
         ))
 
         self.add_achievement(Achievement(
             "legendary_angler", "Legendary Angler", "Catch 500 fish",
-            lambda stats: stats['total_catches'] >= 500,
+            'total_catches', 500,
             2000, "👑"
         ))
 
         # Collection achievements
         self.add_achievement(Achievement(
             "collector", "Collector", "Catch 5 different species",
-            lambda stats: stats['unique_species'] >= 5,
+            'unique_species', 5,
             150, "📚"
         ))
 
         self.add_achievement(Achievement(
             "pokemon_master", "Pokemon Master", "Catch all fish species",
-            lambda stats: stats['unique_species'] >= len(FISH_DATABASE),
+            'unique_species', len(FISH_DATABASE),
             5000, "🎖️"
         ))
 
         self.add_achievement(Achievement(
             "pokedex_complete", "Pokedex Complete", "Catch both normal and shiny of every species",
-            lambda stats: stats['complete_collection'],
+            'complete_collection', True,
             10000, "💎"
         ))
 
         # Shiny achievements
         self.add_achievement(Achievement(
             "shiny_hunter", "Shiny Hunter", "Catch your first shiny fish",
-            lambda stats: stats['total_shinies'] >= 1,
+            'total_shinies', 1,
             200, "✨"
         ))
 
         self.add_achievement(Achievement(
             "shiny_collector", "Shiny Collector", "Catch 10 shiny fish",
-            lambda stats: stats['total_shinies'] >= 10,
+            'total_shinies', 10,
             1000, "💫"
         ))
 
         self.add_achievement(Achievement(
             "shiny_master", "Shiny Master", "Catch 50 shiny fish",
-            lambda stats: stats['total_shinies'] >= 50,
+            'total_shinies', 50,
             5000, "🌟"
         ))
 
         # Rarity achievements
         self.add_achievement(Achievement(
             "uncommon_hunter", "Uncommon Hunter", "Catch 10 uncommon or rarer fish",
-            lambda stats: stats['uncommon_plus'] >= 10,
+            'uncommon_plus', 10,
             200, "🟢"
         ))
 
         self.add_achievement(Achievement(
             "rare_collector", "Rare Collector", "Catch 10 rare or rarer fish",
-            lambda stats: stats['rare_plus'] >= 10,
+            'rare_plus', 10,
             400, "🔵"
         ))
 
         self.add_achievement(Achievement(
             "epic_seeker", "Epic Seeker", "Catch 5 epic or rarer fish",
-            lambda stats: stats['epic_plus'] >= 5,
+            'epic_plus', 5,
             800, "🟣"
         ))
 
         self.add_achievement(Achievement(
             "legendary_finder", "Legendary Finder", "Catch your first legendary fish",
-            lambda stats: stats['legendary_plus'] >= 1,
+            'legendary_plus', 1,
             1000, "🟠"
         ))
 
         self.add_achievement(Achievement(
             "mythic_champion", "Mythic Champion", "Catch a mythic fish",
-            lambda stats: stats['mythic_count'] >= 1,
+            'mythic_count', 1,
             3000, "🔴"
         ))
 
         # Gold achievements
         self.add_achievement(Achievement(
             "first_fortune", "First Fortune", "Earn 1,000 gold",
-            lambda stats: stats['total_gold'] >= 1000,
+            'total_gold', 1000,
             100, "💰"
         ))
 
         self.add_achievement(Achievement(
             "wealthy", "Wealthy", "Earn 10,000 gold",
-            lambda stats: stats['total_gold'] >= 10000,
+            'total_gold', 10000,
             500, "💵"
         ))
 
         self.add_achievement(Achievement(
             "millionaire", "Millionaire", "Earn 100,000 gold",
-            lambda stats: stats['total_gold'] >= 100000,
+            'total_gold', 100000,
             5000, "🤑"
         ))
 
         # Special achievements
         self.add_achievement(Achievement(
             "patient_fisher", "Patient Fisher", "Successfully catch a fish after waiting 3+ seconds",
-            lambda stats: stats.get('patient_catch', False),
+            'patient_catch', True,
             100, "⏰"
         ))
 
         self.add_achievement(Achievement(
             "quick_reflexes", "Quick Reflexes", "Catch a fish within 0.5 seconds of the bite",
-            lambda stats: stats.get('quick_catch', False),
+            'quick_catch', True,
             150, "⚡"
         ))
 
         self.add_achievement(Achievement(
             "perfect_streak", "Perfect Streak", "Catch 10 fish in a row without missing",
-            lambda stats: stats.get('catch_streak', 0) >= 10,
+            'catch_streak', 10,
             500, "🔥"
         ))
 
         self.add_achievement(Achievement(
             "completionist", "Completionist", "Unlock all other achievements",
-            lambda stats: stats.get('all_unlocked', False),
+            'all_unlocked', True,
             20000, "🏅"
         ))
 
     def add_achievement(self, achievement):
         """Add an achievement to the system"""
         self.achievements[achievement.id] = achievement
-
-    def check_achievements(self, stats):
-        """Check all achievements against current stats"""
-        for achievement in self.achievements.values():
-            if not achievement.unlocked and achievement.requirement(stats):
-                self.unlock_achievement(achievement.id)
+        ladder = self.ladders.setdefault(achievement.stat, [])
+        ladder.append(achievement)
+        ladder.sort(key=lambda a: a.threshold)
+        self.cursors[achievement.stat] = 0
+        self.changed_stats.add(achievement.stat)
+
+    def set_stat(self, key, value):
+        """Set a running stat, marking it for re-evaluation if it changed"""
+        if self.stats.get(key) != value:
+            self.stats[key] = value
+            self.changed_stats.add(key)
+
+    def set_stats(self, stats):
+        """Set several running stats at once"""
+        for key, value in stats.items():
+            self.set_stat(key, value)
+
+    def add_stat(self, key, amount=1):
+        """Increase a running counter"""
+        self.set_stat(key, self.stats.get(key, 0) + amount)
+
+    def check_achievements(self, stats=None):
+        """Unlock achievements whose stats changed since the last check"""
+        if stats:
+            self.set_stats(stats)
+
+        # Unlocking can change 'all_unlocked', so keep going until nothing changed
+        while self.changed_stats:
+            key = self.changed_stats.pop()
+            ladder = self.ladders.get(key)
+            if not ladder:
+                continue
+            value = self.stats.get(key, 0)
+            cursor = self.cursors[key]
+            # Thresholds are ascending, so stop at the first one not yet reached
+            while cursor < len(ladder) and (ladder[cursor].unlocked or value >= ladder[cursor].threshold):
+                self.unlock_achievement(ladder[cursor].id)
+                cursor += 1
+            self.cursors[key] = cursor
 
     def unlock_achievement(self, achievement_id):
         """Unlock an achievement and grant rewards"""
@@ -196,13 +259,15 @@ class AchievementSystem:
             return False
 
         achievement.unlocked = True
-        import datetime
-        achievement.date_unlocked = datetime.datetime.now()
+        achievement.date_unlocked = self.clock.now()
 
         self.newly_unlocked.append(achievement)
-        self.notification_timer = 240  # Show for 4 seconds
+        self.notification_timer = 4 * SIMULATION_RATE  # Show for 4 seconds
         self.total_rewards_earned += achievement.reward_gold
 
+        self.unlocked_count += 1
+        self.set_stat('all_unlocked', self.unlocked_count >= len(self.achievements) - 1)
+
         return achievement.reward_gold
 
     def update(self):
@@ -214,7 +279,7 @@ class AchievementSystem:
 
     def get_unlocked_count(self):
         """Get number of unlocked achievements"""
-        return sum(1 for a in self.achievements.values() if a.unlocked)
+        return self.unlocked_count
 
     def get_total_count(self):
         """Get total number of achievements"""
@@ -236,17 +301,20 @@ class AchievementUI:
     """UI for displaying achievements"""
 
     def __init__(self):
-        self.font = pygame.font.Font(None, 24)
-        self.title_font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = get_font(scaled(24))
+        self.title_font = get_font(scaled(36))
+        self.small_font = get_font(scaled(18))
         self.scroll_offset = 0
 
+        # Regions changed since last frame (dirty-rect rendering)
+        self.dirty = DirtyTracker()
+
     def draw_box(self, screen, x, y, width, height, color=(60, 40, 30)):
         """Draw a styled box"""
-        pygame.draw.rect(screen, (0, 0, 0, 50), (x + 3, y + 3, width, height))
+        pygame.draw.rect(screen, (0, 0, 0), (x + scaled(3), y + scaled(3), width, height))
         pygame.draw.rect(screen, color, (x, y, width, height))
         pygame.draw.rect(screen, (101, 67, 33), (x, y, width, height), 3)
-        pygame.draw.rect(screen, (205, 133, 63), (x + 3, y + 3, width - 6, height - 6), 1)
+        pygame.draw.rect(screen, (205, 133, 63), (x + scaled(3), y + scaled(3), width - scaled(6), height - scaled(6)), 1)
 
     def draw_notification(self, screen, achievement_system, screen_width):
         """Draw achievement unlock notification"""
@@ -254,65 +322,65 @@ class AchievementUI:
             achievement = achievement_system.newly_unlocked[-1]
 
             # Notification box
-            notif_width = 400
-            notif_height = 100
+            notif_width = scaled(400)
+            notif_height = scaled(100)
             notif_x = screen_width // 2 - notif_width // 2
-            notif_y = 50
+            notif_y = scaled(50)
 
             # Pulse effect
             import math
             pulse = abs(math.sin(achievement_system.notification_timer / 10))
             glow_color = (int(255 * pulse), int(215 * pulse), int(100 * pulse))
+            glow_step = max(1, scaled(2))
+            self.dirty.add((notif_x - 2 * glow_step, notif_y - 2 * glow_step, notif_width + 4 * glow_step, notif_height + 4 * glow_step), (achievement.id, glow_color))
 
             # Draw with glow
             for i in range(3):
-                alpha_surface = pygame.Surface((notif_width + i*4, notif_height + i*4), pygame.SRCALPHA)
+                alpha_surface = pygame.Surface((notif_width + i*2*glow_step, notif_height + i*2*glow_step), pygame.SRCALPHA)
                 alpha_value = 100 - (i * 30)
                 pygame.draw.rect(alpha_surface, (*glow_color, alpha_value),
-                               (0, 0, notif_width + i*4, notif_height + i*4))
-                screen.blit(alpha_surface, (notif_x - i*2, notif_y - i*2))
+                               (0, 0, notif_width + i*2*glow_step, notif_height + i*2*glow_step))
+                screen.blit(alpha_surface, (notif_x - i*glow_step, notif_y - i*glow_step))
 
             self.draw_box(screen, notif_x, notif_y, notif_width, notif_height, (40, 20, 60))
 
             # Achievement unlocked text
-            unlock_text = self.small_font.render("ACHIEVEMENT UNLOCKED!", True, (255, 215, 0))
-            unlock_rect = unlock_text.get_rect(center=(notif_x + notif_width // 2, notif_y + 20))
+            unlock_text = render_text(self.small_font, "ACHIEVEMENT UNLOCKED!", (255, 215, 0))
+            unlock_rect = unlock_text.get_rect(center=(notif_x + notif_width // 2, notif_y + scaled(20)))
             screen.blit(unlock_text, unlock_rect)
 
             # Icon and name
-            icon_text = self.title_font.render(achievement.icon, True, (255, 255, 255))
-            screen.blit(icon_text, (notif_x + 20, notif_y + 35))
+            icon_text = render_text(self.title_font, achievement.icon, (255, 255, 255))
+            screen.blit(icon_text, (notif_x + scaled(20), notif_y + scaled(35)))
 
-            name_text = self.font.render(achievement.name, True, (255, 255, 255))
-            screen.blit(name_text, (notif_x + 60, notif_y + 40))
+            name_text = render_text(self.font, achievement.name, (255, 255, 255))
+            screen.blit(name_text, (notif_x + scaled(60), notif_y + scaled(40)))
 
             # Description
-            desc_text = self.small_font.render(achievement.description, True, (200, 200, 200))
-            screen.blit(desc_text, (notif_x + 60, notif_y + 60))
+            desc_text = render_text(self.small_font, achievement.description, (200, 200, 200))
+            screen.blit(desc_text, (notif_x + scaled(60), notif_y + scaled(60)))
 
             # Reward
-            reward_text = self.font.render(f"+{achievement.reward_gold} Gold", True, (255, 215, 0))
-            screen.blit(reward_text, (notif_x + notif_width - 120, notif_y + 40))
+            reward_text = render_text(self.font, f"+{achievement.reward_gold} Gold", (255, 215, 0))
+            screen.blit(reward_text, (notif_x + notif_width - scaled(120), notif_y + scaled(40)))
 
     def draw(self, screen, achievement_system, screen_width, screen_height):
         """Draw achievements screen"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(200)
-        overlay.fill((20, 20, 20))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((screen_width, screen_height), (20, 20, 20, 200)), (0, 0))
+        self.dirty.add((0, 0, screen_width, screen_height), ('achievements', achievement_system.get_unlocked_count()))
 
         # Main box
-        box_width = 700
-        box_height = 500
+        box_width = scaled(700)
+        box_height = scaled(500)
         box_x = screen_width // 2 - box_width // 2
         box_y = screen_height // 2 - box_height // 2
 
         self.draw_box(screen, box_x, box_y, box_width, box_height)
 
         # Title
-        title_text = self.title_font.render("Achievements", True, (255, 215, 0))
-        title_rect = title_text.get_rect(center=(box_x + box_width // 2, box_y + 25))
+        title_text = render_text(self.title_font, "Achievements", (255, 215, 0))
+        title_rect = title_text.get_rect(center=(box_x + box_width // 2, box_y + scaled(25)))
         screen.blit(title_text, title_rect)
 
         # Progress
@@ -320,27 +388,27 @@ class AchievementUI:
         total = achievement_system.get_total_count()
         completion = achievement_system.get_completion_percentage()
 
-        progress_text = self.font.render(
-            f"{unlocked}/{total} Unlocked ({completion:.1f}%)",
-            True, (144, 238, 144)
+        progress_text = render_text(
+            self.font, f"{unlocked}/{total} Unlocked ({completion:.1f}%)",
+            (144, 238, 144)
         )
-        screen.blit(progress_text, (box_x + 20, box_y + 55))
+        screen.blit(progress_text, (box_x + scaled(20), box_y + scaled(55)))
 
         # Total rewards
-        reward_text = self.font.render(
-            f"Total Rewards Earned: {achievement_system.total_rewards_earned} Gold",
-            True, (255, 215, 0)
+        reward_text = render_text(
+            self.font, f"Total Rewards Earned: {achievement_system.total_rewards_earned} Gold",
+            (255, 215, 0)
         )
-        screen.blit(reward_text, (box_x + box_width - 350, box_y + 55))
+        screen.blit(reward_text, (box_x + box_width - scaled(350), box_y + scaled(55)))
 
         # Divider
         pygame.draw.line(screen, (255, 215, 0),
-                        (box_x + 20, box_y + 80),
-                        (box_x + box_width - 20, box_y + 80), 2)
+                        (box_x + scaled(20), box_y + scaled(80)),
+                        (box_x + box_width - scaled(20), box_y + scaled(80)), 2)
 
         # Achievement list
-        list_y = box_y + 95
-        list_height = box_height - 130
+        list_y = box_y + scaled(95)
+        list_height = box_height - scaled(130)
 
         # Get all achievements sorted (unlocked first)
         sorted_achievements = sorted(
@@ -350,44 +418,44 @@ class AchievementUI:
 
         current_y = list_y
         for achievement in sorted_achievements:
-            if current_y + 65 > list_y + list_height:
+            if current_y + scaled(65) > list_y + list_height:
                 break
 
             # Achievement entry
             entry_color = (40, 60, 40) if achievement.unlocked else (30, 30, 30)
-            pygame.draw.rect(screen, entry_color, (box_x + 20, current_y, box_width - 40, 60))
+            pygame.draw.rect(screen, entry_color, (box_x + scaled(20), current_y, box_width - scaled(40), scaled(60)))
 
             border_color = (100, 200, 100) if achievement.unlocked else (60, 60, 60)
-            pygame.draw.rect(screen, border_color, (box_x + 20, current_y, box_width - 40, 60), 2)
+            pygame.draw.rect(screen, border_color, (box_x + scaled(20), current_y, box_width - scaled(40), scaled(60)), 2)
 
             # Icon
-            icon_text = self.font.render(achievement.icon, True, (255, 255, 255))
-            screen.blit(icon_text, (box_x + 30, current_y + 20))
+            icon_text = render_text(self.font, achievement.icon, (255, 255, 255))
+            screen.blit(icon_text, (box_x + scaled(30), current_y + scaled(20)))
 
             # Name
             name_color = (255, 255, 255) if achievement.unlocked else (120, 120, 120)
-            name_text = self.font.render(achievement.name, True, name_color)
-            screen.blit(name_text, (box_x + 65, current_y + 10))
+            name_text = render_text(self.font, achievement.name, name_color)
+            screen.blit(name_text, (box_x + scaled(65), current_y + scaled(10)))
 
             # Description
             desc_color = (200, 200, 200) if achievement.unlocked else (100, 100, 100)
-            desc_text = self.small_font.render(achievement.description, True, desc_color)
-            screen.blit(desc_text, (box_x + 65, current_y + 35))
+            desc_text = render_text(self.small_font, achievement.description, desc_color)
+            screen.blit(desc_text, (box_x + scaled(65), current_y + scaled(35)))
 
             # Reward
             if achievement.unlocked:
-                reward_badge = self.small_font.render("UNLOCKED", True, (100, 200, 100))
-                screen.blit(reward_badge, (box_x + box_width - 150, current_y + 15))
+                reward_badge = render_text(self.small_font, "UNLOCKED", (100, 200, 100))
+                screen.blit(reward_badge, (box_x + box_width - scaled(150), current_y + scaled(15)))
 
-            reward_value = self.font.render(f"{achievement.reward_gold}g", True, (255, 215, 0))
-            screen.blit(reward_value, (box_x + box_width - 150, current_y + 35))
+            reward_value = render_text(self.font, f"{achievement.reward_gold}g", (255, 215, 0))
+            screen.blit(reward_value, (box_x + box_width - scaled(150), current_y + scaled(35)))
 
-            current_y += 65
+            current_y += scaled(65)
 
         # Instructions
-        inst_text = self.small_font.render(
-            "Press A to close | ESC to return to menu",
-            True, (180, 180, 180)
+        inst_text = render_text(
+            self.small_font, "Press A to close | ESC to return to menu",
+            (180, 180, 180)
         )
-        inst_rect = inst_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - 15))
+        inst_rect = inst_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - scaled(15)))
         screen.blit(inst_text, inst_rect)
@@ -17,7 +17,7 @@ class Camera:
         # Screen shake
         self.shake_amount = 0
         self.shake_duration = 0
-        self.shake_decay = 0.9
+        self.shake_decay = 0.9  # Per tick
 
     def apply_shake(self, amount, duration=15):
         """Apply screen shake effect"""
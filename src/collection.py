@@ -1,57 +1,105 @@
 import pygame
-from fish import FISH_DATABASE, RARITY_WEIGHTS
+import numpy as np
+from fish import FISH_DATABASE, FISH_IDS, FISH_INDEX, RARITY_WEIGHTS, fish_atlas
+from render import DirtyTracker
+from utils import scaled, get_overlay
+from fonts import get_font, render_text
 
 
 class Collection:
-    """Pokedex-style fish collection tracker"""
+    """Pokedex-style fish collection tracker backed by per-species count arrays"""
 
     def __init__(self):
-        # Track what fish have been caught (fish_id -> {'normal': count, 'shiny': count})
-        self.caught_fish = {}
-
-        # Statistics
+        self.reset()
+
+    def reset(self):
+        """Start an empty collection"""
+        # Species index -> catch counts, plus caught/shiny bitsets (bit i = species i)
+        # (sized for the fish database; only unknown species from old saves grow them)
+        self.species = list(FISH_IDS)  # Index -> fish_id
+        self.index = dict(FISH_INDEX)  # fish_id -> index
+        self.normal_counts = np.zeros(len(self.species), dtype=np.int64)
+        self.shiny_counts = np.zeros(len(self.species), dtype=np.int64)
+        self.caught_bits = 0  # Caught in any variant
+        self.normal_bits = 0
+        self.shiny_bits = 0
+
+        # Statistics (kept up to date on every catch)
         self.total_catches = 0
         self.unique_fish_caught = 0
+        self.unique_shiny_caught = 0
         self.total_shiny_caught = 0
+        self.rarity_totals = {rarity: 0 for rarity in RARITY_WEIGHTS}
+        self.rarity_caught = {rarity: 0 for rarity in RARITY_WEIGHTS}
 
         # Initialize all fish as not caught
-        for fish_id in FISH_DATABASE.keys():
-            self.caught_fish[fish_id] = {'normal': 0, 'shiny': 0}
-
-    def add_catch(self, fish_id, is_shiny=False):
+        for properties in FISH_DATABASE.values():
+            if properties['rarity'] in self.rarity_totals:
+                self.rarity_totals[properties['rarity']] += 1
+
+    def add_species(self, fish_id):
+        """Give a species missing from the fish database a slot in the count arrays"""
+        index = len(self.species)
+        if index >= len(self.normal_counts):
+            # Grow geometrically so repeated additions stay amortized O(1)
+            capacity = max(1, 2 * len(self.normal_counts))
+            self.normal_counts = np.resize(self.normal_counts, capacity)
+            self.shiny_counts = np.resize(self.shiny_counts, capacity)
+            self.normal_counts[index:] = 0
+            self.shiny_counts[index:] = 0
+        self.index[fish_id] = index
+        self.species.append(fish_id)
+        return index
+
+    def add_catch(self, fish_id, is_shiny=False, count=1):
         """Record a fish catch"""
-        if fish_id not in self.caught_fish:
-            self.caught_fish[fish_id] = {'normal': 0, 'shiny': 0}
+        index = self.index.get(fish_id)
+        if index is None:
+            index = self.add_species(fish_id)
+        bit = 1 << index
+
+        if not self.caught_bits & bit:
+            # First catch of this species
+            self.caught_bits |= bit
+            self.unique_fish_caught += 1
 
         if is_shiny:
-            self.caught_fish[fish_id]['shiny'] += 1
-            self.total_shiny_caught += 1
+            self.shiny_counts[index] += count
+            self.total_shiny_caught += count
+            if not self.shiny_bits & bit:
+                self.shiny_bits |= bit
+                self.unique_shiny_caught += 1
         else:
-            self.caught_fish[fish_id]['normal'] += 1
+            self.normal_counts[index] += count
+            if not self.normal_bits & bit:
+                # Rarity progress counts normal catches
+                self.normal_bits |= bit
+                rarity = FISH_DATABASE.get(fish_id, {}).get('rarity')
+                if rarity in self.rarity_caught:
+                    self.rarity_caught[rarity] += 1
 
-        self.total_catches += 1
-        self.update_stats()
-
-    def update_stats(self):
-        """Update collection statistics"""
-        self.unique_fish_caught = sum(
-            1 for fish_data in self.caught_fish.values()
-            if fish_data['normal'] > 0 or fish_data['shiny'] > 0
-        )
+        self.total_catches += count
 
     def has_caught(self, fish_id, shiny=False):
         """Check if a specific fish has been caught"""
-        if fish_id not in self.caught_fish:
+        index = self.index.get(fish_id)
+        if index is None:
             return False
         if shiny:
-            return self.caught_fish[fish_id]['shiny'] > 0
-        return self.caught_fish[fish_id]['normal'] > 0
+            return bool(self.shiny_bits >> index & 1)
+        return bool(self.normal_bits >> index & 1)
+
+    def is_complete(self):
+        """Check if both the normal and shiny form of every species has been caught"""
+        every_species = (1 << len(self.species)) - 1
+        return (self.normal_bits & self.shiny_bits) == every_species
 
     def get_catch_count(self, fish_id, shiny=False):
         """Get the number of times a fish has been caught"""
-        if fish_id not in self.caught_fish:
+        index = self.index.get(fish_id)
+        if index is None:
             return 0
-        return self.caught_fish[fish_id]['shiny' if shiny else 'normal']
+        return int((self.shiny_counts if shiny else self.normal_counts)[index])
 
     def get_completion_percentage(self):
         """Get overall collection completion percentage"""
@@ -61,43 +109,38 @@ class Collection:
     def get_shiny_completion_percentage(self):
         """Get shiny collection completion percentage"""
         total_fish = len(FISH_DATABASE)
-        shiny_caught = sum(
-            1 for fish_data in self.caught_fish.values()
-            if fish_data['shiny'] > 0
-        )
-        return (shiny_caught / total_fish * 100) if total_fish > 0 else 0
+        return (self.unique_shiny_caught / total_fish * 100) if total_fish > 0 else 0
 
     def get_rarity_stats(self):
         """Get statistics by rarity tier"""
-        rarity_stats = {
-            "common": {"caught": 0, "total": 0},
-            "uncommon": {"caught": 0, "total": 0},
-            "rare": {"caught": 0, "total": 0},
-            "epic": {"caught": 0, "total": 0},
-            "legendary": {"caught": 0, "total": 0},
-            "mythic": {"caught": 0, "total": 0}
+        return {
+            rarity: {"caught": self.rarity_caught[rarity], "total": self.rarity_totals[rarity]}
+            for rarity in self.rarity_totals
         }
 
-        for fish_id, fish_data in FISH_DATABASE.items():
-            rarity = fish_data['rarity']
-            rarity_stats[rarity]['total'] += 1
-
-            if self.has_caught(fish_id):
-                rarity_stats[rarity]['caught'] += 1
-
-        return rarity_stats
+    def get_caught_counts(self):
+        """Get a snapshot of the counts as fish_id -> {'normal': count, 'shiny': count}"""
+        # Built from the count arrays on each call - record catches with add_catch()
+        return {
+            fish_id: {'normal': normal, 'shiny': shiny}
+            for fish_id, normal, shiny in zip(self.species, self.normal_counts.tolist(),
+                                              self.shiny_counts.tolist())
+        }
 
 
 class CollectionUI:
     """UI for displaying the Pokedex-style collection"""
 
     def __init__(self):
-        self.font = pygame.font.Font(None, 24)
-        self.title_font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = get_font(scaled(24))
+        self.title_font = get_font(scaled(36))
+        self.small_font = get_font(scaled(18))
         self.scroll_offset = 0
         self.selected_fish = None
 
+        # Regions changed since last frame (dirty-rect rendering)
+        self.dirty = DirtyTracker()
+
         # Rarity colors
         self.rarity_colors = {
             "common": (200, 200, 200),      # Gray
@@ -111,60 +154,58 @@ class CollectionUI:
     def draw_box(self, screen, x, y, width, height, color=(139, 69, 19)):
         """Draw a styled box"""
         # Shadow
-        pygame.draw.rect(screen, (0, 0, 0, 50), (x + 3, y + 3, width, height))
+        pygame.draw.rect(screen, (0, 0, 0), (x + scaled(3), y + scaled(3), width, height))
         # Background
         pygame.draw.rect(screen, color, (x, y, width, height))
         # Border
         pygame.draw.rect(screen, (101, 67, 33), (x, y, width, height), 3)
         # Inner highlight
-        pygame.draw.rect(screen, (205, 133, 63), (x + 3, y + 3, width - 6, height - 6), 1)
+        pygame.draw.rect(screen, (205, 133, 63), (x + scaled(3), y + scaled(3), width - scaled(6), height - scaled(6)), 1)
 
     def draw(self, screen, collection, screen_width, screen_height):
         """Draw the collection UI (Pokedex view)"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(200)
-        overlay.fill((20, 20, 20))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((screen_width, screen_height), (20, 20, 20, 200)), (0, 0))
+        self.dirty.add((0, 0, screen_width, screen_height), ('collection', collection.total_catches))
 
         # Main collection box
-        box_width = 700
-        box_height = 500
+        box_width = scaled(700)
+        box_height = scaled(500)
         box_x = screen_width // 2 - box_width // 2
         box_y = screen_height // 2 - box_height // 2
 
         self.draw_box(screen, box_x, box_y, box_width, box_height, (50, 30, 20))
 
         # Title
-        title_text = self.title_font.render("Fish Collection", True, (255, 215, 0))
-        title_rect = title_text.get_rect(center=(box_x + box_width // 2, box_y + 25))
+        title_text = render_text(self.title_font, "Fish Collection", (255, 215, 0))
+        title_rect = title_text.get_rect(center=(box_x + box_width // 2, box_y + scaled(25)))
         screen.blit(title_text, title_rect)
 
         # Stats header
-        stats_y = box_y + 55
+        stats_y = box_y + scaled(55)
         completion = collection.get_completion_percentage()
-        stats_text = self.font.render(
-            f"Caught: {collection.unique_fish_caught}/{len(FISH_DATABASE)} ({completion:.1f}%)",
-            True, (144, 238, 144)
+        stats_text = render_text(
+            self.font, f"Caught: {collection.unique_fish_caught}/{len(FISH_DATABASE)} ({completion:.1f}%)",
+            (144, 238, 144)
         )
-        screen.blit(stats_text, (box_x + 20, stats_y))
+        screen.blit(stats_text, (box_x + scaled(20), stats_y))
 
         # Shiny stats
         shiny_completion = collection.get_shiny_completion_percentage()
-        shiny_text = self.font.render(
-            f"Shinies: {shiny_completion:.1f}% | Total catches: {collection.total_catches}",
-            True, (255, 215, 180)
+        shiny_text = render_text(
+            self.font, f"Shinies: {shiny_completion:.1f}% | Total catches: {collection.total_catches}",
+            (255, 215, 180)
         )
-        screen.blit(shiny_text, (box_x + 20, stats_y + 25))
+        screen.blit(shiny_text, (box_x + scaled(20), stats_y + scaled(25)))
 
         # Divider line
         pygame.draw.line(screen, (255, 215, 0),
-                        (box_x + 20, stats_y + 50),
-                        (box_x + box_width - 20, stats_y + 50), 2)
+                        (box_x + scaled(20), stats_y + scaled(50)),
+                        (box_x + box_width - scaled(20), stats_y + scaled(50)), 2)
 
         # Fish list (grid layout)
-        list_y = stats_y + 65
-        list_height = box_height - 140
+        list_y = stats_y + scaled(65)
+        list_height = box_height - scaled(140)
 
         # Sort fish by rarity and name
         sorted_fish = sorted(
@@ -176,8 +217,8 @@ class CollectionUI:
         )
 
         # Draw fish entries in a grid
-        col_width = (box_width - 60) // 2
-        row_height = 60
+        col_width = (box_width - scaled(60)) // 2
+        row_height = scaled(60)
         current_y = list_y
         current_col = 0
 
@@ -185,7 +226,7 @@ class CollectionUI:
             if current_y > list_y + list_height - row_height:
                 break
 
-            x_pos = box_x + 20 + (current_col * (col_width + 20))
+            x_pos = box_x + scaled(20) + (current_col * (col_width + scaled(20)))
             y_pos = current_y
 
             # Check if caught
@@ -195,16 +236,16 @@ class CollectionUI:
 
             # Entry background
             entry_color = (40, 40, 40) if is_caught else (20, 20, 20)
-            pygame.draw.rect(screen, entry_color, (x_pos, y_pos, col_width, row_height - 5))
+            pygame.draw.rect(screen, entry_color, (x_pos, y_pos, col_width, row_height - scaled(5)))
 
             # Rarity border
             rarity_color = self.rarity_colors.get(fish_data['rarity'], (255, 255, 255))
-            pygame.draw.rect(screen, rarity_color, (x_pos, y_pos, col_width, row_height - 5), 2)
+            pygame.draw.rect(screen, rarity_color, (x_pos, y_pos, col_width, row_height - scaled(5)), 2)
 
             if is_caught:
                 # Fish name
-                name_text = self.font.render(fish_data['name'], True, rarity_color)
-                screen.blit(name_text, (x_pos + 5, y_pos + 5))
+                name_text = render_text(self.font, fish_data['name'], rarity_color)
+                screen.blit(name_text, (x_pos + scaled(5), y_pos + scaled(5)))
 
                 # Catch counts
                 normal_count = collection.get_catch_count(fish_id, shiny=False)
@@ -214,20 +255,24 @@ class CollectionUI:
                 if shiny_count > 0:
                     count_str += f" ✨×{shiny_count}"
 
-                count_text = self.small_font.render(count_str, True, (200, 200, 200))
-                screen.blit(count_text, (x_pos + 5, y_pos + 30))
+                count_text = render_text(self.small_font, count_str, (200, 200, 200))
+                screen.blit(count_text, (x_pos + scaled(5), y_pos + scaled(30)))
 
                 # Points value
-                points_text = self.small_font.render(f"{fish_data['points']} gold", True, (255, 215, 0))
-                screen.blit(points_text, (x_pos + col_width - 70, y_pos + 30))
+                points_text = render_text(self.small_font, f"{fish_data['points']} gold", (255, 215, 0))
+                screen.blit(points_text, (x_pos + col_width - scaled(70), y_pos + scaled(30)))
+
+                # Fish icon from the shared atlas (shiny variant if only a shiny was caught)
+                icon = fish_atlas.get(fish_id, not has_normal, 'icon')
+                screen.blit(icon, icon.get_rect(center=(x_pos + col_width - scaled(45), y_pos + scaled(17))))
             else:
                 # Show ??? for uncaught fish
-                mystery_text = self.font.render("???", True, (100, 100, 100))
-                screen.blit(mystery_text, (x_pos + 5, y_pos + 5))
+                mystery_text = render_text(self.font, "???", (100, 100, 100))
+                screen.blit(mystery_text, (x_pos + scaled(5), y_pos + scaled(5)))
 
                 # Show rarity hint
-                rarity_text = self.small_font.render(fish_data['rarity'].upper(), True, rarity_color)
-                screen.blit(rarity_text, (x_pos + 5, y_pos + 30))
+                rarity_text = render_text(self.small_font, fish_data['rarity'].upper(), rarity_color)
+                screen.blit(rarity_text, (x_pos + scaled(5), y_pos + scaled(30)))
 
             # Move to next position
             current_col += 1
@@ -236,31 +281,31 @@ class CollectionUI:
                 current_y += row_height
 
         # Rarity breakdown at bottom
-        breakdown_y = box_y + box_height - 60
+        breakdown_y = box_y + box_height - scaled(60)
         pygame.draw.line(screen, (255, 215, 0),
-                        (box_x + 20, breakdown_y - 10),
-                        (box_x + box_width - 20, breakdown_y - 10), 2)
+                        (box_x + scaled(20), breakdown_y - scaled(10)),
+                        (box_x + box_width - scaled(20), breakdown_y - scaled(10)), 2)
 
-        breakdown_text = self.small_font.render("Rarity Breakdown:", True, (255, 215, 0))
-        screen.blit(breakdown_text, (box_x + 20, breakdown_y))
+        breakdown_text = render_text(self.small_font, "Rarity Breakdown:", (255, 215, 0))
+        screen.blit(breakdown_text, (box_x + scaled(20), breakdown_y))
 
         rarity_stats = collection.get_rarity_stats()
-        rarity_x = box_x + 20
-        rarity_y = breakdown_y + 20
+        rarity_x = box_x + scaled(20)
+        rarity_y = breakdown_y + scaled(20)
 
         for rarity, stats in rarity_stats.items():
             color = self.rarity_colors.get(rarity, (255, 255, 255))
-            rarity_label = self.small_font.render(
-                f"{rarity.upper()}: {stats['caught']}/{stats['total']}",
-                True, color
+            rarity_label = render_text(
+                self.small_font, f"{rarity.upper()}: {stats['caught']}/{stats['total']}",
+                color
             )
             screen.blit(rarity_label, (rarity_x, rarity_y))
-            rarity_x += 110
+            rarity_x += scaled(110)
 
         # Instructions
-        instruction_text = self.small_font.render(
-            "Press C to close collection | ESC to return to menu",
-            True, (180, 180, 180)
+        instruction_text = render_text(
+            self.small_font, "Press C to close collection | ESC to return to menu",
+            (180, 180, 180)
         )
-        inst_rect = instruction_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - 15))
+        inst_rect = instruction_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - scaled(15)))
         screen.blit(instruction_text, inst_rect)
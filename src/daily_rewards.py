@@ -2,12 +2,17 @@ import pygame
 import json
 import os
 from datetime import datetime, timedelta
+from render import DirtyTracker
+from game_clock import game_clock
+from utils import scaled, get_overlay
+from fonts import get_font, render_text
 
 
 class DailyRewards:
     """Daily login rewards and streak system"""
 
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock or game_clock
         self.save_file = "daily_rewards.json"
         self.current_streak = 0
         self.longest_streak = 0
@@ -51,13 +56,13 @@ class DailyRewards:
 
     def check_daily_login(self):
         """Check if this is a new day and update streak"""
-        today = datetime.now().date()
+        today = self.clock.today()
 
         if self.last_login_date is None:
             # First time login
             self.current_streak = 1
             self.longest_streak = 1
-            self.last_login_date = datetime.now()
+            self.last_login_date = self.clock.now()
             self.total_logins = 1
             self.rewards_claimed_today = False
             self.calculate_daily_reward()
@@ -80,7 +85,7 @@ class DailyRewards:
             # Streak broken
             self.current_streak = 1
 
-        self.last_login_date = datetime.now()
+        self.last_login_date = self.clock.now()
         self.total_logins += 1
         self.rewards_claimed_today = False
         self.calculate_daily_reward()
@@ -130,29 +135,30 @@ class DailyRewardsUI:
     """UI for daily rewards"""
 
     def __init__(self):
-        self.font = pygame.font.Font(None, 24)
-        self.title_font = pygame.font.Font(None, 36)
-        self.large_font = pygame.font.Font(None, 48)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = get_font(scaled(24))
+        self.title_font = get_font(scaled(36))
+        self.large_font = get_font(scaled(48))
+        self.small_font = get_font(scaled(18))
+
+        # Regions changed since last frame (dirty-rect rendering)
+        self.dirty = DirtyTracker()
 
     def draw_box(self, screen, x, y, width, height, color=(80, 60, 40)):
         """Draw a styled box"""
-        pygame.draw.rect(screen, (0, 0, 0, 50), (x + 3, y + 3, width, height))
+        pygame.draw.rect(screen, (0, 0, 0), (x + scaled(3), y + scaled(3), width, height))
         pygame.draw.rect(screen, color, (x, y, width, height))
         pygame.draw.rect(screen, (101, 67, 33), (x, y, width, height), 3)
-        pygame.draw.rect(screen, (205, 133, 63), (x + 3, y + 3, width - 6, height - 6), 1)
+        pygame.draw.rect(screen, (205, 133, 63), (x + scaled(3), y + scaled(3), width - scaled(6), height - scaled(6)), 1)
 
     def draw_daily_reward_popup(self, screen, daily_rewards, screen_width, screen_height):
         """Draw daily reward claim popup"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(220)
-        overlay.fill((10, 10, 30))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((screen_width, screen_height), (10, 10, 30, 220)), (0, 0))
+        self.dirty.add((0, 0, screen_width, screen_height), ('daily_reward', daily_rewards.current_streak))
 
         # Popup box
-        box_width = 500
-        box_height = 400
+        box_width = scaled(500)
+        box_height = scaled(400)
         box_x = screen_width // 2 - box_width // 2
         box_y = screen_height // 2 - box_height // 2
 
@@ -160,64 +166,66 @@ class DailyRewardsUI:
         import math
         pulse = abs(math.sin(pygame.time.get_ticks() / 200))
         glow_color = (int(255 * pulse), int(215 * pulse), 0)
+        glow_step = max(1, scaled(4))
+        self.dirty.add((box_x - 4 * glow_step, box_y - 4 * glow_step, box_width + 8 * glow_step, box_height + 8 * glow_step), glow_color)
 
         for i in range(5):
-            alpha_surface = pygame.Surface((box_width + i*8, box_height + i*8), pygame.SRCALPHA)
+            alpha_surface = pygame.Surface((box_width + i*2*glow_step, box_height + i*2*glow_step), pygame.SRCALPHA)
             alpha_value = 100 - (i * 20)
             pygame.draw.rect(alpha_surface, (*glow_color, alpha_value),
-                           (0, 0, box_width + i*8, box_height + i*8))
-            screen.blit(alpha_surface, (box_x - i*4, box_y - i*4))
+                           (0, 0, box_width + i*2*glow_step, box_height + i*2*glow_step))
+            screen.blit(alpha_surface, (box_x - i*glow_step, box_y - i*glow_step))
 
         self.draw_box(screen, box_x, box_y, box_width, box_height, (40, 20, 60))
 
         # Title
-        title_text = self.large_font.render("Daily Reward!", True, (255, 215, 0))
-        title_rect = title_text.get_rect(center=(box_x + box_width // 2, box_y + 40))
+        title_text = render_text(self.large_font, "Daily Reward!", (255, 215, 0))
+        title_rect = title_text.get_rect(center=(box_x + box_width // 2, box_y + scaled(40)))
         screen.blit(title_text, title_rect)
 
         # Streak info
-        streak_text = self.title_font.render(
-            f"🔥 {daily_rewards.current_streak} Day Streak!",
-            True, (255, 140, 0)
+        streak_text = render_text(
+            self.title_font, f"🔥 {daily_rewards.current_streak} Day Streak!",
+            (255, 140, 0)
         )
-        streak_rect = streak_text.get_rect(center=(box_x + box_width // 2, box_y + 90))
+        streak_rect = streak_text.get_rect(center=(box_x + box_width // 2, box_y + scaled(90)))
         screen.blit(streak_text, streak_rect)
 
         # Best streak
         if daily_rewards.longest_streak > daily_rewards.current_streak:
-            best_text = self.small_font.render(
-                f"Best: {daily_rewards.longest_streak} days",
-                True, (180, 180, 180)
+            best_text = render_text(
+                self.small_font, f"Best: {daily_rewards.longest_streak} days",
+                (180, 180, 180)
             )
-            best_rect = best_text.get_rect(center=(box_x + box_width // 2, box_y + 115))
+            best_rect = best_text.get_rect(center=(box_x + box_width // 2, box_y + scaled(115)))
             screen.blit(best_text, best_rect)
 
         # Reward amounts
-        reward_y = box_y + 160
+        reward_y = box_y + scaled(160)
 
         # Gold reward
-        gold_icon = self.large_font.render("💰", True, (255, 255, 255))
-        screen.blit(gold_icon, (box_x + 100, reward_y))
+        gold_icon = render_text(self.large_font, "💰", (255, 255, 255))
+        screen.blit(gold_icon, (box_x + scaled(100), reward_y))
 
-        gold_text = self.title_font.render(
-            f"+{daily_rewards.today_reward_gold} Gold",
-            True, (255, 215, 0)
+        gold_text = render_text(
+            self.title_font, f"+{daily_rewards.today_reward_gold} Gold",
+            (255, 215, 0)
         )
-        screen.blit(gold_text, (box_x + 150, reward_y + 10))
+        screen.blit(gold_text, (box_x + scaled(150), reward_y + scaled(10)))
 
         # EXP reward
-        exp_y = reward_y + 60
-        exp_icon = self.large_font.render("⭐", True, (255, 255, 255))
-        screen.blit(exp_icon, (box_x + 100, exp_y))
+        exp_y = reward_y + scaled(60)
+        exp_icon = render_text(self.large_font, "⭐", (255, 255, 255))
+        screen.blit(exp_icon, (box_x + scaled(100), exp_y))
 
-        exp_text = self.title_font.render(
-            f"+{daily_rewards.today_reward_exp} EXP",
-            True, (144, 238, 144)
+        exp_text = render_text(
+            self.title_font, f"+{daily_rewards.today_reward_exp} EXP",
+            (144, 238, 144)
         )
-        screen.blit(exp_text, (box_x + 150, exp_y + 10))
+        screen.blit(exp_text, (box_x + scaled(150), exp_y + scaled(10)))
 
         # Milestone bonus indicator
-        milestone_y = box_y + 290
+        milestone_y = box_y + scaled(290)
         milestone_text = ""
         if daily_rewards.current_streak == 7:
             milestone_text = "🎉 7-Day Milestone Bonus! 🎉"
@@ -227,43 +235,44 @@ class DailyRewardsUI:
             milestone_text = "👑 100-Day LEGENDARY Bonus! 👑"
 
         if milestone_text:
-            milestone = self.font.render(milestone_text, True, (255, 100, 255))
+            milestone = render_text(self.font, milestone_text, (255, 100, 255))
             milestone_rect = milestone.get_rect(center=(box_x + box_width // 2, milestone_y))
             screen.blit(milestone, milestone_rect)
 
         # Instructions
-        inst_text = self.font.render(
-            "Press ENTER to claim!",
-            True, (255, 255, 100)
+        inst_text = render_text(
+            self.font, "Press ENTER to claim!",
+            (255, 255, 100)
         )
-        inst_rect = inst_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - 40))
+        inst_rect = inst_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - scaled(40)))
         screen.blit(inst_text, inst_rect)
 
         # Daily tip
-        tip_text = self.small_font.render(
-            "Come back daily to maintain your streak!",
-            True, (180, 180, 180)
+        tip_text = render_text(
+            self.small_font, "Come back daily to maintain your streak!",
+            (180, 180, 180)
         )
-        tip_rect = tip_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - 15))
+        tip_rect = tip_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - scaled(15)))
         screen.blit(tip_text, tip_rect)
 
     def draw_streak_indicator(self, screen, daily_rewards, screen_width):
         """Draw small streak indicator in corner"""
         if daily_rewards.current_streak > 0:
             # Small box in top right
-            box_width = 120
-            box_height = 40
-            box_x = screen_width - box_width - 10
-            box_y = 10
+            box_width = scaled(120)
+            box_height = scaled(40)
+            box_x = screen_width - box_width - scaled(10)
+            box_y = scaled(10)
+            self.dirty.add((box_x, box_y, box_width, box_height), daily_rewards.current_streak)
 
             # Background
             pygame.draw.rect(screen, (40, 30, 20), (box_x, box_y, box_width, box_height))
             pygame.draw.rect(screen, (101, 67, 33), (box_x, box_y, box_width, box_height), 2)
 
             # Streak text
-            streak_text = self.font.render(
-                f"🔥 {daily_rewards.current_streak}",
-                True, (255, 140, 0)
+            streak_text = render_text(
+                self.font, f"🔥 {daily_rewards.current_streak}",
+                (255, 140, 0)
             )
             streak_rect = streak_text.get_rect(center=(box_x + box_width // 2, box_y + box_height // 2))
             screen.blit(streak_text, streak_rect)
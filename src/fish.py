@@ -1,6 +1,12 @@
 import pygame
 import random
-from settings import SCREEN_WIDTH
+import numpy as np
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from game_clock import game_clock
+from settings import LAYOUT_SCALE, FISH_ATLAS_WIDTH, FISH_ICON_HEIGHT, LOOT_TABLE_CACHE_SIZE
 
 # Comprehensive fish database with Pokemon-style rarity tiers
 # Each fish has normal and shiny variants (1/100 chance for shiny)
@@ -296,69 +302,381 @@ RARITY_WEIGHTS = {
 
 SHINY_CHANCE = 0.01  # 1% chance for shiny (1/100)
 
-class Fish(pygame.sprite.Sprite):
-    def __init__(self, x, y, fish_id=None, force_shiny=False):
-        super().__init__()
+# The database is read-only: species indices (catch records, the collection and the
+# sampler tables) are fixed at import, so species can't be added or edited afterwards
+FISH_DATABASE = MappingProxyType({fish_id: MappingProxyType(properties)
+                                  for fish_id, properties in FISH_DATABASE.items()})
+
+# Species order for compact catch records
+FISH_IDS = tuple(FISH_DATABASE)
+FISH_INDEX = {fish_id: index for index, fish_id in enumerate(FISH_IDS)}
+
+# Rarity tier display colors
+RARITY_COLORS = {
+    "common": (200, 200, 200),      # Gray
+    "uncommon": (30, 255, 0),       # Green
+    "rare": (0, 112, 221),          # Blue
+    "epic": (163, 53, 238),         # Purple
+    "legendary": (255, 128, 0),     # Orange
+    "mythic": (255, 40, 40)         # Red
+}
 
-        # Select fish by rarity if not specified
-        if fish_id is None:
-            fish_id = self.select_random_fish()
 
-        self.fish_id = fish_id
-        self.properties = FISH_DATABASE[fish_id]
+def build_alias_table(probabilities):
+    """Build Vose alias tables: column i yields i with keep[i], otherwise alias[i]"""
+    count = len(probabilities)
+    scaled_probs = [p * count for p in probabilities]
+    keep = [1.0] * count
+    alias = list(range(count))
+    small = [i for i, p in enumerate(scaled_probs) if p < 1.0]
+    large = [i for i, p in enumerate(scaled_probs) if p >= 1.0]
+
+    # Pair each under-full column with an over-full one that tops it up
+    while small and large:
+        less, more = small.pop(), large.pop()
+        keep[less] = scaled_probs[less]
+        alias[less] = more
+        scaled_probs[more] += scaled_probs[less] - 1.0
+        (small if scaled_probs[more] < 1.0 else large).append(more)
+
+    # Whatever is left is full up to rounding and keeps keep = 1.0
+    return keep, alias
+
+
+class FishSampler:
+    """Draws species by rarity weight in O(1) from tables precomputed from the fish database"""
+
+    def __init__(self, rarity_weights=None, species_weights=None):
+        self.rarity_weights = rarity_weights  # None follows RARITY_WEIGHTS
+        self.species_weights = species_weights or {}  # fish_id -> extra weight multiplier
+        self.signature = None  # Weights the tables were built from
+        self.fish_ids = FISH_IDS  # Species index -> fish_id
+        self.species_by_rarity = {}  # rarity -> tuple of species indices
+        self.probabilities = np.zeros(0)  # Species index -> chance of being drawn
+        self.keep = []  # Alias table (lists for single draws, arrays for batches)
+        self.alias = []
+        self.keep_array = np.zeros(0)
+        self.alias_array = np.zeros(0, dtype=np.int64)
+        self.rebuilds = 0
+        self.rng = np.random.default_rng()
+
+    def get_weights(self):
+        """Get the rarity weights this sampler draws with"""
+        return RARITY_WEIGHTS if self.rarity_weights is None else self.rarity_weights
+
+    def get_signature(self):
+        """Get a cheap fingerprint of the rarity and species weights"""
+        return tuple(self.get_weights().items()), tuple(self.species_weights.items())
+
+    def build(self):
+        """Rebuild the per-rarity species tables and the alias table"""
+        weights = self.get_weights()
+        species_by_rarity = {}
+        for index, fish_id in enumerate(self.fish_ids):
+            species_by_rarity.setdefault(FISH_DATABASE[fish_id]["rarity"], []).append(index)
+        self.species_by_rarity = {rarity: tuple(indices) for rarity, indices in species_by_rarity.items()}
+
+        # A rarity's weight is shared evenly by its species; empty tiers drop out
+        probabilities = np.zeros(len(self.fish_ids))
+        for rarity, indices in species_by_rarity.items():
+            probabilities[indices] = weights.get(rarity, 0) / len(indices)
+        for fish_id, multiplier in self.species_weights.items():
+            if fish_id in FISH_INDEX:
+                probabilities[FISH_INDEX[fish_id]] *= multiplier
+        total = probabilities.sum()
+        if total > 0:
+            probabilities /= total
+        else:
+            probabilities[:] = 1 / max(1, len(probabilities))
+        self.probabilities = probabilities
+
+        self.keep, self.alias = build_alias_table(probabilities.tolist())
+        self.keep_array = np.array(self.keep)
+        self.alias_array = np.array(self.alias, dtype=np.int64)
+        self.signature = self.get_signature()
+        self.rebuilds += 1
+
+    def invalidate(self):
+        """Force a rebuild on the next draw (e.g. after editing the weights in place)"""
+        self.signature = None
+
+    def refresh(self):
+        """Rebuild the tables if the weights changed"""
+        if self.signature != self.get_signature():
+            self.build()
+
+    def sample(self, rarity=None):
+        """Draw one fish_id (optionally only from the given rarity tier)"""
+        self.refresh()
+        if rarity is not None:
+            return self.fish_ids[random.choice(self.species_by_rarity[rarity])]
+        column = int(random.random() * len(self.fish_ids))
+        if random.random() >= self.keep[column]:
+            column = self.alias[column]
+        return self.fish_ids[column]
+
+    def sample_batch(self, count):
+        """Draw count species at once as an array of indices into fish_ids"""
+        self.refresh()
+        columns = self.rng.integers(0, len(self.fish_ids), count)
+        kept = self.rng.random(count) < self.keep_array[columns]
+        return np.where(kept, columns, self.alias_array[columns])
+
+    def get_stats(self):
+        """Get the table sizes and how often they were rebuilt"""
+        return {
+            'species': len(self.fish_ids),
+            'rarities': {rarity: len(indices) for rarity, indices in self.species_by_rarity.items()},
+            'rebuilds': self.rebuilds
+        }
 
-        # Determine if this fish is shiny (1/100 chance)
-        self.is_shiny = force_shiny or (random.random() < SHINY_CHANCE)
 
-        # Set colors based on shiny status
-        if self.is_shiny:
-            self.body_color = self.properties["shiny_body"]
-            self.accent_color = self.properties["shiny_accent"]
-            self.belly_color = self.properties["shiny_belly"]
-        else:
-            self.body_color = self.properties["body_color"]
-            self.accent_color = self.properties["accent_color"]
-            self.belly_color = self.properties["belly_color"]
-
-        # Create fish sprite with pixel art
-        size = self.properties["size"]
-        self.image = pygame.Surface(size, pygame.SRCALPHA)
-        self.draw_fish()
-        self.rect = self.image.get_rect(center=(x, y))
-        self.points = self.properties["points"]
-
-        # Apply shiny bonus (2x points for shiny)
-        if self.is_shiny:
-            self.points *= 2
+# Shared sampler behind every random catch
+fish_sampler = FishSampler()
+
+
+def select_random_fish():
+    """Select a random fish based on rarity weights"""
+    return fish_sampler.sample()
+
+
+def get_loot_weights(rarity_mult=1.0, mythic_boost=0.0, rarity_boost=0.0):
+    """Get the rarity weights with environment and rod bonuses applied"""
+    # Everything above common is scaled up; the mythic boost is extra flat chance
+    multiplier = rarity_mult * (1 + rarity_boost)
+    weights = {rarity: weight if rarity == "common" else weight * multiplier
+               for rarity, weight in RARITY_WEIGHTS.items()}
+    weights["mythic"] = weights.get("mythic", 0) + mythic_boost
+    return weights
+
+
+class LootTables:
+    """Catch distributions per environment/rod state, built once and reused until the state changes"""
+
+    def __init__(self, max_entries=LOOT_TABLE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.tables = OrderedDict()  # (rarity_mult, mythic_boost, void_boost, rarity_boost) -> FishSampler
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_table(self, rarity_mult=1.0, mythic_boost=0.0, void_boost=1.0, rarity_boost=0.0):
+        """Get the sampler for a set of multipliers, building it only on a miss"""
+        key = (rarity_mult, mythic_boost, void_boost, rarity_boost)
+        table = self.tables.get(key)
+        if table is not None:
+            self.tables.move_to_end(key)
+            self.hits += 1
+            return table
+
+        self.misses += 1
+        # The new moon draws void fish out of the deep
+        species_weights = {"void_fish": void_boost} if void_boost != 1.0 else None
+        table = FishSampler(get_loot_weights(rarity_mult, mythic_boost, rarity_boost), species_weights)
+        table.build()
+        self.tables[key] = table
+        if len(self.tables) > self.max_entries:
+            self.tables.popitem(last=False)  # Least recently used
+            self.evictions += 1
+        return table
+
+    def get_table_for(self, environment, rod=None):
+        """Get the sampler for an EnvironmentSnapshot and the equipped rod"""
+        return self.get_table(environment.rarity_mult, environment.mythic_boost,
+                              environment.void_boost, rod.rarity_boost if rod else 0.0)
+
+    def clear(self):
+        """Drop every cached distribution"""
+        self.tables.clear()
+
+    def get_stats(self):
+        """Get cache size and hit/miss counts"""
+        return {
+            'tables': len(self.tables),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+
+# Shared loot tables used for catches (and by headless simulations)
+loot_tables = LootTables()
+
+
+# Sprite variants packed into the fish atlas
+FISH_ATLAS_VARIANTS = ('full', 'icon')
+
+
+def draw_fish(s, properties, is_shiny=False):
+    """Draw a cute pixel art style fish filling surface s (at the database size)"""
+    w, h = properties["size"]
+
+    # Shiny fish use their alternate palette
+    if is_shiny:
+        body_color = properties["shiny_body"]
+        accent_color = properties["shiny_accent"]
+        belly_color = properties["shiny_belly"]
+    else:
+        body_color = properties["body_color"]
+        accent_color = properties["accent_color"]
+        belly_color = properties["belly_color"]
+
+    # Body (main oval)
+    pygame.draw.ellipse(s, body_color, [w//4, h//4, w//2, h//2])
+
+    # Tail
+    tail_points = [(w//4 + 2, h//2), (2, h//4), (2, 3*h//4)]
+    pygame.draw.polygon(s, accent_color, tail_points)
+
+    # Fins
+    # Top fin
+    top_fin = [(w//2, h//4), (w//2 + 4, h//8), (w//2 + 8, h//4)]
+    pygame.draw.polygon(s, accent_color, top_fin)
+
+    # Bottom fin
+    bottom_fin = [(w//2, 3*h//4), (w//2 + 4, 7*h//8), (w//2 + 8, 3*h//4)]
+    pygame.draw.polygon(s, accent_color, bottom_fin)
+
+    # Belly highlight
+    pygame.draw.ellipse(s, belly_color, [w//3, h//2 - 2, w//3, h//4])
+
+    # Eye
+    eye_x, eye_y = w - w//4, h//3
+    pygame.draw.circle(s, (255, 255, 255), (eye_x, eye_y), 4)
+    pygame.draw.circle(s, (0, 0, 0), (eye_x + 1, eye_y), 2)
+
+    # Sparkle effect for shiny fish
+    if is_shiny:
+        pygame.draw.circle(s, (255, 255, 255), (w//6, h//6), 2)
+        pygame.draw.circle(s, (255, 255, 255), (w - w//6, h - h//6), 2)
+
+    # Scales pattern
+    for i in range(3):
+        scale_x = w//3 + i * 6
+        pygame.draw.circle(s, accent_color, (scale_x, h//2), 2, 1)
+
+
+class FishAtlas:
+    """Every species in normal and shiny variants, drawn once and packed into one surface"""
+
+    def __init__(self, width=FISH_ATLAS_WIDTH, icon_height=FISH_ICON_HEIGHT):
+        self.width = width
+        self.icon_height = icon_height
+        self.surface = None  # Built lazily (or on a worker thread at startup)
+        self.regions = {}  # (fish_id, is_shiny, variant) -> Rect in the atlas
+        self.sprites = {}  # Subsurfaces already handed out
+        self.converted = False
+        self.build_time = 0.0
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def get_sprite_size(self, properties, variant):
+        """Get a fish's size in the atlas ('full' = game size, 'icon' = list icon)"""
+        w, h = properties["size"]
+        if variant == 'icon':
+            return (max(1, round(w * self.icon_height / h)), self.icon_height)
+        return (max(1, round(w * LAYOUT_SCALE)), max(1, round(h * LAYOUT_SCALE)))
+
+    def build(self):
+        """Draw every fish into the atlas (waits for a background build in progress)"""
+        with self.lock:
+            if self.surface is not None:
+                return
+            start = time.perf_counter()
+
+            images = []
+            for fish_id, properties in FISH_DATABASE.items():
+                for is_shiny in (False, True):
+                    base = pygame.Surface(properties["size"], pygame.SRCALPHA)
+                    draw_fish(base, properties, is_shiny)
+                    for variant in FISH_ATLAS_VARIANTS:
+                        size = self.get_sprite_size(properties, variant)
+                        image = base if size == base.get_size() else pygame.transform.smoothscale(base, size)
+                        images.append(((fish_id, is_shiny, variant), image))
+
+            # Shelf packing: left to right, starting a new row when one fills up
+            regions = {}
+            x = y = shelf_height = 0
+            for key, image in images:
+                w, h = image.get_size()
+                if x + w > self.width:
+                    x, y, shelf_height = 0, y + shelf_height, 0
+                regions[key] = pygame.Rect(x, y, w, h)
+                x += w + 1
+                shelf_height = max(shelf_height, h + 1)
+
+            surface = pygame.Surface((self.width, y + shelf_height), pygame.SRCALPHA)
+            for key, image in images:
+                surface.blit(image, regions[key])
+
+            self.regions = regions
+            self.surface = surface
+            self.build_time = time.perf_counter() - start
+
+    def start_background_build(self):
+        """Build the atlas on a worker thread so the first catch doesn't wait for it"""
+        if self.surface is None and self.thread is None:
+            self.thread = threading.Thread(target=self.build, daemon=True)
+            self.thread.start()
+
+    def get(self, fish_id, is_shiny=False, variant='full'):
+        """Get a fish sprite as a region of the atlas"""
+        key = (fish_id, is_shiny, variant)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            self.build()
+            if not self.converted and pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert_alpha()  # On the main thread, once
+                self.converted = True
+            sprite = self.surface.subsurface(self.regions[key])
+            self.sprites[key] = sprite
+        return sprite
+
+    def get_stats(self):
+        """Get the atlas size, region count and build time"""
+        return {
+            'built': self.surface is not None,
+            'size': self.surface.get_size() if self.surface else (0, 0),
+            'regions': len(self.regions),
+            'build_time_ms': self.build_time * 1000
+        }
 
-        self.name = self.properties["name"]
-        self.rarity = self.properties["rarity"]
-        self.description = self.properties["description"]
-        self.habitat = self.properties["habitat"]
 
-        # Add some vertical movement (not used in Pokemon-style but kept for compatibility)
-        self.vertical_speed = random.uniform(-0.3, 0.3)
-        self.tail_bob = 0  # For tail animation
+# Shared atlas used by catches, the collection and catch notifications
+fish_atlas = FishAtlas()
 
-    def select_random_fish(self):
-        """Select a random fish based on rarity weights"""
-        # First, select rarity tier
-        rand = random.random()
-        cumulative = 0
-        selected_rarity = "common"
 
-        for rarity, weight in RARITY_WEIGHTS.items():
-            cumulative += weight
-            if rand <= cumulative:
-                selected_rarity = rarity
-                break
+class CatchRecord:
+    """Compact record of one catch; everything downstream of a catch uses these"""
+    __slots__ = ('species', 'is_shiny', 'points', 'timestamp', 'rod', 'environment')
 
-        # Get all fish of selected rarity
-        fish_of_rarity = [fish_id for fish_id, props in FISH_DATABASE.items()
-                         if props["rarity"] == selected_rarity]
+    def __init__(self, species, is_shiny, points, timestamp, rod=None, environment=None):
+        self.species = species  # Index into FISH_IDS
+        self.is_shiny = is_shiny
+        self.points = points
+        self.timestamp = timestamp
+        self.rod = rod  # Rod name
+        self.environment = environment  # (weather, time_of_day, moon_phase)
 
-        # Randomly select one
-        return random.choice(fish_of_rarity)
+    @property
+    def fish_id(self):
+        """Get the species key in FISH_DATABASE"""
+        return FISH_IDS[self.species]
+
+    @property
+    def properties(self):
+        """Get the species entry in FISH_DATABASE"""
+        return FISH_DATABASE[FISH_IDS[self.species]]
+
+    @property
+    def name(self):
+        """Get the species name"""
+        return self.properties["name"]
+
+    @property
+    def rarity(self):
+        """Get the rarity tier"""
+        return self.properties["rarity"]
 
     def get_display_name(self):
         """Get the display name with shiny indicator"""
@@ -368,77 +686,20 @@ class Fish(pygame.sprite.Sprite):
 
     def get_rarity_color(self):
         """Get color based on rarity tier"""
-        rarity_colors = {
-            "common": (200, 200, 200),      # Gray
-            "uncommon": (30, 255, 0),       # Green
-            "rare": (0, 112, 221),          # Blue
-            "epic": (163, 53, 238),         # Purple
-            "legendary": (255, 128, 0),     # Orange
-            "mythic": (255, 40, 40)         # Red
-        }
-        return rarity_colors.get(self.rarity, (255, 255, 255))
-
-    def draw_fish(self):
-        """Draw a cute pixel art style fish"""
-        w, h = self.properties["size"]
-        s = self.image
+        return RARITY_COLORS.get(self.rarity, (255, 255, 255))
 
-        # Use instance colors (accounts for shiny status)
-        body_color = self.body_color
-        accent_color = self.accent_color
-        belly_color = self.belly_color
 
-        # Body (main oval)
-        pygame.draw.ellipse(s, body_color, [w//4, h//4, w//2, h//2])
+def create_catch(fish_id=None, force_shiny=False, rod=None, environment=None):
+    """Roll a catch (random species by rarity unless given) as a CatchRecord"""
+    if fish_id is None:
+        fish_id = select_random_fish()
 
-        # Tail
-        tail_points = [(w//4 + 2, h//2), (2, h//4), (2, 3*h//4)]
-        pygame.draw.polygon(s, accent_color, tail_points)
+    # Determine if this fish is shiny (1/100 chance)
+    is_shiny = force_shiny or (random.random() < SHINY_CHANCE)
 
-        # Fins
-        # Top fin
-        top_fin = [(w//2, h//4), (w//2 + 4, h//8), (w//2 + 8, h//4)]
-        pygame.draw.polygon(s, accent_color, top_fin)
+    # Apply shiny bonus (2x points for shiny)
+    points = FISH_DATABASE[fish_id]["points"]
+    if is_shiny:
+        points *= 2
 
-        # Bottom fin
-        bottom_fin = [(w//2, 3*h//4), (w//2 + 4, 7*h//8), (w//2 + 8, 3*h//4)]
-        pygame.draw.polygon(s, accent_color, bottom_fin)
-
-        # Belly highlight
-        pygame.draw.ellipse(s, belly_color, [w//3, h//2 - 2, w//3, h//4])
-
-        # Eye
-        eye_x, eye_y = w - w//4, h//3
-        pygame.draw.circle(s, (255, 255, 255), (eye_x, eye_y), 4)
-        pygame.draw.circle(s, (0, 0, 0), (eye_x + 1, eye_y), 2)
-
-        # Sparkle effect for shiny fish
-        if self.is_shiny:
-            pygame.draw.circle(s, (255, 255, 255), (w//6, h//6), 2)
-            pygame.draw.circle(s, (255, 255, 255), (w - w//6, h - h//6), 2)
-
-        # Scales pattern
-        for i in range(3):
-            scale_x = w//3 + i * 6
-            pygame.draw.circle(s, accent_color, (scale_x, h//2), 2, 1)
-
-    def update(self):
-        self.rect.x -= self.speed  # Fish swims to the left
-        self.rect.y += self.vertical_speed  # Slight vertical movement
-
-        # Tail bobbing animation
-        self.tail_bob += 0.2
-
-        # Keep fish in vertical bounds
-        if self.rect.top < 60:
-            self.vertical_speed = abs(self.vertical_speed)
-        elif self.rect.bottom > 540:
-            self.vertical_speed = -abs(self.vertical_speed)
-
-        # Reset fish to the right if it exits the screen
-        if self.rect.right < 0:
-            self.rect.left = SCREEN_WIDTH + random.randint(50, 200)
-            self.rect.y = random.randint(100, 500)
-
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
+    return CatchRecord(FISH_INDEX[fish_id], is_shiny, points, game_clock.timestamp(), rod, environment)
@@ -0,0 +1,126 @@
+"""
+Shared font manager and rendered text cache: each (face, size) is loaded once
+and each (text, font, color, outline) is rasterized once while it stays in use
+"""
+import time
+from collections import OrderedDict
+import pygame
+from settings import TEXT_CACHE_SIZE
+
+
+class FontManager:
+    """Loads fonts lazily on first use and hands out shared instances"""
+
+    def __init__(self):
+        self.fonts = {}  # (face, size) -> pygame.font.Font
+        self.load_count = 0
+        self.load_time = 0.0
+
+    def get(self, size, face=None):
+        """Get the font for a face file (None = default font) at a pixel size"""
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            start = time.perf_counter()
+            font = pygame.font.Font(face, size)
+            self.load_time += time.perf_counter() - start
+            self.load_count += 1
+            self.fonts[key] = font
+        return font
+
+    def clear(self):
+        """Drop all loaded fonts (e.g. after a resolution change)"""
+        self.fonts.clear()
+
+    def get_stats(self):
+        """Get how many fonts were loaded and how long loading took (ms)"""
+        return {
+            'loaded': self.load_count,
+            'cached': len(self.fonts),
+            'load_time_ms': self.load_time * 1000
+        }
+
+
+class TextCache:
+    """Bounded LRU cache of rendered text surfaces (plain and outlined)"""
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()  # (text, font, color, outline_color, offsets) -> Surface
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, color, outline_color=None, outline_offsets=()):
+        """Get the rendered surface for a string, rasterizing it only on a miss"""
+        key = (text, font, tuple(color), outline_color and tuple(outline_color), tuple(outline_offsets))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if outline_color is not None and outline_offsets:
+            surface = self.build_outlined(font, text, color, outline_color, outline_offsets)
+        else:
+            surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)  # Least recently used
+            self.evictions += 1
+        return surface
+
+    def build_outlined(self, font, text, color, outline_color, outline_offsets):
+        """Composite the outline copies and the text into one padded surface"""
+        text_surf = font.render(text, True, color)
+        outline_surf = font.render(text, True, outline_color)
+        pad = get_outline_padding(outline_offsets)
+        width, height = text_surf.get_size()
+        surface = pygame.Surface((width + 2 * pad, height + 2 * pad), pygame.SRCALPHA)
+        for offset_x, offset_y in outline_offsets:
+            surface.blit(outline_surf, (pad + offset_x, pad + offset_y))
+        surface.blit(text_surf, (pad, pad))
+        return surface
+
+    def clear(self):
+        """Drop all cached surfaces"""
+        self.surfaces.clear()
+
+    def get_stats(self):
+        """Get hit/miss counters and the memory held by cached surfaces"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.surfaces),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'bytes': sum(s.get_width() * s.get_height() * s.get_bytesize() for s in self.surfaces.values())
+        }
+
+
+def get_outline_padding(outline_offsets):
+    """Get how far outlined text surfaces are padded on every side"""
+    return max((max(abs(x), abs(y)) for x, y in outline_offsets), default=0)
+
+
+def get_outline_offsets(width):
+    """Get diagonal outline offsets for an outline width"""
+    return ((-width, -width), (width, -width), (-width, width), (width, width))
+
+
+# Process-wide instances
+font_manager = FontManager()
+text_cache = TextCache()
+
+
+def get_font(size, face=None):
+    """Get a shared font from the process-wide font manager"""
+    return font_manager.get(size, face)
+
+
+def render_text(font, text, color, outline_color=None, outline_offsets=()):
+    """Render text through the process-wide cache (outlined surfaces are padded
+    by get_outline_padding on every side, so they share the plain text's center)"""
+    return text_cache.render(font, text, color, outline_color, outline_offsets)
@@ -0,0 +1,70 @@
+"""
+Game clock: one place that reads time. Durations come from a monotonic clock,
+wall time is read at most once per tick, and time can be injected or sped up
+so headless runs, tests and replays can play through days instantly
+"""
+import time
+from datetime import datetime, timedelta
+
+
+class GameClock:
+    """Monotonic game time plus a per-tick cached wall clock"""
+
+    def __init__(self, start=None, speed=1.0):
+        self.speed = speed  # Game seconds per real second (0 = only advance() moves time)
+        self.follow_system = start is None and speed == 1.0  # Wall time is the system clock
+        self.start_wall = start or datetime.now()  # Wall time when game time was 0
+        self.elapsed = 0.0  # Game seconds since the clock started
+        self.last_real = time.monotonic()
+        self.ticks = 0
+        self.wall = None  # Wall time cached for the current tick
+
+    def tick(self):
+        """Advance game time by the real time since the last tick (once per frame)"""
+        real = time.monotonic()
+        self.elapsed += (real - self.last_real) * self.speed
+        self.last_real = real
+        self.ticks += 1
+        self.wall = None
+
+    def advance(self, seconds):
+        """Jump game time forward (simulated days, tests, replays)"""
+        if self.follow_system:
+            # From now on wall time is derived from game time
+            self.start_wall = self.now() - timedelta(seconds=self.elapsed)
+            self.follow_system = False
+        self.elapsed += seconds
+        self.wall = None
+
+    def set_speed(self, speed):
+        """Change how fast game time runs relative to real time"""
+        if self.follow_system and speed != 1.0:
+            self.start_wall = self.now() - timedelta(seconds=self.elapsed)
+            self.follow_system = False
+        self.speed = speed
+
+    def monotonic(self):
+        """Get game seconds since the clock started (for durations)"""
+        return self.elapsed
+
+    def now(self):
+        """Get the current wall time (read at most once per tick)"""
+        if self.wall is None:
+            if self.follow_system:
+                self.wall = datetime.now()
+            else:
+                self.wall = self.start_wall + timedelta(seconds=self.elapsed)
+        return self.wall
+
+    def today(self):
+        """Get the current wall-clock date"""
+        return self.now().date()
+
+    def timestamp(self):
+        """Get the current wall time as a POSIX timestamp"""
+        return self.now().timestamp()
+
+
+# Shared clock used by every system that is not handed its own
+game_clock = GameClock()
+
@@ -6,7 +6,10 @@ import pygame
 import random
 import json
 import os
-from datetime import datetime
+from collections import namedtuple
+from datetime import timedelta
+from game_clock import game_clock
+from settings import SIMULATION_RATE
 
 
 class CharacterStats:
@@ -29,6 +32,8 @@ class CharacterStats:
         self.traits = []
         self.discovered_secrets = []
 
+        self.version = 0  # Bumped whenever a stat changes
+
         # Load from file
         self.load()
 
@@ -37,6 +42,7 @@ class CharacterStats:
         if hasattr(self, stat_name):
             current = getattr(self, stat_name)
             setattr(self, stat_name, min(100, current + amount))
+            self.version += 1
 
     def has_trait(self, trait_name):
         """Check if player has unlocked a trait"""
@@ -82,6 +88,7 @@ class CharacterStats:
                     for key, value in data.items():
                         if hasattr(self, key):
                             setattr(self, key, value)
+                    self.version += 1
             except:
                 pass
 
@@ -161,10 +168,19 @@ HIDDEN_TRAITS = {
 }
 
 
+# Everything the environment currently contributes to fishing (rebuilt only on transitions)
+EnvironmentSnapshot = namedtuple('EnvironmentSnapshot', [
+    'version', 'weather', 'time_of_day', 'moon_phase',
+    'rarity_mult', 'shiny_mult', 'bite_speed', 'mythic_boost', 'void_boost'
+])
+
+
 class EnvironmentalSystem:
     """Environmental effects and hidden mechanics"""
 
-    def __init__(self):
+    def __init__(self, character_stats, clock=None):
+        self.character_stats = character_stats  # Stat bonuses feed the multipliers
+        self.clock = clock or game_clock
         self.current_weather = "clear"
         self.weather_timer = 0
         self.time_of_day = "day"
@@ -186,19 +202,35 @@ class EnvironmentalSystem:
             "night": {"rarity_mult": 1.8, "mythic_boost": 0.03}  # 8pm-5am
         }
 
+        # Moon phase bonuses
+        self.moon_effects = {
+            "new": {"shiny_mult": 0.5, "void_boost": 2.0},
+            "waxing": {"shiny_mult": 1.0, "void_boost": 1.0},
+            "full": {"shiny_mult": 3.0, "void_boost": 1.0},
+            "waning": {"shiny_mult": 1.0, "void_boost": 1.0}
+        }
+
         # Special moon phases
         self.moon_phase = self.get_moon_phase()
 
+        # Current snapshot and who to tell when it changes
+        self.snapshot = None
+        self.stats_version = None  # character_stats.version the snapshot was built from
+        self.clock_check_at = None  # Wall time of the next hour boundary (time of day / moon phase)
+        self.subscribers = []
+        self.update_clock()
+        self.refresh()
+
     def get_moon_phase(self):
         """Calculate current moon phase (simplified)"""
-        day_of_month = datetime.now().day
-        phase_index = (day_of_month - 1) // 7  # 0-3
+        day_of_month = self.clock.now().day
+        phase_index = min(3, (day_of_month - 1) // 7)  # 0-3 (days 29-31 stay waning)
         phases = ["new", "waxing", "full", "waning"]
         return phases[phase_index]
 
     def get_time_of_day(self):
         """Get current time of day"""
-        hour = datetime.now().hour
+        hour = self.clock.now().hour
         if 5 <= hour < 7:
             return "dawn"
         elif 7 <= hour < 18:
@@ -208,15 +240,17 @@ class EnvironmentalSystem:
         else:
             return "night"
 
-    def update_weather(self):
-        """Update weather randomly"""
-        self.weather_timer += 1
+    def update_weather(self, ticks=1):
+        """Update weather randomly (ticks = simulation ticks since the last update)"""
+        self.weather_timer += ticks
+        changed = False
 
         # Change weather every ~5 minutes
-        if self.weather_timer >= 300 * 60:  # 5 minutes at 60fps
+        if self.weather_timer >= 300 * SIMULATION_RATE:  # 5 minutes
             self.weather_timer = 0
 
             # Weather probabilities
+            previous_weather = self.current_weather
             weather_roll = random.random()
             if weather_roll < 0.50:
                 self.current_weather = "clear"
@@ -228,24 +262,51 @@ class EnvironmentalSystem:
                 self.current_weather = "storm"
             else:
                 self.current_weather = "aurora"  # 2% chance - ultra rare!
+            changed = self.current_weather != previous_weather
+
+        # Time of day and moon phase can only change on the hour
+        if self.clock.now() >= self.clock_check_at:
+            changed = self.update_clock() or changed
+
+        if changed or self.character_stats.version != self.stats_version:
+            self.refresh()
 
-        # Update time of day
+    def update_clock(self):
+        """Re-read time of day and moon phase; returns True if either changed"""
+        previous = (self.time_of_day, self.moon_phase)
         self.time_of_day = self.get_time_of_day()
+        self.moon_phase = self.get_moon_phase()
+        self.clock_check_at = self.clock.now().replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        return (self.time_of_day, self.moon_phase) != previous
+
+    def subscribe(self, callback):
+        """Call callback(snapshot) now and whenever the environment changes"""
+        self.subscribers.append(callback)
+        callback(self.snapshot)
+
+    def refresh(self):
+        """Rebuild the snapshot (if anything changed) and notify subscribers"""
+        multipliers = self.get_environment_multipliers(self.character_stats)
+        self.stats_version = self.character_stats.version
+
+        state = (self.current_weather, self.time_of_day, self.moon_phase,
+                 multipliers["rarity_mult"], multipliers["shiny_mult"], multipliers["bite_speed"],
+                 multipliers["mythic_boost"], multipliers["void_boost"])
+        if self.snapshot and tuple(self.snapshot[1:]) == state:
+            return self.snapshot
+
+        version = self.snapshot.version + 1 if self.snapshot else 1
+        self.snapshot = EnvironmentSnapshot(version, *state)
+        for callback in self.subscribers:
+            callback(self.snapshot)
+        return self.snapshot
 
     def get_environment_multipliers(self, character_stats):
         """Get all active environmental multipliers"""
         weather_mod = self.weather_effects.get(self.current_weather, self.weather_effects["clear"])
         time_mod = self.time_effects.get(self.time_of_day, self.time_effects["day"])
 
-        # Moon phase bonuses
-        moon_bonus = {
-            "new": {"shiny_mult": 0.5, "void_boost": 2.0},
-            "waxing": {"shiny_mult": 1.0, "void_boost": 1.0},
-            "full": {"shiny_mult": 3.0, "void_boost": 1.0},
-            "waning": {"shiny_mult": 1.0, "void_boost": 1.0}
-        }
-
-        current_moon = moon_bonus.get(self.moon_phase, moon_bonus["waxing"])
+        current_moon = self.moon_effects.get(self.moon_phase, self.moon_effects["waxing"])
 
         # Apply character stat bonuses
         stat_multipliers = {
@@ -259,7 +320,8 @@ class EnvironmentalSystem:
             "rarity_mult": weather_mod["rarity_mult"] * time_mod["rarity_mult"] * stat_multipliers["rarity_mult"],
             "shiny_mult": weather_mod["shiny_mult"] * current_moon["shiny_mult"] * stat_multipliers["shiny_mult"],
             "bite_speed": weather_mod["bite_speed"] * stat_multipliers["bite_speed"],
-            "mythic_boost": time_mod.get("mythic_boost", 0.0)
+            "mythic_boost": time_mod.get("mythic_boost", 0.0),
+            "void_boost": current_moon["void_boost"]
         }
 
         return combined
@@ -1,29 +1,56 @@
 import pygame
 import sys
+import math
 from player import Player
 from world import World
 from ui import UI
 from collection import Collection, CollectionUI
-from achievements import AchievementSystem, AchievementUI
+from achievements import AchievementSystem, AchievementUI, RARITY_TIER_STATS
 from progression import PlayerProgression, ProgressionUI
 from daily_rewards import DailyRewards, DailyRewardsUI
 from particles import ParticleSystem, FloatingTextSystem
 from statistics import StatisticsTracker, StatisticsUI
 from hidden_systems import CharacterStats, EnvironmentalSystem, SecretQuestSystem, LoreDiscoverySystem
 from camera import Camera
-from fish import FISH_DATABASE
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WATER_COLOR
+from fish import fish_atlas, loot_tables
+from game_clock import game_clock
+from render import DirtyTracker, Compositor, merge_rects
+from scheduler import Scheduler
+from utils import scaled
+from fonts import get_font, render_text, font_manager, text_cache
+from settings import (SCREEN_WIDTH, SCREEN_HEIGHT, DISPLAY_WIDTH, DISPLAY_HEIGHT, FPS,
+                      SIMULATION_RATE, MAX_SIMULATION_STEPS, WEATHER_UPDATE_RATE, CALENDAR_UPDATE_RATE,
+                      DIRTY_RECT_MODE, LAYOUT_SCALE, MENU_PULSE_RATE, DEBUG_OVERLAY_REFRESH,
+                      FISH_ATLAS_BACKGROUND_BUILD,
+                      LAYER_BACKGROUND, LAYER_WORLD, LAYER_PLAYER, LAYER_PARTICLES, LAYER_UI_BASE,
+                      LAYER_FISHING_ELEMENTS, LAYER_UI_OVERLAY, LAYER_UI_TOP)
 
 class Game:
-    def __init__(self):
+    def __init__(self, clock=None):
         pygame.init()
-        # Fullscreen 1080p for maximum quality
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN | pygame.HWSURFACE | pygame.DOUBLEBUF)
+        # Fullscreen display; the game renders at SCREEN_WIDTH x SCREEN_HEIGHT
+        self.display = pygame.display.set_mode((DISPLAY_WIDTH, DISPLAY_HEIGHT), pygame.FULLSCREEN | pygame.HWSURFACE | pygame.DOUBLEBUF)
+        if self.display.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT):
+            self.screen = self.display  # Native resolution: draw straight to the display
+        else:
+            # Lower internal resolution: render offscreen and scale up when presenting
+            self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
         pygame.display.set_caption("Castaway - Fishing Simulator [1080p 240FPS]")
         self.clock = pygame.time.Clock()
+        self.game_clock = clock or game_clock  # Wall and game time for every system (injectable)
         self.running = True
+
+        # Fixed-timestep simulation: gameplay ticks at SIMULATION_RATE whatever the render rate
+        self.tick_length = 1 / SIMULATION_RATE  # Game seconds per tick
+        self.clock_time = self.game_clock.monotonic()  # Game clock reading at the last step
+        self.tick_debt = 0.0  # Game time not yet simulated
+        self.interpolation = 1.0  # Fraction of a tick drawn past the previous state
         self.state = "menu"  # menu, playing, paused, game_over, collection, achievements, shop, stats
 
+        # Fish sprites are drawn once into a shared atlas, off the main thread if enabled
+        if FISH_ATLAS_BACKGROUND_BUILD:
+            fish_atlas.start_background_build()
+
         # Initialize game objects
         self.player = Player()
         self.world = World()
@@ -34,7 +61,7 @@ class Game:
         self.collection_ui = CollectionUI()
 
         # Achievement system
-        self.achievement_system = AchievementSystem()
+        self.achievement_system = AchievementSystem(self.game_clock)
         self.achievement_ui = AchievementUI()
 
         # Progression system
@@ -43,7 +70,7 @@ class Game:
         self.level_up_timer = 0  # For level up notification
 
         # Daily rewards system
-        self.daily_rewards = DailyRewards()
+        self.daily_rewards = DailyRewards(self.game_clock)
         self.daily_rewards_ui = DailyRewardsUI()
         self.show_daily_reward = self.daily_rewards.has_unclaimed_reward()
 
@@ -52,22 +79,51 @@ class Game:
         self.floating_text_system = FloatingTextSystem()
 
         # Statistics tracking
-        self.statistics = StatisticsTracker()
+        self.statistics = StatisticsTracker(self.game_clock)
         self.statistics_ui = StatisticsUI()
 
         # Hidden systems (Shangri-La Frontier style)
         self.character_stats = CharacterStats()
-        self.environment = EnvironmentalSystem()
+        self.environment = EnvironmentalSystem(self.character_stats, self.game_clock)
         self.secret_quests = SecretQuestSystem()
         self.lore = LoreDiscoverySystem()
 
+        # Fishing modifiers are derived once per environment change, not every frame
+        self.environment_rod = None  # Rod the current modifiers were derived with
+        self.environment.subscribe(self.apply_environment)
+
         # Camera system for screen shake and effects
         self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
 
+        # Gameplay updates, each run at its own rate and timed
+        self.scheduler = Scheduler()
+        self.setup_scheduler()
+
+        # Dirty-rect rendering: every drawable reports the regions it changed
+        self.dirty = DirtyTracker()  # Menu and pause screen
+        self.dirty_trackers = [
+            self.dirty, self.world.dirty, self.player.dirty, self.ui.dirty,
+            self.particle_system.dirty, self.floating_text_system.dirty,
+            self.collection_ui.dirty, self.achievement_ui.dirty, self.progression_ui.dirty,
+            self.statistics_ui.dirty, self.daily_rewards_ui.dirty
+        ]
+        self.presented_state = None  # State shown by the last display update
+        self.presented_offset = (0, 0)  # Camera offset of the last display update
+
+        # Main menu is rendered once; only the start prompt pulses
+        self.menu_surface = None
+        self.menu_version = 0
+
+        # Performance overlay (F3): scheduler, layer and text cache stats
+        self.show_debug = False
+
+        # Layered drawing - unchanged layers are reused instead of redrawn
+        self.compositor = Compositor((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.setup_layers()
+
         # No visible fish - they're caught from a pool like Pokemon
         # Fish collection tracking
         self.total_catches = 0
-        self.collection_dict = {}  # Track how many of each fish caught
         self.catch_streak = 0  # Track consecutive successful catches
         self.last_bite_time = 0  # For tracking reaction time
 
@@ -104,6 +160,8 @@ class Game:
                         self.state = "stats"
                     elif self.state == "stats":
                         self.state = "playing"
+                elif event.key == pygame.K_F3:
+                    self.show_debug = not self.show_debug
                 elif event.key == pygame.K_p and self.state == "playing":
                     self.state = "paused"
                 elif event.key == pygame.K_p and self.state == "paused":
@@ -128,369 +186,465 @@ class Game:
                     if self.state == "playing" and not self.show_daily_reward:
                         # Track bite time for quick reflexes achievement
                         if self.player.fishing_state == 'bite':
-                            self.last_bite_time = pygame.time.get_ticks()
+                            self.last_bite_time = self.game_clock.monotonic()
                         self.player.cast_fishing_line()
 
     def update(self):
-        """Update game state"""
+        """Advance the game by one fixed simulation tick"""
         # Always update camera for screen shake
         self.camera.update()
 
         if self.state == "playing":
-            # Update environment (weather, time of day)
-            self.environment.update_weather()
+            self.scheduler.tick()
+
+    def setup_scheduler(self):
+        """Register the gameplay updates, each at the rate it needs"""
+        add = self.scheduler.add
+
+        # Weather, time of day and the calendar change slowly - check them a few times a second
+        add('environment', self.environment.update_weather, WEATHER_UPDATE_RATE, elapsed=True)
+        add('calendar', self.update_calendar, CALENDAR_UPDATE_RATE)
+
+        # Movement, the fishing state machine and effects run every tick
+        add('player', self.player.update)
+        add('world', self.world.update)
+        add('fishing', self.update_fishing)
+        add('ui', self.update_ui)
+        add('achievements', self.achievement_system.update)
+        add('particles', self.particle_system.update)
+        add('floating_text', self.floating_text_system.update)
+
+    def update_calendar(self):
+        """Roll over daily statistics and track session playtime"""
+        self.statistics.check_daily_reset()
+        self.statistics.update_playtime()
+
+    def update_fishing(self):
+        """Run the fishing state machine: bites, catches and misses"""
+        # Rod modifiers are re-applied when the rod changes (environment changes are pushed)
+        if self.progression.current_rod is not self.environment_rod:
+            self.apply_environment(self.environment.snapshot)
+
+        # Track when fish bites for achievement tracking
+        if self.player.fishing_state == 'bite' and not hasattr(self, '_bite_start_time'):
+            self._bite_start_time = self.game_clock.monotonic()
+
+        # Pokemon-style fishing - catch when reeling
+        if self.player.fishing_state == 'reeling':
+            # Player successfully reacted to bite - catch a random fish!
+            from fish import create_catch
+
+            # Apply rod and environmental bonuses to fish selection
+            fish_id = self.loot_table.sample()
+            force_shiny = False
+
+            # Rod and environmental affects shiny chance and rarity
+            if self.progression.current_rod:
+                import random
+                force_shiny = random.random() < self.shiny_chance
+
+            rod_name = self.progression.current_rod.name if self.progression.current_rod else "Basic Rod"
+            snapshot = self.environment.snapshot
+            environment = (snapshot.weather, snapshot.time_of_day, snapshot.moon_phase)
+            caught_fish = create_catch(fish_id, force_shiny, rod_name, environment)
+
+            # Calculate reaction time FIRST
+            reaction_time = 0
+            if hasattr(self, '_bite_start_time'):
+                reaction_time = self.game_clock.monotonic() - self._bite_start_time
+                delattr(self, '_bite_start_time')
+
+            # Record catch in statistics
+            is_perfect_cast = reaction_time < 0.3 if reaction_time > 0 else False
+            self.statistics.record_catch(
+                caught_fish,
+                rod_name,
+                *environment,
+                reaction_time,
+                is_perfect_cast
+            )
 
-            # Get environmental multipliers
-            env_mults = self.environment.get_environment_multipliers(self.character_stats)
+            # Update character stats based on catch
+            self.character_stats.add_stat('luck', 0.1 if caught_fish.is_shiny else 0.05)
+            self.character_stats.add_stat('patience', 0.05)
+            if caught_fish.rarity in ['legendary', 'mythic']:
+                self.character_stats.add_stat('perception', 0.2)
+            self.scheduler.trigger('environment')  # Stat bonuses feed the multipliers
+
+            # Update stats with new fish system
+            gold_earned = caught_fish.points
+            self.ui.add_score(
+                gold_earned,
+                caught_fish.get_display_name(),
+                caught_fish.get_rarity_color(),
+                caught_fish.is_shiny,
+                caught_fish.fish_id
+            )
+            self.player.log_catch(caught_fish)
+            self.total_catches += 1
+            self.catch_streak += 1
+
+            # Add experience and check for level up
+            exp_gained = self.progression.get_exp_for_fish(caught_fish.rarity, caught_fish.is_shiny)
+            leveled_up = self.progression.add_experience(exp_gained)
+            if leveled_up:
+                self.level_up_timer = 3 * SIMULATION_RATE  # Show level up for 3 seconds
+                # Level up particle effect
+                self.particle_system.create_level_up_effect(self.player.rect.centerx, self.player.rect.centery)
+
+            # Create catch particle effects
+            self.particle_system.create_catch_explosion(
+                self.player.rect.centerx,
+                self.player.rect.top - scaled(20),
+                caught_fish.get_rarity_color(),
+                caught_fish.is_shiny
+            )
 
-            # Apply rod and environmental modifiers to player
-            if self.progression.current_rod:
-                total_bite_mult = self.progression.current_rod.bite_speed_mult * env_mults["bite_speed"]
-                self.player.rod_bite_speed_mult = total_bite_mult
-
-            self.player.update()
-            self.world.update()
-
-            # Update statistics
-            self.statistics.check_daily_reset()
-            self.statistics.update_playtime()
-
-            # Track when fish bites for achievement tracking
-            if self.player.fishing_state == 'bite' and not hasattr(self, '_bite_start_time'):
-                self._bite_start_time = pygame.time.get_ticks()
-
-            # Pokemon-style fishing - catch when reeling
-            if self.player.fishing_state == 'reeling':
-                # Player successfully reacted to bite - catch a random fish!
-                from fish import Fish
-
-                # Apply rod bonuses to fish selection
-                fish_id = None
-                force_shiny = False
-
-                # Rod and environmental affects shiny chance and rarity
-                if self.progression.current_rod:
-                    import random
-                    # Combine rod and environmental shiny multipliers
-                    total_shiny_mult = self.progression.current_rod.shiny_mult * env_mults["shiny_mult"]
-                    shiny_chance = 0.01 * total_shiny_mult
-                    force_shiny = random.random() < shiny_chance
-
-                caught_fish = Fish(0, 0, fish_id=fish_id, force_shiny=force_shiny)
-
-                # Calculate reaction time FIRST
-                reaction_time = 0
-                if hasattr(self, '_bite_start_time'):
-                    reaction_time = (pygame.time.get_ticks() - self._bite_start_time) / 1000
-                    delattr(self, '_bite_start_time')
-
-                # Record catch in statistics
-                is_perfect_cast = reaction_time < 0.3 if reaction_time > 0 else False
-                self.statistics.record_catch(
-                    caught_fish,
-                    self.progression.current_rod.name if self.progression.current_rod else "Basic Rod",
-                    self.environment.current_weather,
-                    self.environment.time_of_day,
-                    self.environment.moon_phase,
-                    reaction_time,
-                    is_perfect_cast
-                )
-
-                # Update character stats based on catch
-                self.character_stats.add_stat('luck', 0.1 if caught_fish.is_shiny else 0.05)
-                self.character_stats.add_stat('patience', 0.05)
-                if caught_fish.rarity in ['legendary', 'mythic']:
-                    self.character_stats.add_stat('perception', 0.2)
-
-                # Update stats with new fish system
-                gold_earned = caught_fish.points
-                self.ui.add_score(
-                    gold_earned,
-                    caught_fish.get_display_name(),
-                    caught_fish.get_rarity_color(),
-                    caught_fish.is_shiny
-                )
-                self.player.add_to_collection(caught_fish)
-                self.total_catches += 1
-                self.catch_streak += 1
-
-                # Add experience and check for level up
-                exp_gained = self.progression.get_exp_for_fish(caught_fish.rarity, caught_fish.is_shiny)
-                leveled_up = self.progression.add_experience(exp_gained)
-                if leveled_up:
-                    self.level_up_timer = 180  # Show level up for 3 seconds
-                    # Level up particle effect
-                    self.particle_system.create_level_up_effect(self.player.rect.centerx, self.player.rect.centery)
-
-                # Create catch particle effects
-                self.particle_system.create_catch_explosion(
-                    self.player.rect.centerx,
-                    self.player.rect.top - 20,
-                    caught_fish.get_rarity_color(),
-                    caught_fish.is_shiny
-                )
-
-                # Screen shake based on fish rarity (more juice!)
-                rarity_shake_map = {
-                    'common': 2,
-                    'uncommon': 3,
-                    'rare': 5,
-                    'epic': 8,
-                    'legendary': 12,
-                    'mythic': 18
-                }
-                shake_amount = rarity_shake_map.get(caught_fish.rarity, 2)
-                if caught_fish.is_shiny:
-                    shake_amount *= 1.5  # Extra shake for shinies!
-                self.camera.apply_shake(shake_amount, duration=20)
-
-                # Floating text for EXP and gold
-                self.floating_text_system.add_exp_text(
-                    self.player.rect.centerx - 40,
-                    self.player.rect.top - 40,
-                    exp_gained
-                )
-                self.floating_text_system.add_gold_text(
-                    self.player.rect.centerx + 40,
-                    self.player.rect.top - 40,
-                    gold_earned
-                )
-
-                # Add to collection tracker
-                self.collection.add_catch(caught_fish.fish_id, caught_fish.is_shiny)
-
-                # Track in collection (separate tracking for normal and shiny)
-                collection_key = f"{caught_fish.fish_id}_{'shiny' if caught_fish.is_shiny else 'normal'}"
-                if collection_key not in self.collection_dict:
-                    self.collection_dict[collection_key] = {
-                        'fish_id': caught_fish.fish_id,
-                        'name': caught_fish.name,
-                        'rarity': caught_fish.rarity,
-                        'is_shiny': caught_fish.is_shiny,
-                        'count': 0
-                    }
-                self.collection_dict[collection_key]['count'] += 1
-
-                # Check achievements with detailed stats
-                self.check_achievements(caught_fish, reaction_time)
-
-                # Reset fishing
-                self.player.cancel_fishing()
-
-            # Update level up timer
-            if self.level_up_timer > 0:
-                self.level_up_timer -= 1
-
-            # Handle failed fishing (for streak tracking)
-            if self.player.fishing_state == 'failed':
-                self.catch_streak = 0
-                if hasattr(self, '_bite_start_time'):
-                    delattr(self, '_bite_start_time')
-
-            self.ui.update()
-            self.achievement_system.update()
-            self.particle_system.update()
-            self.floating_text_system.update()
+            # Screen shake based on fish rarity (more juice!)
+            rarity_shake_map = {
+                'common': 2,
+                'uncommon': 3,
+                'rare': 5,
+                'epic': 8,
+                'legendary': 12,
+                'mythic': 18
+            }
+            shake_amount = rarity_shake_map.get(caught_fish.rarity, 2)
+            if caught_fish.is_shiny:
+                shake_amount *= 1.5  # Extra shake for shinies!
+            self.camera.apply_shake(shake_amount * LAYOUT_SCALE, duration=20)
+
+            # Floating text for EXP and gold
+            self.floating_text_system.add_exp_text(
+                self.player.rect.centerx - scaled(40),
+                self.player.rect.top - scaled(40),
+                exp_gained
+            )
+            self.floating_text_system.add_gold_text(
+                self.player.rect.centerx + scaled(40),
+                self.player.rect.top - scaled(40),
+                gold_earned
+            )
+
+            # Add to collection tracker
+            self.collection.add_catch(caught_fish.fish_id, caught_fish.is_shiny)
+
+            # Check achievements with detailed stats
+            self.check_achievements(caught_fish, reaction_time)
+
+            # Reset fishing
+            self.player.cancel_fishing()
+
+        # Handle failed fishing (for streak tracking)
+        if self.player.fishing_state == 'failed':
+            self.catch_streak = 0
+            if hasattr(self, '_bite_start_time'):
+                delattr(self, '_bite_start_time')
+
+    def update_ui(self):
+        """Count down the catch and level up notifications"""
+        if self.level_up_timer > 0:
+            self.level_up_timer -= 1
+        self.ui.update()
+
+    def apply_environment(self, snapshot):
+        """Derive the loot table and rod modifiers from an environment snapshot"""
+        rod = self.progression.current_rod
+        self.environment_rod = rod
+        self.loot_table = loot_tables.get_table_for(snapshot, rod)
+        rod_shiny_mult = rod.shiny_mult if rod else 1.0
+        self.shiny_chance = 0.01 * rod_shiny_mult * snapshot.shiny_mult
+
+        # Apply rod and environmental modifiers to player
+        if rod:
+            self.player.rod_bite_speed_mult = rod.bite_speed_mult * snapshot.bite_speed
 
     def check_achievements(self, caught_fish, reaction_time):
         """Check and unlock achievements based on game state"""
-        # Build stats dictionary for achievement checking
-        rarity_counts = {
-            'common': 0, 'uncommon': 0, 'rare': 0,
-            'epic': 0, 'legendary': 0, 'mythic': 0
-        }
-
-        for key, data in self.collection_dict.items():
-            rarity = data['rarity']
-            rarity_counts[rarity] += data['count']
-
-        # Check if collection is complete (both normal and shiny of each fish)
-        complete_collection = True
-        for fish_id in FISH_DATABASE.keys():
-            if not (self.collection.has_caught(fish_id, False) and
-                    self.collection.has_caught(fish_id, True)):
-                complete_collection = False
-                break
-
-        stats = {
+        # Feed the running stats; only achievements whose stats changed are re-evaluated
+        achievements = self.achievement_system
+        for key in RARITY_TIER_STATS.get(caught_fish.rarity, ()):
+            achievements.add_stat(key)
+        achievements.set_stats({
             'total_catches': self.total_catches,
             'unique_species': self.collection.unique_fish_caught,
             'total_shinies': self.collection.total_shiny_caught,
             'total_gold': self.ui.score,
-            'uncommon_plus': sum([rarity_counts[r] for r in ['uncommon', 'rare', 'epic', 'legendary', 'mythic']]),
-            'rare_plus': sum([rarity_counts[r] for r in ['rare', 'epic', 'legendary', 'mythic']]),
-            'epic_plus': sum([rarity_counts[r] for r in ['epic', 'legendary', 'mythic']]),
-            'legendary_plus': sum([rarity_counts[r] for r in ['legendary', 'mythic']]),
-            'mythic_count': rarity_counts['mythic'],
-            'complete_collection': complete_collection,
+            'complete_collection': self.collection.is_complete(),
             'catch_streak': self.catch_streak,
             'quick_catch': reaction_time < 0.5 if reaction_time > 0 else False,
-            'patient_catch': self.player.bite_timer > 180 if hasattr(self.player, 'bite_timer') else False,
-            'all_unlocked': self.achievement_system.get_unlocked_count() >= self.achievement_system.get_total_count() - 1
-        }
+            'patient_catch': self.player.bite_timer > 3 * SIMULATION_RATE if hasattr(self.player, 'bite_timer') else False
+        })
 
         # Check achievements and award gold
-        self.achievement_system.check_achievements(stats)
+        achievements.check_achievements()
 
         # Add any achievement rewards to score
-        if self.achievement_system.newly_unlocked:
-            for achievement in self.achievement_system.newly_unlocked:
+        if achievements.newly_unlocked:
+            for achievement in achievements.newly_unlocked:
                 if not hasattr(achievement, '_reward_claimed'):
                     self.ui.score += achievement.reward_gold
                     achievement._reward_claimed = True
 
+    def setup_layers(self):
+        """Register every drawable on its render layer"""
+        add = self.compositor.add
+        in_game = lambda: self.state != "menu"
+        on_field = lambda: self.state in ("playing", "paused")
+
+        # Menu or terrain at the bottom, both cover the whole screen
+        add(LAYER_BACKGROUND, self.draw_menu, key=lambda: self.menu_version, tracker=self.dirty,
+            visible=lambda: self.state == "menu", opaque=True)
+        add(LAYER_BACKGROUND, self.world.draw_terrain,
+            key=lambda: self.world.background_version, tracker=self.world.dirty, visible=in_game)
+
+        add(LAYER_WORLD, self.world.draw_water,
+            key=lambda: self.world.water_anim_frame, tracker=self.world.dirty, visible=in_game)
+
+        add(LAYER_PLAYER, self.player.draw,
+            key=lambda: (self.player.get_draw_pos(), self.player.image),
+            tracker=self.player.dirty, visible=in_game)
+
+        # Particles behind UI
+        add(LAYER_PARTICLES, self.particle_system.draw,
+            key=self.particle_system.get_draw_key,
+            tracker=self.particle_system.dirty, visible=on_field)
+        add(LAYER_PARTICLES, self.floating_text_system.draw,
+            key=self.floating_text_system.get_draw_key,
+            tracker=self.floating_text_system.dirty, visible=on_field)
+
+        add(LAYER_UI_BASE, lambda screen: self.ui.draw(screen, self.player, self.progression),
+            key=lambda: self.ui.get_draw_key(self.player, self.progression),
+            tracker=self.ui.dirty, visible=in_game)
+        add(LAYER_UI_BASE,
+            lambda screen: self.daily_rewards_ui.draw_streak_indicator(screen, self.daily_rewards, SCREEN_WIDTH),
+            key=lambda: self.daily_rewards.current_streak, tracker=self.daily_rewards_ui.dirty, visible=on_field)
+
+        # Bobber and line after UI so they don't clip behind stats
+        add(LAYER_FISHING_ELEMENTS, self.player.draw_fishing_elements,
+            key=lambda: (self.player.fishing_state, self.player.cast_progress,
+                         tuple(self.player.bobber_pos or ()), self.player.bobber_bob,
+                         self.player.bite_notification_timer > 0),
+            tracker=self.player.dirty, visible=on_field)
+
+        # Notifications and menus over the game
+        add(LAYER_UI_OVERLAY,
+            lambda screen: self.progression_ui.draw_level_up_notification(screen, self.progression.level, SCREEN_WIDTH),
+            tracker=self.progression_ui.dirty, visible=lambda: on_field() and self.level_up_timer > 0)
+        add(LAYER_UI_OVERLAY,
+            lambda screen: self.achievement_ui.draw_notification(screen, self.achievement_system, SCREEN_WIDTH),
+            key=lambda: (self.achievement_system.notification_timer, len(self.achievement_system.newly_unlocked)),
+            tracker=self.achievement_ui.dirty, visible=on_field)
+        add(LAYER_UI_OVERLAY,
+            lambda screen: self.collection_ui.draw(screen, self.collection, SCREEN_WIDTH, SCREEN_HEIGHT),
+            key=lambda: self.collection.total_catches, tracker=self.collection_ui.dirty,
+            visible=lambda: self.state == "collection")
+        add(LAYER_UI_OVERLAY,
+            lambda screen: self.achievement_ui.draw(screen, self.achievement_system, SCREEN_WIDTH, SCREEN_HEIGHT),
+            key=lambda: self.achievement_system.get_unlocked_count(), tracker=self.achievement_ui.dirty,
+            visible=lambda: self.state == "achievements")
+        add(LAYER_UI_OVERLAY,
+            lambda screen: self.progression_ui.draw_shop(screen, self.progression, self.ui.score, SCREEN_WIDTH, SCREEN_HEIGHT),
+            key=lambda: (self.ui.score, self.progression.level, self.progression.experience,
+                         self.progression.current_rod.id, len(self.progression.owned_rods)),
+            tracker=self.progression_ui.dirty, visible=lambda: self.state == "shop")
+        add(LAYER_UI_OVERLAY,
+            lambda screen: self.statistics_ui.draw(screen, self.statistics, SCREEN_WIDTH, SCREEN_HEIGHT),
+            key=lambda: (self.statistics.total_catches, self.statistics.total_casts,
+                         self.statistics.catches_today, self.statistics.gold_today),
+            tracker=self.statistics_ui.dirty, visible=lambda: self.state == "stats")
+
+        # Daily reward popup and pause screen on top of everything
+        add(LAYER_UI_TOP,
+            lambda screen: self.daily_rewards_ui.draw_daily_reward_popup(screen, self.daily_rewards, SCREEN_WIDTH, SCREEN_HEIGHT),
+            tracker=self.daily_rewards_ui.dirty, visible=lambda: on_field() and self.show_daily_reward)
+        add(LAYER_UI_TOP, self.draw_pause, key=lambda: "paused", tracker=self.dirty,
+            visible=lambda: self.state == "paused")
+        add(LAYER_UI_TOP, self.draw_menu_prompt, key=self.get_menu_pulse_color, tracker=self.dirty,
+            visible=lambda: self.state == "menu")
+        add(LAYER_UI_TOP, self.draw_debug,
+            key=lambda: pygame.time.get_ticks() * DEBUG_OVERLAY_REFRESH // 1000, tracker=self.dirty,
+            visible=lambda: self.show_debug)
+
     def draw(self):
         """Draw all game elements"""
-        # Get camera offset for screen shake
-        cam_offset_x, cam_offset_y = self.camera.get_offset()
-
-        # Create a temporary surface for camera effects
-        if cam_offset_x != 0 or cam_offset_y != 0:
-            temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            draw_surface = temp_surface
-        else:
-            draw_surface = self.screen
-
-        draw_surface.fill(WATER_COLOR)
-
-        if self.state == "menu":
-            self.draw_menu()
-        elif self.state == "collection":
-            # Draw game in background
-            self.world.draw(self.screen)
-            self.player.draw(self.screen)
-            self.ui.draw(self.screen, self.player, self.progression)
-            # Draw collection UI on top
-            self.collection_ui.draw(self.screen, self.collection, SCREEN_WIDTH, SCREEN_HEIGHT)
-        elif self.state == "achievements":
-            # Draw game in background
-            self.world.draw(self.screen)
-            self.player.draw(self.screen)
-            self.ui.draw(self.screen, self.player, self.progression)
-            # Draw achievements UI on top
-            self.achievement_ui.draw(self.screen, self.achievement_system, SCREEN_WIDTH, SCREEN_HEIGHT)
-        elif self.state == "shop":
-            # Draw game in background
-            self.world.draw(self.screen)
-            self.player.draw(self.screen)
-            self.ui.draw(self.screen, self.player, self.progression)
-            # Draw shop UI on top
-            self.progression_ui.draw_shop(self.screen, self.progression, self.ui.score, SCREEN_WIDTH, SCREEN_HEIGHT)
-        elif self.state == "stats":
-            # Draw game in background
-            self.world.draw(self.screen)
-            self.player.draw(self.screen)
-            self.ui.draw(self.screen, self.player, self.progression)
-            # Draw statistics UI on top
-            self.statistics_ui.draw(self.screen, self.statistics, SCREEN_WIDTH, SCREEN_HEIGHT)
-        else:
-            self.world.draw(self.screen)
-            self.player.draw(self.screen)
-
-            # Draw particles behind UI
-            self.particle_system.draw(self.screen)
-            self.floating_text_system.draw(self.screen)
-
-            self.ui.draw(self.screen, self.player, self.progression)
-
-            # Draw fishing elements (bobber, line) AFTER UI so they don't clip behind stats
-            self.player.draw_fishing_elements(self.screen)
-
-            # Draw streak indicator
-            self.daily_rewards_ui.draw_streak_indicator(self.screen, self.daily_rewards, SCREEN_WIDTH)
-
-            # Draw level up notification
-            if self.level_up_timer > 0:
-                self.progression_ui.draw_level_up_notification(self.screen, self.progression.level, SCREEN_WIDTH)
-
-            # Draw achievement notifications on top
-            self.achievement_ui.draw_notification(self.screen, self.achievement_system, SCREEN_WIDTH)
-
-            # Draw daily reward popup if unclaimed
-            if self.show_daily_reward:
-                self.daily_rewards_ui.draw_daily_reward_popup(
-                    self.screen, self.daily_rewards, SCREEN_WIDTH, SCREEN_HEIGHT
-                )
-
-            # Draw pause text if paused
-            if self.state == "paused":
-                font = pygame.font.Font(None, 72)
-                pause_text = font.render("PAUSED", True, (255, 255, 255))
-                text_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-                self.screen.blit(pause_text, text_rect)
-
-                # Draw resume instruction
-                small_font = pygame.font.Font(None, 36)
-                resume_text = small_font.render("Press P to Resume", True, (200, 200, 200))
-                resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-                self.screen.blit(resume_text, resume_rect)
-
-        # Apply camera shake by blitting temp surface with offset
-        if cam_offset_x != 0 or cam_offset_y != 0:
-            self.screen.fill((0, 0, 0))  # Fill with black
-            self.screen.blit(temp_surface, (cam_offset_x, cam_offset_y))
-
-        pygame.display.flip()
-
-    def draw_menu(self):
-        """Draw the main menu with Stardew Valley aesthetic"""
+        # Moving things are drawn between their last two ticks
+        for system in (self.player, self.particle_system, self.floating_text_system):
+            system.interpolation = self.interpolation
+
+        # Camera offset for screen shake - moves the world layers, the UI stays steady
+        cam_offset = self.camera.get_offset()
+        changed = self.compositor.draw(self.screen, cam_offset)
+
+        self.present(cam_offset, changed)
+
+    def present(self, cam_offset, changed=True):
+        """Show the finished frame - only changed regions in dirty-rect mode"""
+        dirty_rects = []
+        for tracker in self.dirty_trackers:
+            dirty_rects.extend(tracker.collect())
+
+        if not changed:
+            return  # The display already shows this exact frame
+
+        # State changes and screen shake move everything, so they need a full flip;
+        # on the menu only the start prompt changes, so just its region is pushed
+        full_update = ((not DIRTY_RECT_MODE and self.state != "menu") or
+                       self.state != self.presented_state or
+                       cam_offset != (0, 0) or self.presented_offset != (0, 0))
+        self.presented_state = self.state
+        self.presented_offset = cam_offset
+
+        if self.screen is not self.display:
+            # Upscale the internal frame to the display
+            pygame.transform.scale(self.screen, self.display.get_size(), self.display)
+
+        if full_update:
+            pygame.display.flip()
+        elif dirty_rects:
+            dirty_rects = merge_rects(dirty_rects, self.screen.get_rect())
+            pygame.display.update([self.to_display_rect(rect) for rect in dirty_rects])
+
+    def to_display_rect(self, rect):
+        """Convert a render-resolution rect to display coordinates"""
+        if self.screen is self.display:
+            return rect
+        scale_x = self.display.get_width() / SCREEN_WIDTH
+        scale_y = self.display.get_height() / SCREEN_HEIGHT
+        left, top = int(rect.left * scale_x), int(rect.top * scale_y)
+        right, bottom = math.ceil(rect.right * scale_x), math.ceil(rect.bottom * scale_y)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def draw_pause(self, screen):
+        """Draw the pause screen text"""
+        font = get_font(scaled(72))
+        pause_text = render_text(font, "PAUSED", (255, 255, 255))
+        text_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        screen.blit(pause_text, text_rect)
+        self.dirty.add(text_rect, 'paused')
+
+        # Draw resume instruction
+        small_font = get_font(scaled(36))
+        resume_text = render_text(small_font, "Press P to Resume", (200, 200, 200))
+        resume_rect = resume_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + scaled(60)))
+        screen.blit(resume_text, resume_rect)
+        self.dirty.add(resume_rect, 'paused')
+
+    def invalidate_menu(self):
+        """Rebuild the cached menu next frame (after a resolution or locale change)"""
+        self.menu_surface = None
+        self.menu_version += 1
+
+    def draw_menu(self, screen):
+        """Draw the cached main menu"""
+        if self.menu_surface is None:
+            self.build_menu()
+        screen.blit(self.menu_surface, (0, 0))
+        self.dirty.add((0, 0, SCREEN_WIDTH, SCREEN_HEIGHT), ('menu', self.menu_version))
+
+    def get_menu_pulse_color(self):
+        """Get the color of the pulsing start prompt (in steps, so idle frames can be skipped)"""
+        # Stepped a few times a second so the menu is redrawn only that often
+        step = pygame.time.get_ticks() * MENU_PULSE_RATE // 1000
+        pulse = abs(math.sin(step * 2 / MENU_PULSE_RATE))
+        return (int(255 * pulse), int(255 * pulse), int(100 + 155 * pulse))
+
+    def get_debug_lines(self):
+        """Get the performance overlay text: per-subsystem, per-layer and text cache stats"""
+        lines = ["Performance (F3)", "Updates - avg / max ms per run:"]
+        for name, stats in self.scheduler.get_stats().items():
+            rate = stats['rate'] if isinstance(stats['rate'], str) else f"{stats['rate']} Hz"
+            lines.append(f"  {name} ({rate}): {stats['avg_ms']:.3f} / {stats['max_ms']:.3f}  x{stats['runs']}")
+        lines.append("Layers - redraws / reuses, draw ms:")
+        for index, stats in self.compositor.get_stats().items():
+            lines.append(f"  {index}: {stats['redraws']} / {stats['reuses']}, {stats['draw_time_ms']:.1f}")
+        fonts = font_manager.get_stats()
+        lines.append(f"Fonts: {fonts['cached']} cached, {fonts['loaded']} loads, {fonts['load_time_ms']:.1f} ms")
+        text = text_cache.get_stats()
+        lines.append(f"Text cache: {text['entries']} entries, {text['hit_rate']:.0%} hits, "
+                     f"{text['evictions']} evicted, {text['bytes'] // 1024} KB")
+        return lines
+
+    def draw_debug(self, screen):
+        """Draw the performance overlay"""
+        font = get_font(scaled(18))
+        line_height = font.get_linesize()
+        lines = self.get_debug_lines()
+        rect = pygame.Rect(scaled(20), scaled(240), scaled(520), line_height * len(lines) + scaled(20))
+        screen.fill((0, 0, 0), rect)
+        for i, line in enumerate(lines):
+            # Rendered directly: changing numbers would only churn the text cache being measured
+            screen.blit(font.render(line, True, (200, 255, 200)), (rect.x + scaled(10), rect.y + scaled(10) + i * line_height))
+        self.dirty.add(rect, ('debug', pygame.time.get_ticks() * DEBUG_OVERLAY_REFRESH // 1000))
+
+    def draw_menu_prompt(self, screen):
+        """Draw the pulsing start prompt over the cached menu"""
+        start_color = self.get_menu_pulse_color()
+        start_text = render_text(self.menu_button_font, "Press ENTER to Start!", start_color)
+        start_rect = start_text.get_rect(center=self.menu_prompt_center)
+        screen.blit(start_text, start_rect)
+        self.dirty.add(start_rect, start_color)
+
+    def build_menu(self):
+        """Render the static parts of the main menu with Stardew Valley aesthetic"""
         from settings import UI_BG, UI_ACCENT, UI_BORDER, GRASS_COLOR
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
 
         # Draw a nice background
         # Sky/water gradient
-        for y in range(0, SCREEN_HEIGHT, 20):
+        for y in range(0, SCREEN_HEIGHT, scaled(20)):
             color_factor = y / SCREEN_HEIGHT
             color = (
                 int(76 + (139 - 76) * color_factor),
                 int(145 + (195 - 145) * color_factor),
                 int(178 + (74 - 178) * color_factor)
             )
-            pygame.draw.rect(self.screen, color, (0, y, SCREEN_WIDTH, 20))
+            pygame.draw.rect(screen, color, (0, y, SCREEN_WIDTH, scaled(20)))
 
         # Draw decorative grass at bottom (scaled)
-        grass_rect = pygame.Rect(0, SCREEN_HEIGHT - 200, SCREEN_WIDTH, 200)
-        pygame.draw.rect(self.screen, GRASS_COLOR, grass_rect)
+        grass_rect = pygame.Rect(0, SCREEN_HEIGHT - scaled(200), SCREEN_WIDTH, scaled(200))
+        pygame.draw.rect(screen, GRASS_COLOR, grass_rect)
 
-        # Title box (scaled for 1080p)
-        title_width = 1000
-        title_height = 200
+        # Title box (scaled to render size)
+        title_width = scaled(1000)
+        title_height = scaled(200)
         title_x = SCREEN_WIDTH // 2 - title_width // 2
-        title_y = 160
+        title_y = scaled(160)
 
         # Title box background
-        pygame.draw.rect(self.screen, (0, 0, 0, 50), (title_x + 10, title_y + 10, title_width, title_height))
-        pygame.draw.rect(self.screen, UI_BG, (title_x, title_y, title_width, title_height))
-        pygame.draw.rect(self.screen, UI_BORDER, (title_x, title_y, title_width, title_height), 8)
+        pygame.draw.rect(screen, (0, 0, 0, 50), (title_x + scaled(10), title_y + scaled(10), title_width, title_height))
+        pygame.draw.rect(screen, UI_BG, (title_x, title_y, title_width, title_height))
+        pygame.draw.rect(screen, UI_BORDER, (title_x, title_y, title_width, title_height), max(1, scaled(8)))
 
         # Title (with shadow for depth) - scaled
-        title_font = pygame.font.Font(None, 128)
+        title_font = get_font(scaled(128))
         # Shadow
-        title_shadow = title_font.render("CASTAWAY", True, (20, 10, 5))
-        shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 6, title_y + 76))
-        self.screen.blit(title_shadow, shadow_rect)
+        title_shadow = render_text(title_font, "CASTAWAY", (20, 10, 5))
+        shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH // 2 + scaled(6), title_y + scaled(76)))
+        screen.blit(title_shadow, shadow_rect)
         # Main title
-        title_text = title_font.render("CASTAWAY", True, UI_ACCENT)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, title_y + 70))
-        self.screen.blit(title_text, title_rect)
+        title_text = render_text(title_font, "CASTAWAY", UI_ACCENT)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, title_y + scaled(70)))
+        screen.blit(title_text, title_rect)
 
         # Subtitle (scaled)
-        subtitle_font = pygame.font.Font(None, 56)
-        subtitle_text = subtitle_font.render("Wooper's Fishing Adventure", True, (144, 238, 144))
-        subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, title_y + 140))
-        self.screen.blit(subtitle_text, subtitle_rect)
+        subtitle_font = get_font(scaled(56))
+        subtitle_text = render_text(subtitle_font, "Wooper's Fishing Adventure", (144, 238, 144))
+        subtitle_rect = subtitle_text.get_rect(center=(SCREEN_WIDTH // 2, title_y + scaled(140)))
+        screen.blit(subtitle_text, subtitle_rect)
 
         # Instructions box (scaled)
-        box_width = 900
-        box_height = 500
+        box_width = scaled(900)
+        box_height = scaled(500)
         box_x = SCREEN_WIDTH // 2 - box_width // 2
-        box_y = 420
+        box_y = scaled(420)
 
-        pygame.draw.rect(self.screen, (0, 0, 0, 50), (box_x + 10, box_y + 10, box_width, box_height))
-        pygame.draw.rect(self.screen, UI_BG, (box_x, box_y, box_width, box_height))
-        pygame.draw.rect(self.screen, UI_BORDER, (box_x, box_y, box_width, box_height), 8)
+        pygame.draw.rect(screen, (0, 0, 0, 50), (box_x + scaled(10), box_y + scaled(10), box_width, box_height))
+        pygame.draw.rect(screen, UI_BG, (box_x, box_y, box_width, box_height))
+        pygame.draw.rect(screen, UI_BORDER, (box_x, box_y, box_width, box_height), max(1, scaled(8)))
 
-        # Instructions (scaled for 1080p)
-        instructions_font = pygame.font.Font(None, 40)
+        # Instructions (scaled)
+        instructions_font = get_font(scaled(40))
         instructions = [
             "How to Play:",
             "",
@@ -508,37 +662,60 @@ class Game:
             "Discover lore & unlock secrets!",
         ]
 
-        y_offset = box_y + 40
+        y_offset = box_y + scaled(40)
         for instruction in instructions:
             if instruction.startswith("How to Play:") or instruction.startswith("Features:"):
-                text = instructions_font.render(instruction, True, UI_ACCENT)
+                text = render_text(instructions_font, instruction, UI_ACCENT)
             elif instruction:
-                text = instructions_font.render(instruction, True, (200, 200, 180))
+                text = render_text(instructions_font, instruction, (200, 200, 180))
             else:
-                y_offset += 16
+                y_offset += scaled(16)
                 continue
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            self.screen.blit(text, text_rect)
-            y_offset += 36
+            screen.blit(text, text_rect)
+            y_offset += scaled(36)
+
+        # Start button (scaled) - drawn each frame by draw_menu_prompt
+        self.menu_button_font = get_font(scaled(80))
+        self.menu_prompt_center = (SCREEN_WIDTH // 2, scaled(980))
 
-        # Start button (scaled)
-        button_font = pygame.font.Font(None, 80)
-        start_text = button_font.render("Press ENTER to Start!", True, (255, 255, 100))
-        start_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, 980))
+        self.menu_surface = screen
 
-        # Pulsing effect
-        import math
-        pulse = abs(math.sin(pygame.time.get_ticks() / 500))
-        start_color = (int(255 * pulse), int(255 * pulse), int(100 + 155 * pulse))
-        start_text = button_font.render("Press ENTER to Start!", True, start_color)
+    def step(self):
+        """Run the simulation ticks that are due by the game clock"""
+        self.game_clock.tick()
+        now = self.game_clock.monotonic()
+        self.tick_debt += now - self.clock_time
+        self.clock_time = now
 
-        self.screen.blit(start_text, start_rect)
+        # After a long stall only catch up a few ticks; the game slows down instead of spiralling
+        self.tick_debt = min(self.tick_debt, MAX_SIMULATION_STEPS * self.tick_length)
+        while self.tick_debt >= self.tick_length:
+            self.update()
+            self.tick_debt -= self.tick_length
+
+        if self.state == "playing":
+            self.interpolation = self.tick_debt / self.tick_length
+        else:
+            # Paused and menu screens don't advance the world - draw it as it is so
+            # the player, particles and floating text keep their keys and are reused
+            self.interpolation = 1.0
+            self.player.previous_pos = self.player.rect.topleft  # Resume from here, not mid-step
+
+    def simulate(self, seconds):
+        """Play the given game time as fast as possible without drawing (headless runs)"""
+        for _ in range(round(seconds * SIMULATION_RATE)):
+            self.game_clock.advance(self.tick_length)
+            self.update()
+        self.clock_time = self.game_clock.monotonic()
+        self.tick_debt = 0.0
+        self.interpolation = 1.0
 
     def run(self):
         """Main game loop"""
         while self.running:
             self.handle_events()
-            self.update()
+            self.step()
             self.draw()
             self.clock.tick(FPS)
 
@@ -1,213 +1,372 @@
 import pygame
-import random
 import math
-
-
-class Particle:
-    """Single particle for effects"""
-
-    def __init__(self, x, y, color, velocity, lifetime, size=3):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx, self.vy = velocity
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.gravity = 0.2
-        self.alpha = 255
-
-    def update(self):
-        """Update particle position and lifetime"""
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity  # Apply gravity
-        self.lifetime -= 1
-
-        # Fade out
-        self.alpha = int(255 * (self.lifetime / self.max_lifetime))
-
-    def draw(self, screen):
-        """Draw the particle"""
-        if self.lifetime > 0:
-            # Create surface with alpha
-            surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            color_with_alpha = (*self.color[:3], self.alpha)
-            pygame.draw.circle(surf, color_with_alpha, (self.size, self.size), self.size)
-            screen.blit(surf, (int(self.x - self.size), int(self.y - self.size)))
-
-    def is_alive(self):
-        """Check if particle is still alive"""
-        return self.lifetime > 0
+import numpy as np
+from render import DirtyTracker, union_rects
+from settings import (LAYOUT_SCALE, PARTICLE_CAPACITY, PARTICLE_GRAVITY, PARTICLE_COLOR_STEP,
+                      PARTICLE_ALPHA_STEP, PARTICLE_SPRITE_CACHE_SIZE, PARTICLE_EMITTER_BUDGETS,
+                      PARTICLE_OVERFLOW_POLICY)
+from fonts import get_font, render_text, get_outline_offsets
+from utils import scaled
+
+# Floating text outline (1px diagonal)
+TEXT_OUTLINE_OFFSETS = get_outline_offsets(1)
+
+# Particle emitters (each create_* effect), in the order stored per particle
+EMITTERS = ('catch', 'level_up', 'achievement', 'splash', 'ripple', 'stars')
+
+
+class ParticleSpriteCache:
+    """Pre-rendered particle circles keyed by (size, color bucket, alpha bucket)"""
+
+    def __init__(self, color_step=PARTICLE_COLOR_STEP, alpha_step=PARTICLE_ALPHA_STEP,
+                 max_entries=PARTICLE_SPRITE_CACHE_SIZE):
+        self.color_step = color_step
+        self.alpha_step = alpha_step
+        self.max_entries = max_entries
+        self.sprites = {}  # Packed key -> Surface
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+
+    def quantize(self, values, step):
+        """Snap channel values to the center of their bucket"""
+        if step <= 1:
+            return values
+        return np.minimum(255, values // step * step + step // 2)
+
+    def get_sprites(self, sizes, colors, alphas):
+        """Get one sprite per particle, rendering only the buckets not seen before"""
+        colors = self.quantize(colors.astype(np.int64), self.color_step)
+        alphas = self.quantize(alphas.astype(np.int64), self.alpha_step)
+        keys = ((sizes.astype(np.int64) << 32) | (colors[:, 0] << 24) |
+                (colors[:, 1] << 16) | (colors[:, 2] << 8) | alphas)
+
+        unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        if len(self.sprites) + len(unique_keys) > self.max_entries:
+            self.sprites.clear()  # Bounded memory; sprites are cheap to rebuild
+            self.flushes += 1
+
+        unique_sprites = []
+        misses = 0
+        for key, index in zip(unique_keys.tolist(), first.tolist()):
+            sprite = self.sprites.get(key)
+            if sprite is None:
+                misses += 1
+                sprite = self.build(int(sizes[index]), tuple(colors[index].tolist()), int(alphas[index]))
+                self.sprites[key] = sprite
+            unique_sprites.append(sprite)
+        self.misses += misses
+        self.hits += len(keys) - misses
+        return [unique_sprites[i] for i in inverse.tolist()]
+
+    def build(self, size, color, alpha):
+        """Render one particle circle"""
+        surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, (*color, alpha), (size, size), size)
+        return surf
+
+    def get_stats(self):
+        """Get hit/miss counters and the memory held by cached sprites"""
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self.sprites),
+            'hits': self.hits,
+            'misses': self.misses,
+            'flushes': self.flushes,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'bytes': sum(s.get_width() * s.get_height() * 4 for s in self.sprites.values())
+        }
 
 
 class ParticleSystem:
-    """Manages all particle effects"""
-
-    def __init__(self):
-        self.particles = []
+    """Manages all particle effects in a fixed-capacity pool of NumPy arrays (one row per particle)"""
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, budgets=PARTICLE_EMITTER_BUDGETS,
+                 overflow_policy=PARTICLE_OVERFLOW_POLICY):
+        self.capacity = capacity
+        self.budgets = budgets  # Emitter name -> max live particles
+        self.overflow_policy = overflow_policy  # 'drop_oldest', 'drop_smallest' or 'reject'
+        self.count = 0  # Live particles occupy rows [0, count)
+
+        # Preallocated once; spawning fills or overwrites rows and culling packs them
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.max_lifetime = np.ones(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+        self.size = np.ones(capacity, dtype=np.int32)
+        self.emitter = np.zeros(capacity, dtype=np.int8)  # Index into EMITTERS
+        self.born = np.zeros(capacity, dtype=np.int64)  # Spawn serial (lower = older)
+        self.spawned = 0
+
+        self.rng = np.random.default_rng()
+        self.sprite_cache = ParticleSpriteCache()
+
+        # Velocity, size and gravity are given at 1080p; scale to the render size
+        self.gravity = PARTICLE_GRAVITY * LAYOUT_SCALE
+
+        # Overflow counters
+        self.dropped = 0  # Live particles removed to make room
+        self.rejected = 0  # New particles that were never spawned
+
+        # Regions changed since last frame (dirty-rect rendering)
+        self.dirty = DirtyTracker()
+        self.ticks = 0  # Updates so far; particles change every tick
+        self.interpolation = 1.0  # Fraction of a tick since the last update (set by the game)
+
+    def arrays(self):
+        """Get every per-particle array"""
+        return (self.x, self.y, self.vx, self.vy, self.lifetime,
+                self.max_lifetime, self.color, self.size, self.emitter, self.born)
+
+    def keep_rows(self, rows):
+        """Pack the given live rows to the front and drop the rest"""
+        if len(rows) < self.count:
+            for array in self.arrays():
+                array[:len(rows)] = array[rows]
+            self.count = len(rows)
+
+    def pick_victims(self, wanted, free, candidates):
+        """Choose live rows to overwrite when fewer than wanted rows are free (per the overflow policy)"""
+        if wanted <= free or self.overflow_policy not in ('drop_oldest', 'drop_smallest'):
+            return candidates[:0]
+        count = wanted - free
+        if count >= len(candidates):
+            return candidates
+
+        rank = self.born[candidates]
+        if self.overflow_policy == 'drop_smallest':
+            rank = rank | (self.size[candidates].astype(np.int64) << 40)  # Smallest, then oldest
+        return candidates[np.argpartition(rank, count - 1)[:count]]
+
+    def emit(self, x, y, vx, vy, colors, lifetimes, sizes, emitter):
+        """Spawn a batch of particles at (x, y); velocities and sizes are at 1080p"""
+        emitter_id = EMITTERS.index(emitter)
+        wanted = len(vx)
+
+        # Stay within the emitter's budget by reusing its own rows...
+        emitter_rows = np.flatnonzero(self.emitter[:self.count] == emitter_id)
+        free = max(0, self.budgets.get(emitter, self.capacity) - len(emitter_rows))
+        victims = self.pick_victims(wanted, free, emitter_rows)
+        n = min(wanted, free + len(victims))
+
+        # ...then within the pool, appending to the free rows before overwriting others
+        free = self.capacity - self.count
+        needed = n - len(victims)
+        if needed > free:
+            others = np.setdiff1d(np.arange(self.count), victims, assume_unique=True)
+            pool_victims = self.pick_victims(needed, free, others)
+            victims = np.concatenate((victims, pool_victims))
+            n = len(victims) + min(needed - len(pool_victims), free)
+        appended = n - len(victims)
+        rows = np.concatenate((victims, np.arange(self.count, self.count + appended)))
+        self.count += appended
+        self.dropped += len(victims)
+        self.rejected += wanted - n
+        if n == 0:
+            return
+
+        self.x[rows] = x
+        self.y[rows] = y
+        self.vx[rows] = np.asarray(vx[:n]) * LAYOUT_SCALE
+        self.vy[rows] = np.asarray(vy[:n]) * LAYOUT_SCALE
+        self.lifetime[rows] = lifetimes[:n]
+        self.max_lifetime[rows] = lifetimes[:n]
+        self.color[rows] = colors[:n]
+        self.size[rows] = np.maximum(1, np.rint(np.asarray(sizes[:n]) * LAYOUT_SCALE))
+        self.emitter[rows] = emitter_id
+        self.born[rows] = np.arange(self.spawned, self.spawned + n)
+        self.spawned += n
+
+    def random_velocities(self, count, min_speed, max_speed, min_angle=0.0, max_angle=math.pi * 2):
+        """Get velocities in random directions within an angle range"""
+        angle = self.rng.uniform(min_angle, max_angle, count)
+        speed = self.rng.uniform(min_speed, max_speed, count)
+        return np.cos(angle) * speed, np.sin(angle) * speed
+
+    def random_ints(self, low, high, count):
+        """Get random integers in [low, high] (like random.randint)"""
+        return self.rng.integers(low, high + 1, count)
 
     def create_catch_explosion(self, x, y, rarity_color, is_shiny=False):
         """Create explosion effect when catching a fish"""
         particle_count = 30 if is_shiny else 20
 
-        for i in range(particle_count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(2, 6)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed - 2  # Bias upward
-
-            # Use rarity color with some variation
-            color_variation = random.randint(-30, 30)
-            particle_color = (
-                max(0, min(255, rarity_color[0] + color_variation)),
-                max(0, min(255, rarity_color[1] + color_variation)),
-                max(0, min(255, rarity_color[2] + color_variation))
-            )
+        vx, vy = self.random_velocities(particle_count, 2, 6)
+        vy -= 2  # Bias upward
 
-            lifetime = random.randint(30, 60)
-            size = random.randint(2, 5)
+        # Use rarity color with some variation
+        color_variation = self.random_ints(-30, 30, particle_count)
+        colors = np.clip(np.add.outer(color_variation, rarity_color[:3]), 0, 255)
 
-            particle = Particle(x, y, particle_color, (vx, vy), lifetime, size)
-            self.particles.append(particle)
+        lifetimes = self.random_ints(30, 60, particle_count)
+        sizes = self.random_ints(2, 5, particle_count)
+        self.emit(x, y, vx, vy, colors, lifetimes, sizes, 'catch')
 
         # Add some sparkles for shiny
         if is_shiny:
-            for i in range(15):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(3, 8)
-                vx = math.cos(angle) * speed
-                vy = math.sin(angle) * speed - 3
+            vx, vy = self.random_velocities(15, 3, 8)
+            vy -= 3
 
-                sparkle_color = (255, 255, random.randint(200, 255))
-                lifetime = random.randint(40, 70)
-
-                particle = Particle(x, y, sparkle_color, (vx, vy), lifetime, 4)
-                self.particles.append(particle)
+            colors = np.full((15, 3), 255)
+            colors[:, 2] = self.random_ints(200, 255, 15)
+            lifetimes = self.random_ints(40, 70, 15)
+            self.emit(x, y, vx, vy, colors, lifetimes, np.full(15, 4), 'catch')
 
     def create_level_up_effect(self, x, y):
         """Create level up effect"""
-        for i in range(40):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(2, 5)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed - 3
-
-            # Golden particles
-            color = (
-                random.randint(200, 255),
-                random.randint(180, 230),
-                random.randint(0, 100)
-            )
+        vx, vy = self.random_velocities(40, 2, 5)
+        vy -= 3
 
-            lifetime = random.randint(40, 80)
-            size = random.randint(3, 6)
+        # Golden particles
+        colors = np.column_stack((
+            self.random_ints(200, 255, 40),
+            self.random_ints(180, 230, 40),
+            self.random_ints(0, 100, 40)
+        ))
 
-            particle = Particle(x, y, color, (vx, vy), lifetime, size)
-            self.particles.append(particle)
+        lifetimes = self.random_ints(40, 80, 40)
+        sizes = self.random_ints(3, 6, 40)
+        self.emit(x, y, vx, vy, colors, lifetimes, sizes, 'level_up')
 
     def create_achievement_effect(self, x, y):
         """Create achievement unlock effect"""
-        for i in range(50):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(3, 7)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed - 4
-
-            # Purple/gold particles
-            if random.random() < 0.5:
-                color = (random.randint(150, 200), random.randint(50, 100), random.randint(200, 255))
-            else:
-                color = (255, random.randint(200, 230), 0)
-
-            lifetime = random.randint(50, 90)
-            size = random.randint(3, 7)
-
-            particle = Particle(x, y, color, (vx, vy), lifetime, size)
-            self.particles.append(particle)
+        vx, vy = self.random_velocities(50, 3, 7)
+        vy -= 4
+
+        # Purple/gold particles
+        purple = np.column_stack((
+            self.random_ints(150, 200, 50),
+            self.random_ints(50, 100, 50),
+            self.random_ints(200, 255, 50)
+        ))
+        gold = np.column_stack((
+            np.full(50, 255),
+            self.random_ints(200, 230, 50),
+            np.zeros(50, dtype=np.int64)
+        ))
+        colors = np.where((self.rng.random(50) < 0.5)[:, None], purple, gold)
+
+        lifetimes = self.random_ints(50, 90, 50)
+        sizes = self.random_ints(3, 7, 50)
+        self.emit(x, y, vx, vy, colors, lifetimes, sizes, 'achievement')
 
     def create_water_splash(self, x, y):
         """Create water splash when casting"""
-        for i in range(15):
-            angle = random.uniform(-math.pi / 3, -2 * math.pi / 3)  # Upward arc
-            speed = random.uniform(3, 6)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
+        vx, vy = self.random_velocities(15, 3, 6, -2 * math.pi / 3, -math.pi / 3)  # Upward arc
 
-            # Water blue color
-            color = (
-                random.randint(70, 120),
-                random.randint(140, 180),
-                random.randint(200, 255)
-            )
+        # Water blue color
+        colors = np.column_stack((
+            self.random_ints(70, 120, 15),
+            self.random_ints(140, 180, 15),
+            self.random_ints(200, 255, 15)
+        ))
 
-            lifetime = random.randint(20, 40)
-            size = random.randint(2, 4)
-
-            particle = Particle(x, y, color, (vx, vy), lifetime, size)
-            self.particles.append(particle)
+        lifetimes = self.random_ints(20, 40, 15)
+        sizes = self.random_ints(2, 4, 15)
+        self.emit(x, y, vx, vy, colors, lifetimes, sizes, 'splash')
 
     def create_bobber_ripple(self, x, y):
         """Create small ripple around bobber"""
-        for i in range(5):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(0.5, 1.5)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed * 0.3  # Flatter
-
-            color = (100, 150, 200)
-            lifetime = random.randint(15, 30)
-            size = 2
+        vx, vy = self.random_velocities(5, 0.5, 1.5)
+        vy *= 0.3  # Flatter
 
-            particle = Particle(x, y, color, (vx, vy), lifetime, size)
-            self.particles.append(particle)
+        colors = np.tile((100, 150, 200), (5, 1))
+        lifetimes = self.random_ints(15, 30, 5)
+        self.emit(x, y, vx, vy, colors, lifetimes, np.full(5, 2), 'ripple')
 
     def create_stars(self, x, y, count=5):
         """Create star particles (for special catches)"""
-        for i in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(1, 3)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed - 2
+        vx, vy = self.random_velocities(count, 1, 3)
+        vy -= 2
 
-            color = (255, 255, random.randint(150, 255))
-            lifetime = random.randint(40, 60)
-            size = random.randint(4, 6)
-
-            particle = Particle(x, y, color, (vx, vy), lifetime, size)
-            self.particles.append(particle)
+        colors = np.full((count, 3), 255)
+        colors[:, 2] = self.random_ints(150, 255, count)
+        lifetimes = self.random_ints(40, 60, count)
+        sizes = self.random_ints(4, 6, count)
+        self.emit(x, y, vx, vy, colors, lifetimes, sizes, 'stars')
 
     def update(self):
         """Update all particles"""
-        for particle in self.particles:
-            particle.update()
+        self.ticks += 1
+        if self.count == 0:
+            return
+
+        live = slice(0, self.count)
+        self.x[live] += self.vx[live]
+        self.y[live] += self.vy[live]
+        self.vy[live] += self.gravity  # Apply gravity
+        self.lifetime[live] -= 1
+
+        # Remove dead particles, packing the survivors to the front
+        self.keep_rows(np.flatnonzero(self.lifetime[live] > 0))
+
+    def get_draw_key(self):
+        """Get a value that changes whenever draw() would draw something different"""
+        return (self.ticks, self.interpolation) if self.count else 0
 
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p.is_alive()]
+    def get_alphas(self):
+        """Get the fade-out alpha of every live particle"""
+        live = slice(0, self.count)
+        return 255 * self.lifetime[live] // self.max_lifetime[live]
 
     def draw(self, screen):
-        """Draw all particles"""
-        for particle in self.particles:
-            particle.draw(screen)
+        """Draw all particles as one batch of cached sprites"""
+        if self.count == 0:
+            return
+
+        live = slice(0, self.count)
+        sizes = self.size[live]
+        sprites = self.sprite_cache.get_sprites(sizes, self.color[live], self.get_alphas())
+
+        # Draw between the last two ticks: undo the part of the last step not yet due
+        lag = 1.0 - self.interpolation
+        left = (self.x[live] - self.vx[live] * lag - sizes).astype(np.int64)
+        top = (self.y[live] - (self.vy[live] - self.gravity) * lag - sizes).astype(np.int64)
+        screen.blits(zip(sprites, zip(left.tolist(), top.tolist())), False)
+
+        # Dirty region is the bounding box of all sprites, clipped like blit rects
+        bounds = pygame.Rect(int(left.min()), int(top.min()),
+                             int((left + 2 * sizes).max() - left.min()), int((top + 2 * sizes).max() - top.min()))
+        self.dirty.add(bounds.clip(screen.get_rect()) or None, self.get_draw_key())
+
+    def get_stats(self):
+        """Get pool usage, overflow counters and sprite cache stats"""
+        per_emitter = np.bincount(self.emitter[:self.count], minlength=len(EMITTERS))
+        return {
+            'particles': self.count,
+            'capacity': self.capacity,
+            'emitters': dict(zip(EMITTERS, per_emitter.tolist())),
+            'dropped': self.dropped,
+            'rejected': self.rejected,
+            'sprites': self.sprite_cache.get_stats()
+        }
 
     def clear(self):
         """Clear all particles"""
-        self.particles.clear()
+        self.count = 0
 
 
 class FloatingText:
     """Floating text effect (for damage numbers, etc.)"""
 
-    def __init__(self, x, y, text, color, duration=60, rise_speed=1):
+    def __init__(self, x, y, text, color, duration=60, rise_speed=1, font=None):
+        self.font = font or get_font(scaled(36))
+        self.spawn(x, y, text, color, duration, rise_speed)
+
+    def spawn(self, x, y, text, color, duration=60, rise_speed=1):
+        """(Re)start the effect; the outlined text is rendered once here"""
         self.x = x
         self.y = y
         self.text = text
         self.color = color
         self.duration = duration
         self.max_duration = duration
-        self.rise_speed = rise_speed
+        self.rise_speed = rise_speed * LAYOUT_SCALE
         self.alpha = 255
-        self.font = pygame.font.Font(None, 36)
+        self.surface = render_text(self.font, text, color, (0, 0, 0), TEXT_OUTLINE_OFFSETS)
 
     def update(self):
         """Update position and lifetime"""
@@ -215,26 +374,16 @@ class FloatingText:
         self.duration -= 1
         self.alpha = int(255 * (self.duration / self.max_duration))
 
-    def draw(self, screen):
-        """Draw the floating text"""
+    def draw(self, screen, interpolation=1.0):
+        """Draw the floating text (interpolation = fraction of the last rise to show)"""
         if self.duration > 0:
-            # Render text with outline
-            text_surf = self.font.render(self.text, True, self.color)
-
-            # Create surface with alpha
-            alpha_surf = pygame.Surface(text_surf.get_size(), pygame.SRCALPHA)
-            alpha_surf.blit(text_surf, (0, 0))
-            alpha_surf.set_alpha(self.alpha)
-
-            # Draw outline
-            outline_surf = self.font.render(self.text, True, (0, 0, 0))
-            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                outline_alpha = pygame.Surface(outline_surf.get_size(), pygame.SRCALPHA)
-                outline_alpha.blit(outline_surf, (0, 0))
-                outline_alpha.set_alpha(self.alpha)
-                screen.blit(outline_alpha, (int(self.x + dx), int(self.y + dy)))
-
-            screen.blit(alpha_surf, (int(self.x), int(self.y)))
+            # Only position and fade change; the surface may be shared, so restore its alpha
+            self.surface.set_alpha(self.alpha)
+            y = self.y + self.rise_speed * (1.0 - interpolation)
+            rect = screen.blit(self.surface, (int(self.x) - 1, int(y) - 1))  # Outline pads 1px
+            self.surface.set_alpha(None)
+            return rect
+        return None
 
     def is_alive(self):
         """Check if text is still visible"""
@@ -242,14 +391,25 @@ class FloatingText:
 
 
 class FloatingTextSystem:
-    """Manages floating text effects"""
+    """Manages floating text effects, reusing finished texts"""
 
     def __init__(self):
         self.texts = []
+        self.pool = []  # Finished texts ready to be spawned again
+        self.font = get_font(scaled(36))  # Shared by every text
+
+        # Regions changed since last frame (dirty-rect rendering)
+        self.dirty = DirtyTracker()
+        self.ticks = 0  # Updates so far; texts rise and fade every tick
+        self.interpolation = 1.0  # Fraction of a tick since the last update (set by the game)
 
     def add_text(self, x, y, text, color, duration=60, rise_speed=1):
         """Add a new floating text"""
-        floating_text = FloatingText(x, y, text, color, duration, rise_speed)
+        if self.pool:
+            floating_text = self.pool.pop()
+            floating_text.spawn(x, y, text, color, duration, rise_speed)
+        else:
+            floating_text = FloatingText(x, y, text, color, duration, rise_speed, self.font)
         self.texts.append(floating_text)
 
     def add_exp_text(self, x, y, exp_amount):
@@ -262,17 +422,29 @@ class FloatingTextSystem:
 
     def update(self):
         """Update all floating texts"""
+        self.ticks += 1
+
+        # Compact live texts in place and return finished ones to the pool
+        live = 0
         for text in self.texts:
             text.update()
+            if text.is_alive():
+                self.texts[live] = text
+                live += 1
+            else:
+                self.pool.append(text)
+        del self.texts[live:]
 
-        # Remove dead texts
-        self.texts = [t for t in self.texts if t.is_alive()]
+    def get_draw_key(self):
+        """Get a value that changes whenever draw() would draw something different"""
+        return (self.ticks, self.interpolation) if self.texts else 0
 
     def draw(self, screen):
         """Draw all floating texts"""
-        for text in self.texts:
-            text.draw(screen)
+        drawn = [text.draw(screen, self.interpolation) for text in self.texts]
+        self.dirty.add(union_rects(drawn), self.get_draw_key())
 
     def clear(self):
         """Clear all texts"""
+        self.pool.extend(self.texts)
         self.texts.clear()
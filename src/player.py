@@ -1,21 +1,162 @@
+import os
+from collections import deque
 import pygame
 import random
 import math
 from settings import (WOOPER_BLUE, WOOPER_DARK_BLUE, WOOPER_PINK, SCREEN_WIDTH, SCREEN_HEIGHT,
-                      BITE_WINDOW_FRAMES, FAILED_MESSAGE_DURATION)
+                      BITE_WINDOW_FRAMES, FAILED_MESSAGE_DURATION, WOOPER_SPRITE_SHEET,
+                      WOOPER_ANIMATION_FRAMES, CATCH_LOG_SIZE, SIMULATION_RATE)
+from render import DirtyTracker, union_rects
+from utils import scaled, load_sprite_sheet
+from fonts import get_font, render_text
+
+# Wooper frame sets: one row of animation frames per direction
+WOOPER_DIRECTIONS = ('down', 'up', 'left', 'right')
+WOOPER_BASE_SIZE = 32  # Pixel art size before scaling
+_wooper_frames = {}  # Render size -> {direction: [frames]}
+
+
+def draw_wooper(s):
+    """Draw Wooper onto a 32x32 surface using proper pixel art technique - hand-placed pixels"""
+    s.fill((0, 0, 0, 0))
+
+    # Authentic Wooper color palette
+    c1 = (79, 164, 210)   # Body blue
+    c2 = (47, 116, 163)   # Dark blue (outline/shadow)
+    c3 = (140, 200, 235)  # Light blue (highlights)
+    c4 = (160, 215, 240)  # Belly blue
+    c5 = (255, 128, 171)  # Pink gills
+    c6 = (255, 180, 200)  # Light pink
+    c7 = (20, 20, 30)     # Eye black
+    c8 = (255, 255, 255)  # White
+
+    # Pixel art - draw each pixel deliberately for clean sprite
+    # This creates a 32x32 Wooper sprite with proper pixel art technique
+    pixels = [
+        # Format: (x, y, color)
+        # Row 1-3: Head top
+        (14, 4, c2), (15, 4, c2), (16, 4, c2), (17, 4, c2),
+        (13, 5, c2), (14, 5, c3), (15, 5, c1), (16, 5, c1), (17, 5, c3), (18, 5, c2),
+        (12, 6, c2), (13, 6, c1), (14, 6, c1), (15, 6, c1), (16, 6, c1), (17, 6, c1), (18, 6, c1), (19, 6, c2),
+
+        # Row 4-5: Upper head with gills
+        (11, 7, c2), (12, 7, c1), (13, 7, c1), (14, 7, c1), (15, 7, c1), (16, 7, c1), (17, 7, c1), (18, 7, c1), (19, 7, c1), (20, 7, c2),
+        (10, 8, c2), (11, 8, c1), (12, 8, c1), (13, 8, c4), (14, 8, c4), (15, 8, c4), (16, 8, c4), (17, 8, c4), (18, 8, c1), (19, 8, c1), (20, 8, c2),
+
+        # Left gill top
+        (7, 8, c5), (8, 8, c6), (9, 8, c2),
+        (6, 9, c5), (7, 9, c6), (8, 9, c5), (9, 9, c2),
+
+        # Right gill top
+        (22, 8, c2), (23, 8, c6), (24, 8, c5),
+        (22, 9, c2), (23, 9, c5), (24, 9, c6), (25, 9, c5),
+
+        # Row 6: Eyes and gills
+        (9, 9, c2), (10, 9, c1), (11, 9, c1), (12, 9, c4), (13, 9, c4), (14, 9, c4), (15, 9, c4), (16, 9, c4), (17, 9, c4), (18, 9, c4), (19, 9, c1), (20, 9, c1), (21, 9, c1), (22, 9, c2),
+
+        # Row 7-8: Eyes
+        (9, 10, c2), (10, 10, c1), (11, 10, c8), (12, 10, c8), (13, 10, c4), (14, 10, c4), (15, 10, c4), (16, 10, c4), (17, 10, c4), (18, 10, c4), (19, 10, c8), (20, 10, c8), (21, 10, c1), (22, 10, c2),
+        (9, 11, c2), (10, 11, c1), (11, 11, c8), (12, 11, c7), (13, 11, c4), (14, 11, c4), (15, 11, c4), (16, 11, c4), (17, 11, c4), (18, 11, c4), (19, 11, c7), (20, 11, c8), (21, 11, c1), (22, 11, c2),
+
+        # Left gill middle
+        (6, 11, c5), (7, 11, c6), (8, 11, c2),
+        (5, 12, c5), (6, 12, c6), (7, 12, c5), (8, 12, c2),
+
+        # Right gill middle
+        (23, 11, c2), (24, 11, c6), (25, 11, c5),
+        (23, 12, c2), (24, 12, c5), (25, 12, c6), (26, 12, c5),
+
+        # Row 9-10: Mouth area
+        (9, 12, c2), (10, 12, c1), (11, 12, c1), (12, 12, c1), (13, 12, c4), (14, 12, c4), (15, 12, c4), (16, 12, c4), (17, 12, c4), (18, 12, c1), (19, 12, c1), (20, 12, c1), (21, 12, c1), (22, 12, c2),
+        (9, 13, c2), (10, 13, c1), (11, 13, c1), (12, 13, c1), (13, 13, c1), (14, 13, c4), (15, 13, c4), (16, 13, c4), (17, 13, c1), (18, 13, c1), (19, 13, c1), (20, 13, c1), (21, 13, c1), (22, 13, c2),
+
+        # Row 11-12: Lower mouth with smile
+        (10, 14, c2), (11, 14, c1), (12, 14, c1), (13, 14, c1), (14, 14, c1), (15, 14, c1), (16, 14, c1), (17, 14, c1), (18, 14, c1), (19, 14, c1), (20, 14, c1), (21, 14, c2),
+        (10, 15, c2), (11, 15, c1), (12, 15, c2), (13, 15, c1), (14, 15, c1), (15, 15, c1), (16, 15, c1), (17, 15, c1), (18, 15, c2), (19, 15, c1), (20, 15, c2),
+
+        # Left gill bottom
+        (5, 14, c5), (6, 14, c6), (7, 14, c2),
+        (6, 15, c5), (7, 15, c6), (8, 15, c2),
+
+        # Right gill bottom
+        (24, 14, c2), (25, 14, c6), (26, 14, c5),
+        (23, 15, c2), (24, 15, c6), (25, 15, c5),
+
+        # Row 13-16: Body tapering to tail
+        (10, 16, c2), (11, 16, c1), (12, 16, c1), (13, 16, c1), (14, 16, c1), (15, 16, c1), (16, 16, c1), (17, 16, c1), (18, 16, c1), (19, 16, c1), (20, 16, c2),
+        (11, 17, c2), (12, 17, c1), (13, 17, c1), (14, 17, c2), (15, 17, c2), (16, 17, c2), (17, 17, c2), (18, 17, c1), (19, 17, c2),
+        (11, 18, c2), (12, 18, c1), (13, 18, c1), (14, 18, c1), (15, 18, c1), (16, 18, c1), (17, 18, c1), (18, 18, c2),
+        (12, 19, c2), (13, 19, c1), (14, 19, c1), (15, 19, c1), (16, 19, c1), (17, 19, c2),
+
+        # Row 17-20: Tail
+        (12, 20, c2), (13, 20, c1), (14, 20, c1), (15, 20, c1), (16, 20, c1), (17, 20, c2),
+        (13, 21, c2), (14, 21, c1), (15, 21, c1), (16, 21, c2),
+        (13, 22, c2), (14, 22, c1), (15, 22, c1), (16, 22, c2),
+        (14, 23, c2), (15, 23, c2),
+
+        # Tail fins
+        (11, 21, c1), (12, 21, c2), (17, 21, c2), (18, 21, c1),
+        (10, 22, c1), (11, 22, c2), (17, 22, c2), (18, 22, c1),
+        (10, 23, c1), (11, 23, c2), (17, 23, c2), (18, 23, c1),
+        (11, 24, c2), (17, 24, c2),
+    ]
+
+    # Draw all pixels
+    for x, y, color in pixels:
+        s.set_at((x, y), color)
+
+    # Add eye highlights (single white pixels)
+    s.set_at((11, 10), c8)  # Left eye highlight
+    s.set_at((19, 10), c8)  # Right eye highlight
+
+
+def bake_wooper_frames():
+    """Draw the pixel art frames at base size (every direction shares the same art)"""
+    base = pygame.Surface((WOOPER_BASE_SIZE, WOOPER_BASE_SIZE), pygame.SRCALPHA)
+    draw_wooper(base)
+    return {direction: [base] * WOOPER_ANIMATION_FRAMES for direction in WOOPER_DIRECTIONS}
+
+
+def get_wooper_frames(size):
+    """Get the Wooper frames at a render size, built once (from the sprite sheet if one is set)"""
+    frames = _wooper_frames.get(size)
+    if frames is None:
+        if WOOPER_SPRITE_SHEET and os.path.exists(WOOPER_SPRITE_SHEET):
+            rows = load_sprite_sheet(WOOPER_SPRITE_SHEET, (WOOPER_BASE_SIZE, WOOPER_BASE_SIZE))
+            # Directions missing from the sheet reuse its last row
+            base_frames = {direction: rows[min(i, len(rows) - 1)] for i, direction in enumerate(WOOPER_DIRECTIONS)}
+        else:
+            base_frames = bake_wooper_frames()
+
+        # Scale up to actual size using NEAREST for crisp pixels; shared base frames stay shared
+        scaled_frames = {}
+        frames = {}
+        for direction, row in base_frames.items():
+            frames[direction] = []
+            for base in row:
+                if id(base) not in scaled_frames:
+                    image = pygame.transform.scale(base, (size, size))
+                    if pygame.display.get_surface() is not None:
+                        image = image.convert_alpha()
+                    scaled_frames[id(base)] = image
+                frames[direction].append(scaled_frames[id(base)])
+        _wooper_frames[size] = frames
+    return frames
+
 
 class Player(pygame.sprite.Sprite):
     def __init__(self):
         super().__init__()
         from settings import TILE_SIZE, PLAYER_SPEED
         self.size = TILE_SIZE
-        # Create base sprite at 32x32, then scale up
-        self.base_size = 32
-        self.base_image = pygame.Surface((self.base_size, self.base_size), pygame.SRCALPHA)
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        self.rect = self.image.get_rect(topleft=(200, 400))
+        # Pre-baked frames (32x32 pixel art scaled up once); animating just switches frames
+        self.frames = get_wooper_frames(self.size)
+        self.image = self.frames['down'][0]
+        self.rect = self.image.get_rect(topleft=(scaled(200), scaled(400)))
+        self.previous_pos = self.rect.topleft  # Position before the last tick
+        self.interpolation = 1.0  # Fraction of a tick since the last update (set by the game)
         self.speed = PLAYER_SPEED
-        self.collection = []
+        self.catch_log = deque(maxlen=CATCH_LOG_SIZE)  # Most recent CatchRecords
 
         # Direction facing (for Pokemon-style sprites)
         self.direction = 'down'  # up, down, left, right
@@ -25,10 +166,10 @@ class Player(pygame.sprite.Sprite):
         self.move_progress = 0
         self.animation_frame = 0
         self.animation_timer = 0
-        self.frame_duration = 8  # Frames per animation step
+        self.frame_duration = 8  # Ticks per animation step
 
-        # Draw initial sprite
-        self.draw_wooper()
+        # Show initial frame
+        self.update_image()
 
         # Fishing states: 'idle', 'casting', 'waiting', 'bite', 'reeling'
         self.fishing_state = 'idle'
@@ -36,110 +177,22 @@ class Player(pygame.sprite.Sprite):
         self.bobber_bob = 0
         self.cast_progress = 0
         self.bite_timer = 0
-        self.max_bite_time = random.randint(120, 300)
+        self.max_bite_time = random.randint(2 * SIMULATION_RATE, 5 * SIMULATION_RATE)
         self.bite_notification_timer = 0
 
         # Rod modifier (set by main game)
         self.rod_bite_speed_mult = 1.0
 
-    def draw_wooper(self):
-        """Draw Wooper using proper pixel art technique - hand-placed pixels"""
-        s = self.base_image
-        s.fill((0, 0, 0, 0))
-
-        # Authentic Wooper color palette
-        c1 = (79, 164, 210)   # Body blue
-        c2 = (47, 116, 163)   # Dark blue (outline/shadow)
-        c3 = (140, 200, 235)  # Light blue (highlights)
-        c4 = (160, 215, 240)  # Belly blue
-        c5 = (255, 128, 171)  # Pink gills
-        c6 = (255, 180, 200)  # Light pink
-        c7 = (20, 20, 30)     # Eye black
-        c8 = (255, 255, 255)  # White
-
-        # Pixel art - draw each pixel deliberately for clean sprite
-        # This creates a 32x32 Wooper sprite with proper pixel art technique
-        pixels = [
-            # Format: (x, y, color)
-            # Row 1-3: Head top
-            (14, 4, c2), (15, 4, c2), (16, 4, c2), (17, 4, c2),
-            (13, 5, c2), (14, 5, c3), (15, 5, c1), (16, 5, c1), (17, 5, c3), (18, 5, c2),
-            (12, 6, c2), (13, 6, c1), (14, 6, c1), (15, 6, c1), (16, 6, c1), (17, 6, c1), (18, 6, c1), (19, 6, c2),
-
-            # Row 4-5: Upper head with gills
-            (11, 7, c2), (12, 7, c1), (13, 7, c1), (14, 7, c1), (15, 7, c1), (16, 7, c1), (17, 7, c1), (18, 7, c1), (19, 7, c1), (20, 7, c2),
-            (10, 8, c2), (11, 8, c1), (12, 8, c1), (13, 8, c4), (14, 8, c4), (15, 8, c4), (16, 8, c4), (17, 8, c4), (18, 8, c1), (19, 8, c1), (20, 8, c2),
-
-            # Left gill top
-            (7, 8, c5), (8, 8, c6), (9, 8, c2),
-            (6, 9, c5), (7, 9, c6), (8, 9, c5), (9, 9, c2),
-
-            # Right gill top
-            (22, 8, c2), (23, 8, c6), (24, 8, c5),
-            (22, 9, c2), (23, 9, c5), (24, 9, c6), (25, 9, c5),
-
-            # Row 6: Eyes and gills
-            (9, 9, c2), (10, 9, c1), (11, 9, c1), (12, 9, c4), (13, 9, c4), (14, 9, c4), (15, 9, c4), (16, 9, c4), (17, 9, c4), (18, 9, c4), (19, 9, c1), (20, 9, c1), (21, 9, c1), (22, 9, c2),
-
-            # Row 7-8: Eyes
-            (9, 10, c2), (10, 10, c1), (11, 10, c8), (12, 10, c8), (13, 10, c4), (14, 10, c4), (15, 10, c4), (16, 10, c4), (17, 10, c4), (18, 10, c4), (19, 10, c8), (20, 10, c8), (21, 10, c1), (22, 10, c2),
-            (9, 11, c2), (10, 11, c1), (11, 11, c8), (12, 11, c7), (13, 11, c4), (14, 11, c4), (15, 11, c4), (16, 11, c4), (17, 11, c4), (18, 11, c4), (19, 11, c7), (20, 11, c8), (21, 11, c1), (22, 11, c2),
-
-            # Left gill middle
-            (6, 11, c5), (7, 11, c6), (8, 11, c2),
-            (5, 12, c5), (6, 12, c6), (7, 12, c5), (8, 12, c2),
-
-            # Right gill middle
-            (23, 11, c2), (24, 11, c6), (25, 11, c5),
-            (23, 12, c2), (24, 12, c5), (25, 12, c6), (26, 12, c5),
-
-            # Row 9-10: Mouth area
-            (9, 12, c2), (10, 12, c1), (11, 12, c1), (12, 12, c1), (13, 12, c4), (14, 12, c4), (15, 12, c4), (16, 12, c4), (17, 12, c4), (18, 12, c1), (19, 12, c1), (20, 12, c1), (21, 12, c1), (22, 12, c2),
-            (9, 13, c2), (10, 13, c1), (11, 13, c1), (12, 13, c1), (13, 13, c1), (14, 13, c4), (15, 13, c4), (16, 13, c4), (17, 13, c1), (18, 13, c1), (19, 13, c1), (20, 13, c1), (21, 13, c1), (22, 13, c2),
-
-            # Row 11-12: Lower mouth with smile
-            (10, 14, c2), (11, 14, c1), (12, 14, c1), (13, 14, c1), (14, 14, c1), (15, 14, c1), (16, 14, c1), (17, 14, c1), (18, 14, c1), (19, 14, c1), (20, 14, c1), (21, 14, c2),
-            (10, 15, c2), (11, 15, c1), (12, 15, c2), (13, 15, c1), (14, 15, c1), (15, 15, c1), (16, 15, c1), (17, 15, c1), (18, 15, c2), (19, 15, c1), (20, 15, c2),
-
-            # Left gill bottom
-            (5, 14, c5), (6, 14, c6), (7, 14, c2),
-            (6, 15, c5), (7, 15, c6), (8, 15, c2),
-
-            # Right gill bottom
-            (24, 14, c2), (25, 14, c6), (26, 14, c5),
-            (23, 15, c2), (24, 15, c6), (25, 15, c5),
-
-            # Row 13-16: Body tapering to tail
-            (10, 16, c2), (11, 16, c1), (12, 16, c1), (13, 16, c1), (14, 16, c1), (15, 16, c1), (16, 16, c1), (17, 16, c1), (18, 16, c1), (19, 16, c1), (20, 16, c2),
-            (11, 17, c2), (12, 17, c1), (13, 17, c1), (14, 17, c2), (15, 17, c2), (16, 17, c2), (17, 17, c2), (18, 17, c1), (19, 17, c2),
-            (11, 18, c2), (12, 18, c1), (13, 18, c1), (14, 18, c1), (15, 18, c1), (16, 18, c1), (17, 18, c1), (18, 18, c2),
-            (12, 19, c2), (13, 19, c1), (14, 19, c1), (15, 19, c1), (16, 19, c1), (17, 19, c2),
-
-            # Row 17-20: Tail
-            (12, 20, c2), (13, 20, c1), (14, 20, c1), (15, 20, c1), (16, 20, c1), (17, 20, c2),
-            (13, 21, c2), (14, 21, c1), (15, 21, c1), (16, 21, c2),
-            (13, 22, c2), (14, 22, c1), (15, 22, c1), (16, 22, c2),
-            (14, 23, c2), (15, 23, c2),
-
-            # Tail fins
-            (11, 21, c1), (12, 21, c2), (17, 21, c2), (18, 21, c1),
-            (10, 22, c1), (11, 22, c2), (17, 22, c2), (18, 22, c1),
-            (10, 23, c1), (11, 23, c2), (17, 23, c2), (18, 23, c1),
-            (11, 24, c2), (17, 24, c2),
-        ]
-
-        # Draw all pixels
-        for x, y, color in pixels:
-            s.set_at((x, y), color)
-
-        # Add eye highlights (single white pixels)
-        s.set_at((11, 10), c8)  # Left eye highlight
-        s.set_at((19, 10), c8)  # Right eye highlight
-
-        # Scale up to actual size using NEAREST for crisp pixels
-        self.image = pygame.transform.scale(self.base_image, (self.size, self.size))
+        # Regions changed since last frame (dirty-rect rendering)
+        self.dirty = DirtyTracker()
+
+    def update_image(self):
+        """Switch to the frame for the current direction and animation step"""
+        self.image = self.frames[self.direction][self.animation_frame]
 
     def update(self):
+        self.previous_pos = self.rect.topleft
+
         # Only allow movement when not actively fishing
         was_moving = self.moving
         self.moving = False
@@ -165,22 +218,22 @@ class Player(pygame.sprite.Sprite):
                 self.direction = 'right'
                 self.moving = True
 
-        # Keep player on land/grass area only (below water) - scaled for 1080p
-        self.rect.x = max(20, min(self.rect.x, SCREEN_WIDTH - self.rect.width - 20))
-        self.rect.y = max(570, min(self.rect.y, SCREEN_HEIGHT - self.rect.height - 20))
+        # Keep player on land/grass area only (below water) - scaled to render size
+        margin = scaled(20)
+        self.rect.x = max(margin, min(self.rect.x, SCREEN_WIDTH - self.rect.width - margin))
+        self.rect.y = max(scaled(570), min(self.rect.y, SCREEN_HEIGHT - self.rect.height - margin))
 
         # Update animation
         if self.moving:
             self.animation_timer += 1
             if self.animation_timer >= self.frame_duration:
                 self.animation_timer = 0
-                self.animation_frame = (self.animation_frame + 1) % 2
-                self.draw_wooper()  # Redraw with new frame
+                self.animation_frame = (self.animation_frame + 1) % len(self.frames[self.direction])
         elif was_moving:
             # Just stopped moving - reset to idle frame
             self.animation_frame = 0
             self.animation_timer = 0
-            self.draw_wooper()
+        self.update_image()
 
         # Update fishing mechanics
         self.update_fishing()
@@ -191,20 +244,20 @@ class Player(pygame.sprite.Sprite):
             # Animate bobber being cast
             self.cast_progress += 8
             if self.cast_progress >= 100:
-                # Bobber always lands in water (upward into water zone) - scaled for 1080p
+                # Bobber always lands in water (upward into water zone) - scaled to render size
                 # Find a spot in the water relative to player position
-                bobber_x = self.rect.centerx + random.randint(-80, 80)
-                bobber_y = random.randint(100, 500)  # Anywhere in water zone
+                bobber_x = self.rect.centerx + random.randint(-scaled(80), scaled(80))
+                bobber_y = random.randint(scaled(100), scaled(500))  # Anywhere in water zone
 
                 self.bobber_pos = [bobber_x, bobber_y]
 
                 # Keep bobber in water bounds
-                self.bobber_pos[0] = max(100, min(self.bobber_pos[0], SCREEN_WIDTH - 100))
+                self.bobber_pos[0] = max(scaled(100), min(self.bobber_pos[0], SCREEN_WIDTH - scaled(100)))
 
                 self.fishing_state = 'waiting'
                 self.bite_timer = 0
                 # Apply rod bite speed modifier (lower = faster bites)
-                base_bite_time = random.randint(60, 180)  # 1-3 seconds
+                base_bite_time = random.randint(SIMULATION_RATE, 3 * SIMULATION_RATE)  # 1-3 seconds
                 self.max_bite_time = int(base_bite_time * self.rod_bite_speed_mult)
                 self.cast_progress = 0
 
@@ -213,8 +266,9 @@ class Player(pygame.sprite.Sprite):
             self.bite_timer += 1
             self.bobber_bob += 0.1
 
-            # Dot animation every 30 frames
-            if self.bite_timer % 30 == 0 and self.bite_timer < self.max_bite_time - 30:
+            # Dot animation every half second
+            dot_ticks = SIMULATION_RATE // 2
+            if self.bite_timer % dot_ticks == 0 and self.bite_timer < self.max_bite_time - dot_ticks:
                 pass  # Will show dots in UI
 
             if self.bite_timer >= self.max_bite_time:
@@ -257,13 +311,20 @@ class Player(pygame.sprite.Sprite):
         self.bite_timer = 0
         self.bite_notification_timer = 0
 
-    def add_to_collection(self, fish):
-        """Add caught fish to collection"""
-        self.collection.append(fish)
+    def log_catch(self, record):
+        """Remember a catch (oldest records drop off once the log is full)"""
+        self.catch_log.append(record)
+
+    def get_draw_pos(self):
+        """Get the on-screen position, between the last two ticks"""
+        (x0, y0), (x1, y1) = self.previous_pos, self.rect.topleft
+        t = self.interpolation
+        return (round(x0 + (x1 - x0) * t), round(y0 + (y1 - y0) * t))
 
     def draw(self, screen):
         """Draw Wooper only (no bobber)"""
-        screen.blit(self.image, self.rect)
+        rect = screen.blit(self.image, self.get_draw_pos())
+        self.dirty.add(rect, (self.direction, self.animation_frame))
 
     def draw_fishing_elements(self, screen):
         """Draw fishing rod, line, and bobber - call this after UI to prevent clipping"""
@@ -273,38 +334,39 @@ class Player(pygame.sprite.Sprite):
             rod_start = (self.rect.centerx, self.rect.top)
 
             if self.fishing_state == 'casting':
-                # Show casting animation - line extends upward (scaled for 1080p)
-                cast_dist = int(self.cast_progress * 4)
+                # Show casting animation - line extends upward (scaled to render size)
+                cast_dist = scaled(self.cast_progress * 4)
                 line_end = (rod_start[0], rod_start[1] - cast_dist)
 
                 # Casting line (thicker for 1080p)
-                pygame.draw.line(screen, (200, 200, 200), rod_start, line_end, 4)
+                drawn = [pygame.draw.line(screen, (200, 200, 200), rod_start, line_end, max(1, scaled(4)))]
 
             elif self.bobber_pos:
                 # Draw fishing line to bobber in water (thicker for 1080p)
-                pygame.draw.line(screen, (200, 200, 200), rod_start, self.bobber_pos, 3)
+                drawn = [pygame.draw.line(screen, (200, 200, 200), rod_start, self.bobber_pos, max(1, scaled(3)))]
 
-                # Draw bobber floating in water (scaled for 1080p)
-                bobber_y_offset = int(4 * math.sin(self.bobber_bob))
+                # Draw bobber floating in water (scaled to render size)
+                bobber_y_offset = int(scaled(4) * math.sin(self.bobber_bob))
                 if self.fishing_state == 'bite':
-                    bobber_y_offset = int(10 * math.sin(self.bobber_bob * 3))  # More dramatic bob
+                    bobber_y_offset = int(scaled(10) * math.sin(self.bobber_bob * 3))  # More dramatic bob
 
                 bobber_pos = (self.bobber_pos[0], self.bobber_pos[1] + bobber_y_offset)
 
                 # Bobber (Pokemon-style - red and white, larger for 1080p)
-                pygame.draw.circle(screen, (255, 255, 255), bobber_pos, 12)
-                pygame.draw.circle(screen, (255, 50, 50), (bobber_pos[0], bobber_pos[1] - 4), 8)
+                drawn.append(pygame.draw.circle(screen, (255, 255, 255), bobber_pos, scaled(12)))
+                pygame.draw.circle(screen, (255, 50, 50), (bobber_pos[0], bobber_pos[1] - scaled(4)), scaled(8))
                 # Add highlight for 3D effect
-                pygame.draw.circle(screen, (255, 180, 180), (bobber_pos[0] - 2, bobber_pos[1] - 6), 3)
+                pygame.draw.circle(screen, (255, 180, 180),
+                                   (bobber_pos[0] - scaled(2), bobber_pos[1] - scaled(6)), scaled(3))
 
                 # Draw exclamation mark if fish is biting (scaled)
                 if self.fishing_state == 'bite' and self.bite_notification_timer > 0:
-                    font = pygame.font.Font(None, 96)
-                    exclaim = font.render("!", True, (255, 255, 0))
-                    exclaim_rect = exclaim.get_rect(center=(bobber_pos[0], bobber_pos[1] - 50))
-
-                    # Draw outline for visibility (thicker)
-                    outline = font.render("!", True, (0, 0, 0))
-                    screen.blit(outline, (exclaim_rect.x + 4, exclaim_rect.y + 4))
-                    screen.blit(outline, (exclaim_rect.x - 2, exclaim_rect.y - 2))
-                    screen.blit(exclaim, exclaim_rect)
+                    # Outline for visibility (thicker) is composited into the cached surface
+                    outline_offsets = ((scaled(4), scaled(4)), (-scaled(2), -scaled(2)))
+                    exclaim = render_text(get_font(scaled(96)), "!", (255, 255, 0), (0, 0, 0), outline_offsets)
+                    exclaim_rect = exclaim.get_rect(center=(bobber_pos[0], bobber_pos[1] - scaled(50)))
+                    drawn.append(screen.blit(exclaim, exclaim_rect))
+            else:
+                drawn = []
+
+            self.dirty.add(union_rects(drawn), self.fishing_state)
@@ -1,4 +1,7 @@
 import pygame
+from render import DirtyTracker
+from utils import scaled, get_overlay
+from fonts import get_font, render_text
 
 
 class Rod:
@@ -143,83 +146,88 @@ class ProgressionUI:
     """UI for player progression and shop"""
 
     def __init__(self):
-        self.font = pygame.font.Font(None, 24)
-        self.title_font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 18)
-        self.large_font = pygame.font.Font(None, 48)
+        self.font = get_font(scaled(24))
+        self.title_font = get_font(scaled(36))
+        self.small_font = get_font(scaled(18))
+        self.large_font = get_font(scaled(48))
 
         self.selected_rod = 0  # For shop navigation
 
+        # Regions changed since last frame (dirty-rect rendering)
+        self.dirty = DirtyTracker()
+
     def draw_box(self, screen, x, y, width, height, color=(80, 60, 40)):
         """Draw a styled box"""
-        pygame.draw.rect(screen, (0, 0, 0, 50), (x + 3, y + 3, width, height))
+        pygame.draw.rect(screen, (0, 0, 0), (x + scaled(3), y + scaled(3), width, height))
         pygame.draw.rect(screen, color, (x, y, width, height))
         pygame.draw.rect(screen, (101, 67, 33), (x, y, width, height), 3)
-        pygame.draw.rect(screen, (205, 133, 63), (x + 3, y + 3, width - 6, height - 6), 1)
+        pygame.draw.rect(screen, (205, 133, 63), (x + scaled(3), y + scaled(3), width - scaled(6), height - scaled(6)), 1)
 
     def draw_level_up_notification(self, screen, new_level, screen_width):
         """Draw level up notification"""
-        notif_width = 400
-        notif_height = 100
+        notif_width = scaled(400)
+        notif_height = scaled(100)
         notif_x = screen_width // 2 - notif_width // 2
-        notif_y = 150
+        notif_y = scaled(150)
 
         # Animated glow
         import math
         pulse = abs(math.sin(pygame.time.get_ticks() / 100))
         glow_color = (int(255 * pulse), int(215 * pulse), 0)
+        glow_step = max(1, scaled(3))
+        self.dirty.add((notif_x - 4 * glow_step, notif_y - 4 * glow_step, notif_width + 8 * glow_step, notif_height + 8 * glow_step), (new_level, glow_color))
 
         # Draw glow
         for i in range(5):
-            alpha_surface = pygame.Surface((notif_width + i*6, notif_height + i*6), pygame.SRCALPHA)
+            alpha_surface = pygame.Surface((notif_width + i*2*glow_step, notif_height + i*2*glow_step), pygame.SRCALPHA)
             alpha_value = 120 - (i * 25)
             pygame.draw.rect(alpha_surface, (*glow_color, alpha_value),
-                           (0, 0, notif_width + i*6, notif_height + i*6))
-            screen.blit(alpha_surface, (notif_x - i*3, notif_y - i*3))
+                           (0, 0, notif_width + i*2*glow_step, notif_height + i*2*glow_step))
+            screen.blit(alpha_surface, (notif_x - i*glow_step, notif_y - i*glow_step))
 
         self.draw_box(screen, notif_x, notif_y, notif_width, notif_height, (60, 30, 90))
 
         # Level up text
-        level_text = self.large_font.render("LEVEL UP!", True, (255, 215, 0))
-        level_rect = level_text.get_rect(center=(notif_x + notif_width // 2, notif_y + 35))
+        level_text = render_text(self.large_font, "LEVEL UP!", (255, 215, 0))
+        level_rect = level_text.get_rect(center=(notif_x + notif_width // 2, notif_y + scaled(35)))
         screen.blit(level_text, level_rect)
 
         # New level
-        new_level_text = self.title_font.render(f"Level {new_level}", True, (255, 255, 255))
-        new_level_rect = new_level_text.get_rect(center=(notif_x + notif_width // 2, notif_y + 70))
+        new_level_text = render_text(self.title_font, f"Level {new_level}", (255, 255, 255))
+        new_level_rect = new_level_text.get_rect(center=(notif_x + notif_width // 2, notif_y + scaled(70)))
         screen.blit(new_level_text, new_level_rect)
 
     def draw_shop(self, screen, progression, player_gold, screen_width, screen_height):
         """Draw the rod shop"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(200)
-        overlay.fill((20, 20, 20))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((screen_width, screen_height), (20, 20, 20, 200)), (0, 0))
+        shop_key = ('shop', player_gold, progression.level, progression.experience,
+                    progression.current_rod.id, len(progression.owned_rods))
+        self.dirty.add((0, 0, screen_width, screen_height), shop_key)
 
         # Main shop box
-        box_width = 700
-        box_height = 500
+        box_width = scaled(700)
+        box_height = scaled(500)
         box_x = screen_width // 2 - box_width // 2
         box_y = screen_height // 2 - box_height // 2
 
         self.draw_box(screen, box_x, box_y, box_width, box_height)
 
         # Title
-        title_text = self.title_font.render("Rod Shop & Progression", True, (255, 215, 0))
-        title_rect = title_text.get_rect(center=(box_x + box_width // 2, box_y + 25))
+        title_text = render_text(self.title_font, "Rod Shop & Progression", (255, 215, 0))
+        title_rect = title_text.get_rect(center=(box_x + box_width // 2, box_y + scaled(25)))
         screen.blit(title_text, title_rect)
 
         # Player stats
-        stats_y = box_y + 60
-        level_text = self.font.render(f"Level {progression.level}", True, (144, 238, 144))
-        screen.blit(level_text, (box_x + 20, stats_y))
+        stats_y = box_y + scaled(60)
+        level_text = render_text(self.font, f"Level {progression.level}", (144, 238, 144))
+        screen.blit(level_text, (box_x + scaled(20), stats_y))
 
         # Experience bar
         exp_progress = progression.experience / progression.experience_to_next_level
-        bar_width = 250
-        bar_height = 20
-        bar_x = box_x + 120
+        bar_width = scaled(250)
+        bar_height = scaled(20)
+        bar_x = box_x + scaled(120)
         bar_y = stats_y
 
         # Background bar
@@ -230,39 +238,39 @@ class ProgressionUI:
         pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), 2)
 
         # EXP text
-        exp_text = self.small_font.render(
-            f"{progression.experience}/{progression.experience_to_next_level} EXP",
-            True, (255, 255, 255)
+        exp_text = render_text(
+            self.small_font, f"{progression.experience}/{progression.experience_to_next_level} EXP",
+            (255, 255, 255)
         )
         exp_rect = exp_text.get_rect(center=(bar_x + bar_width // 2, bar_y + bar_height // 2))
         screen.blit(exp_text, exp_rect)
 
         # Gold
-        gold_text = self.font.render(f"Gold: {player_gold}", True, (255, 215, 0))
-        screen.blit(gold_text, (box_x + box_width - 180, stats_y))
+        gold_text = render_text(self.font, f"Gold: {player_gold}", (255, 215, 0))
+        screen.blit(gold_text, (box_x + box_width - scaled(180), stats_y))
 
         # Current rod indicator
-        current_rod_text = self.small_font.render(
-            f"Equipped: {progression.current_rod.name}",
-            True, (100, 200, 255)
+        current_rod_text = render_text(
+            self.small_font, f"Equipped: {progression.current_rod.name}",
+            (100, 200, 255)
         )
-        screen.blit(current_rod_text, (box_x + 20, stats_y + 25))
+        screen.blit(current_rod_text, (box_x + scaled(20), stats_y + scaled(25)))
 
         # Divider
         pygame.draw.line(screen, (255, 215, 0),
-                        (box_x + 20, stats_y + 50),
-                        (box_x + box_width - 20, stats_y + 50), 2)
+                        (box_x + scaled(20), stats_y + scaled(50)),
+                        (box_x + box_width - scaled(20), stats_y + scaled(50)), 2)
 
         # Rod list
-        list_y = stats_y + 65
-        list_height = box_height - 160
+        list_y = stats_y + scaled(65)
+        list_height = box_height - scaled(160)
 
         # Get all rods sorted by level requirement
         sorted_rods = sorted(progression.rods.values(), key=lambda r: r.level_req)
 
         current_y = list_y
         for rod in sorted_rods:
-            if current_y + 70 > list_y + list_height:
+            if current_y + scaled(70) > list_y + list_height:
                 break
 
             # Rod entry
@@ -280,54 +288,54 @@ class ProgressionUI:
             else:
                 entry_color = (40, 40, 40)  # Gray for locked
 
-            pygame.draw.rect(screen, entry_color, (box_x + 20, current_y, box_width - 40, 65))
+            pygame.draw.rect(screen, entry_color, (box_x + scaled(20), current_y, box_width - scaled(40), scaled(65)))
 
             border_color = (100, 150, 200) if is_equipped else (80, 80, 80)
-            pygame.draw.rect(screen, border_color, (box_x + 20, current_y, box_width - 40, 65), 2)
+            pygame.draw.rect(screen, border_color, (box_x + scaled(20), current_y, box_width - scaled(40), scaled(65)), 2)
 
             # Rod name
             name_color = (255, 255, 255) if is_owned else (150, 150, 150)
-            name_text = self.font.render(rod.name, True, name_color)
-            screen.blit(name_text, (box_x + 30, current_y + 8))
+            name_text = render_text(self.font, rod.name, name_color)
+            screen.blit(name_text, (box_x + scaled(30), current_y + scaled(8)))
 
             # Level requirement
             level_req_color = (100, 200, 100) if progression.level >= rod.level_req else (200, 100, 100)
-            level_req_text = self.small_font.render(f"Lv.{rod.level_req}", True, level_req_color)
-            screen.blit(level_req_text, (box_x + box_width - 100, current_y + 8))
+            level_req_text = render_text(self.small_font, f"Lv.{rod.level_req}", level_req_color)
+            screen.blit(level_req_text, (box_x + box_width - scaled(100), current_y + scaled(8)))
 
             # Description
-            desc_text = self.small_font.render(rod.description, True, (180, 180, 180))
-            screen.blit(desc_text, (box_x + 30, current_y + 30))
+            desc_text = render_text(self.small_font, rod.description, (180, 180, 180))
+            screen.blit(desc_text, (box_x + scaled(30), current_y + scaled(30)))
 
             # Stats preview
             stats_str = f"Bite: {int(rod.bite_speed_mult*100)}% | Shiny: {int(rod.shiny_mult*100)}% | Rarity: +{int(rod.rarity_boost*100)}%"
-            stats_text = self.small_font.render(stats_str, True, (200, 200, 150))
-            screen.blit(stats_text, (box_x + 30, current_y + 47))
+            stats_text = render_text(self.small_font, stats_str, (200, 200, 150))
+            screen.blit(stats_text, (box_x + scaled(30), current_y + scaled(47)))
 
             # Cost/Status
             if is_equipped:
-                status_text = self.small_font.render("EQUIPPED", True, (100, 200, 255))
-                screen.blit(status_text, (box_x + box_width - 100, current_y + 45))
+                status_text = render_text(self.small_font, "EQUIPPED", (100, 200, 255))
+                screen.blit(status_text, (box_x + box_width - scaled(100), current_y + scaled(45)))
             elif is_owned:
-                status_text = self.small_font.render("OWNED", True, (100, 200, 100))
-                screen.blit(status_text, (box_x + box_width - 100, current_y + 30))
-                equip_text = self.small_font.render("(Click to equip)", True, (150, 150, 200))
-                screen.blit(equip_text, (box_x + box_width - 120, current_y + 47))
+                status_text = render_text(self.small_font, "OWNED", (100, 200, 100))
+                screen.blit(status_text, (box_x + box_width - scaled(100), current_y + scaled(30)))
+                equip_text = render_text(self.small_font, "(Click to equip)", (150, 150, 200))
+                screen.blit(equip_text, (box_x + box_width - scaled(120), current_y + scaled(47)))
             else:
                 cost_color = (255, 215, 0) if can_buy else (150, 150, 150)
-                cost_text = self.font.render(f"{rod.cost}g", True, cost_color)
-                screen.blit(cost_text, (box_x + box_width - 100, current_y + 30))
+                cost_text = render_text(self.font, f"{rod.cost}g", cost_color)
+                screen.blit(cost_text, (box_x + box_width - scaled(100), current_y + scaled(30)))
 
                 if not can_buy and progression.level < rod.level_req:
-                    lock_text = self.small_font.render("LOCKED", True, (200, 100, 100))
-                    screen.blit(lock_text, (box_x + box_width - 100, current_y + 50))
+                    lock_text = render_text(self.small_font, "LOCKED", (200, 100, 100))
+                    screen.blit(lock_text, (box_x + box_width - scaled(100), current_y + scaled(50)))
 
-            current_y += 70
+            current_y += scaled(70)
 
         # Instructions
-        inst_text = self.small_font.render(
-            "Press S to close | ESC to return to menu",
-            True, (180, 180, 180)
+        inst_text = render_text(
+            self.small_font, "Press S to close | ESC to return to menu",
+            (180, 180, 180)
         )
-        inst_rect = inst_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - 15))
+        inst_rect = inst_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - scaled(15)))
         screen.blit(inst_text, inst_rect)
@@ -0,0 +1,300 @@
+"""
+Rendering helpers: dirty-rectangle tracking and the layer compositor
+"""
+import time
+import pygame
+from settings import DIRTY_RECT_MODE, DIRTY_RECT_FULL_THRESHOLD, CAMERA_LAYERS
+
+
+class DirtyTracker:
+    """Tracks the screen regions a drawable touched to find what changed between frames"""
+
+    def __init__(self, enabled=DIRTY_RECT_MODE):
+        self.enabled = enabled
+        self.current = []  # (rect, key) pairs drawn this frame
+        self.previous = []  # (rect, key) pairs drawn last frame
+        self.forced = []  # Regions to report on the next collect whatever their keys
+
+    def add(self, rect, key=None):
+        """Record a drawn region; key identifies its visible content"""
+        if self.enabled and rect:
+            self.current.append((tuple(pygame.Rect(rect)), key))
+
+    def force(self, rect):
+        """Report a region as changed even though its key did not"""
+        if self.enabled and rect:
+            self.forced.append(pygame.Rect(rect))
+
+    def collect(self):
+        """Get the regions that changed since last frame and start a new frame"""
+        # Anything drawn differently (moved, new content, or no longer drawn) is dirty
+        changed = set(self.previous) ^ set(self.current)
+        self.previous = self.current
+        self.current = []
+        forced, self.forced = self.forced, []
+        return [pygame.Rect(rect) for rect, key in changed] + forced
+
+
+def union_rects(rects):
+    """Get the bounding rectangle of a list of rects (None if empty)"""
+    rects = [rect for rect in rects if rect]
+    if not rects:
+        return None
+    return pygame.Rect(rects[0]).unionall(rects[1:])
+
+
+def merge_rects(rects, bounds, full_threshold=DIRTY_RECT_FULL_THRESHOLD):
+    """Clip and merge overlapping rects; use the full bounds once most of it changed"""
+    bounds = pygame.Rect(bounds)
+    merged = []
+
+    for rect in rects:
+        rect = pygame.Rect(rect).clip(bounds)
+        if rect.width == 0 or rect.height == 0:
+            continue
+
+        # Absorb every merged rect this one overlaps (the union may overlap more)
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+
+    changed_area = sum(rect.width * rect.height for rect in merged)
+    if changed_area >= bounds.width * bounds.height * full_threshold:
+        return [bounds]
+    return merged
+
+
+class Layer:
+    """One compositor layer: its drawables, a cached surface and redraw stats"""
+
+    def __init__(self, index, size, opaque=False):
+        self.index = index
+        self.size = size
+        self.opaque = opaque  # Opaque layers cover the whole screen (no alpha needed)
+        self.camera = index in CAMERA_LAYERS  # Moves with the camera offset (screen shake)
+        self.drawables = []
+        self.surface = None  # Cached pixels of the last redraw
+        self.rects = []  # Regions of the cached surface that hold content
+        self.cached = False  # Whether the surface matches the current key
+        self.key = None  # Content key the layer was last drawn with
+        self.changed = True  # Set by mark_changed() to force a redraw
+        self.volatile = False  # Changed last frame as well (drawn straight to the target)
+        self.shown = False  # Had visible drawables in the last composite
+
+        # Stats
+        self.redraws = 0
+        self.reuses = 0
+        self.draw_time = 0.0
+
+    def get_surface(self):
+        """Get the cache surface, creating it on first use"""
+        if self.surface is None:
+            if self.opaque:
+                self.surface = pygame.Surface(self.size).convert()
+            else:
+                self.surface = pygame.Surface(self.size, pygame.SRCALPHA).convert_alpha()
+                self.surface.fill((0, 0, 0, 0))
+        return self.surface
+
+
+class Drawable:
+    """A draw callback registered on a compositor layer"""
+
+    def __init__(self, draw, key=None, tracker=None, visible=None):
+        self.draw = draw  # Called with the surface to draw on
+        self.key = key  # Returns a value that changes whenever the drawing would
+        self.tracker = tracker  # DirtyTracker the draw callback reports its regions to
+        self.visible = visible  # Returns whether to draw at all (None = always)
+        self.entries = []  # Tracker entries recorded by the last draw
+
+    def is_visible(self):
+        """Check if the drawable should be drawn this frame"""
+        return self.visible is None or self.visible()
+
+
+class Compositor:
+    """Draws registered drawables layer by layer, reusing layers whose content is unchanged"""
+
+    def __init__(self, size):
+        self.size = size
+        self.layers = {}
+        self.target = None  # Surface that still holds the last composite
+        self.offset = (0, 0)  # Camera offset of the last composite
+        self.back_buffer = None  # Reused for the camera layers while the camera is offset
+
+    def add(self, layer, draw, key=None, tracker=None, visible=None, opaque=False):
+        """Register a draw callback on a layer (LAYER_* constant)"""
+        if layer not in self.layers:
+            self.layers[layer] = Layer(layer, self.size, opaque)
+        if tracker is not None:
+            # Cached layers are copied back using the regions the drawables report
+            tracker.enabled = True
+        drawable = Drawable(draw, key, tracker, visible)
+        self.layers[layer].drawables.append(drawable)
+        return drawable
+
+    def mark_changed(self, layer):
+        """Force a layer to redraw next frame"""
+        if layer in self.layers:
+            self.layers[layer].changed = True
+
+    def invalidate(self):
+        """Note that the target was drawn over since the last composite"""
+        self.target = None
+
+    def draw(self, target, offset=(0, 0)):
+        """Composite every layer onto the target, camera layers shifted by offset; False if nothing changed"""
+        plan = []
+        for index in sorted(self.layers):
+            layer = self.layers[index]
+            drawables = [drawable for drawable in layer.drawables if drawable.is_visible()]
+            if drawables:
+                key = self.get_key(drawables)
+                changed = layer.changed or key is None or key != layer.key
+            else:
+                key = None
+                changed = layer.shown  # Was showing something last frame (keyless layers too)
+            plan.append((layer, drawables, key, changed))
+
+        if target is self.target and offset == self.offset and not any(changed for layer, drawables, key, changed in plan):
+            # Nothing changed - the target still holds this exact frame
+            for layer, drawables, key, changed in plan:
+                if drawables:
+                    self.carry_entries(drawables)
+                    layer.reuses += 1
+                layer.volatile = False
+            return False
+
+        # While offset, the bottom run of camera layers is composited on the back buffer
+        # and blitted once; camera layers further up are blitted offset from their cache
+        shifted = offset != (0, 0)
+        dest = self.get_back_buffer() if shifted else target
+        for layer, drawables, key, changed in plan:
+            layer_offset = (0, 0)
+            if dest is not target and not layer.camera:
+                self.blit_offset(dest, target, offset)
+                dest = target
+            elif shifted and layer.camera and dest is target:
+                layer_offset = offset
+
+            if not drawables:
+                layer.cached = False
+            elif not changed and layer.cached:
+                self.reuse_layer(layer, drawables, dest, layer_offset)
+            elif changed and layer.volatile and layer_offset == (0, 0):
+                # Changing every frame: caching would only add a copy
+                self.redraw_layer(layer, drawables, dest)
+                if layer.cached:
+                    self.force_entries(drawables)
+                layer.cached = False
+            else:
+                self.redraw_layer(layer, drawables, layer.get_surface())
+                self.reuse_layer(layer, drawables, dest, layer_offset, count=False)
+                if layer.shown and not layer.cached:
+                    self.force_entries(drawables)
+                layer.cached = True
+
+            layer.key = key
+            layer.shown = bool(drawables)
+            layer.volatile = changed
+            layer.changed = False
+
+        if dest is not target:
+            self.blit_offset(dest, target, offset)
+        self.target = target
+        self.offset = offset
+        return True
+
+    def get_back_buffer(self):
+        """Get the camera back buffer, creating it on first use"""
+        if self.back_buffer is None:
+            self.back_buffer = pygame.Surface(self.size).convert()
+        return self.back_buffer
+
+    def blit_offset(self, source, target, offset):
+        """Blit a full-screen surface shifted by the offset, blacking out the uncovered edges"""
+        offset_x, offset_y = offset
+        width, height = self.size
+        target.blit(source, offset)
+        if offset_x > 0:
+            target.fill((0, 0, 0), (0, 0, offset_x, height))
+        elif offset_x < 0:
+            target.fill((0, 0, 0), (width + offset_x, 0, -offset_x, height))
+        if offset_y > 0:
+            target.fill((0, 0, 0), (0, 0, width, offset_y))
+        elif offset_y < 0:
+            target.fill((0, 0, 0), (0, height + offset_y, width, -offset_y))
+
+    def get_key(self, drawables):
+        """Get the content key of a layer (None if it animates every frame)"""
+        # A drawable without a key animates every frame, so the layer can't be reused
+        if any(drawable.key is None for drawable in drawables):
+            return None
+        return tuple((id(drawable), drawable.key()) for drawable in drawables)
+
+    def redraw_layer(self, layer, drawables, surface):
+        """Run a layer's draw callbacks on a surface"""
+        start = time.perf_counter()
+
+        if surface is layer.surface and not layer.opaque:
+            # Clear what the previous redraw left behind
+            for rect in layer.rects:
+                surface.fill((0, 0, 0, 0), rect)
+
+        rects = []
+        for drawable in drawables:
+            tracker = drawable.tracker
+            first = len(tracker.current) if tracker else 0
+            drawable.draw(surface)
+            if tracker:
+                drawable.entries = tracker.current[first:]
+                rects.extend(pygame.Rect(rect) for rect, key in drawable.entries)
+            else:
+                rects.append(surface.get_rect())  # Unknown extent: assume everything
+
+        if surface is layer.surface:
+            layer.rects = merge_rects(rects, surface.get_rect(), full_threshold=1.0)
+
+        layer.redraws += 1
+        layer.draw_time += time.perf_counter() - start
+
+    def reuse_layer(self, layer, drawables, target, offset=(0, 0), count=True):
+        """Copy a layer's cached content onto the target"""
+        offset_x, offset_y = offset
+        if layer.opaque:
+            target.blit(layer.surface, offset)
+        else:
+            target.blits([(layer.surface, (rect.x + offset_x, rect.y + offset_y), rect)
+                          for rect in layer.rects], doreturn=False)
+
+        if count:
+            self.carry_entries(drawables)
+            layer.reuses += 1
+
+    def carry_entries(self, drawables):
+        """Report reused drawables' regions again, since they are still on screen"""
+        for drawable in drawables:
+            if drawable.tracker:
+                drawable.tracker.current.extend(drawable.entries)
+
+    def force_entries(self, drawables):
+        """Report drawables' regions again after switching between direct and cached drawing"""
+        # Alpha blends through the cache differ slightly from drawing straight on the
+        # target, so the same content keys can still leave different pixels behind
+        for drawable in drawables:
+            if drawable.tracker:
+                for rect, key in drawable.entries:
+                    drawable.tracker.force(rect)
+
+    def get_stats(self):
+        """Get redraw counts and time (ms) per layer"""
+        return {
+            index: {
+                'redraws': layer.redraws,
+                'reuses': layer.reuses,
+                'draw_time_ms': layer.draw_time * 1000
+            }
+            for index, layer in sorted(self.layers.items())
+        }
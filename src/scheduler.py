@@ -0,0 +1,104 @@
+"""
+Multi-rate update scheduler: each subsystem declares how often it needs to run
+(every tick, a few times per second, or only when triggered) and is timed
+"""
+import time
+from settings import SIMULATION_RATE
+
+EVERY_TICK = 0  # Rate of tasks that run on every simulation tick
+ON_EVENT = None  # Rate of tasks that only run when triggered
+
+
+class ScheduledTask:
+    """A subsystem update callback, its rate and timing stats"""
+
+    def __init__(self, name, callback, rate, interval, phase, elapsed):
+        self.name = name
+        self.callback = callback
+        self.rate = rate  # Runs per second (EVERY_TICK / ON_EVENT)
+        self.interval = interval  # Ticks between runs (None = only when triggered)
+        self.countdown = phase + 1  # Ticks until the next run
+        self.elapsed = elapsed  # Pass the ticks since the last run to the callback
+        self.ticks = 0  # Ticks since the last run
+        self.triggered = False  # Run on the next tick whatever the rate
+
+        # Stats
+        self.runs = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def is_due(self):
+        """Count a tick and check if the task should run on it"""
+        self.ticks += 1
+        if self.interval is not None:
+            self.countdown -= 1
+        return self.triggered or (self.interval is not None and self.countdown <= 0)
+
+
+class Scheduler:
+    """Runs subsystem updates at their own rates, in the order they were added"""
+
+    def __init__(self, tick_rate=SIMULATION_RATE):
+        self.tick_rate = tick_rate  # Ticks per second
+        self.tasks = []
+        self.by_name = {}
+        self.ticks = 0
+
+    def add(self, name, callback, rate=EVERY_TICK, elapsed=False):
+        """Register an update; rate is runs per second, EVERY_TICK or ON_EVENT"""
+        if rate is ON_EVENT:
+            interval = None
+            phase = 0
+        else:
+            interval = max(1, round(self.tick_rate / rate)) if rate else 1
+            # Spread slow tasks over different ticks so they don't all land on one
+            phase = len(self.tasks) % interval
+        task = ScheduledTask(name, callback, rate, interval, phase, elapsed)
+        self.tasks.append(task)
+        self.by_name[name] = task
+        return task
+
+    def trigger(self, name):
+        """Run a task on the next tick (event-driven tasks, or a slow task early)"""
+        task = self.by_name.get(name)
+        if task:
+            task.triggered = True
+
+    def tick(self):
+        """Advance one simulation tick, running every task that is due"""
+        self.ticks += 1
+        for task in self.tasks:
+            if task.is_due():
+                self.run_task(task)
+
+    def run_task(self, task):
+        """Run a task's callback and record how long it took"""
+        ticks = task.ticks
+        task.ticks = 0
+        task.triggered = False
+        if task.interval is not None:
+            task.countdown = task.interval
+
+        start = time.perf_counter()
+        if task.elapsed:
+            task.callback(ticks)
+        else:
+            task.callback()
+        duration = time.perf_counter() - start
+
+        task.runs += 1
+        task.total_time += duration
+        task.max_time = max(task.max_time, duration)
+
+    def get_stats(self):
+        """Get run counts and time (ms) per task"""
+        return {
+            task.name: {
+                'rate': 'tick' if task.rate == EVERY_TICK else ('event' if task.rate is ON_EVENT else task.rate),
+                'runs': task.runs,
+                'time_ms': task.total_time * 1000,
+                'avg_ms': task.total_time * 1000 / task.runs if task.runs else 0.0,
+                'max_ms': task.max_time * 1000
+            }
+            for task in self.tasks
+        }
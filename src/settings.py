@@ -1,7 +1,16 @@
-# Screen dimensions - 1080p
+# Display dimensions - 1080p fullscreen
+DISPLAY_WIDTH = 1920
+DISPLAY_HEIGHT = 1080
+
+# Internal render resolution - the game draws at this size and is scaled once to the display
+# (e.g. 960x540 or 1280x720 keeps low-end machines at a stable frame rate)
 SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
 
+# Layout values are designed for 1080p and scaled to the internal resolution
+DESIGN_HEIGHT = 1080
+LAYOUT_SCALE = SCREEN_HEIGHT / DESIGN_HEIGHT
+
 # Stardew Valley inspired color palette
 WATER_COLOR = (76, 145, 178)  # Soft blue water
 WATER_DEEP = (57, 110, 138)  # Deeper water
@@ -9,6 +18,10 @@ SAND_COLOR = (237, 201, 175)  # Light sandy beach
 GRASS_COLOR = (139, 195, 74)  # Fresh grass
 DIRT_COLOR = (161, 130, 98)  # Brown dirt
 
+# Wooper sprite frames
+WOOPER_ANIMATION_FRAMES = 2  # Walk cycle frames per direction (baked art)
+WOOPER_SPRITE_SHEET = None  # Optional sheet path: 32x32 frames, rows down/up/left/right, columns = frames
+
 # Wooper-inspired player colors
 WOOPER_BLUE = (79, 164, 210)  # Light blue body
 WOOPER_DARK_BLUE = (47, 116, 163)  # Dark blue accents
@@ -22,14 +35,53 @@ UI_ACCENT = (255, 246, 229)  # Cream
 UI_BORDER = (143, 86, 59)  # Medium brown
 
 # Game settings - Ultra smooth
-FPS = 240
-TILE_SIZE = 64  # Larger tiles for 1080p
-PLAYER_SPEED = 4  # Scaled for higher resolution
+FPS = 240  # Render rate cap (0 = uncapped); gameplay speed does not depend on it
+SIMULATION_RATE = 60  # Fixed gameplay ticks per second; every timer counts ticks
+MAX_SIMULATION_STEPS = 8  # Ticks caught up per rendered frame before the game slows down instead
+WEATHER_UPDATE_RATE = 1  # Weather and time-of-day checks per second (stat changes trigger one early)
+CALENDAR_UPDATE_RATE = 1  # Daily statistics rollover and playtime checks per second
+TILE_SIZE = round(64 * LAYOUT_SCALE)  # Larger tiles for 1080p
+PLAYER_SPEED = max(1, round(4 * LAYOUT_SCALE))  # Pixels per tick, scaled for higher resolution
+
+# Water rendering
+WATER_WAVE_LAYERS = 5  # Animated wave layers drawn over the base water
+WATER_CACHE_BUDGET_MB = 32  # Memory budget for pre-rendered wave strips (12 phases need ~27MB)
+SPARKLE_DENSITY = 100  # Water sparkles per frame (cost stays flat, raise freely on big displays)
+
+# Rendering
+DIRTY_RECT_MODE = False  # Only push changed screen regions to the display (software renderers)
+DIRTY_RECT_FULL_THRESHOLD = 0.6  # Fall back to a full flip once this fraction of the screen changed
+MENU_PULSE_RATE = 8  # Menu prompt brightness changes per second (the menu is idle in between)
+TEXT_CACHE_SIZE = 512  # Rendered text surfaces kept for reuse (least recently used are evicted)
+DEBUG_OVERLAY_REFRESH = 2  # Performance overlay (F3) updates per second
+
+# Fish sprites
+FISH_ATLAS_WIDTH = 512  # Width of the packed fish sprite atlas
+FISH_ICON_HEIGHT = max(1, round(24 * LAYOUT_SCALE))  # Fish icon height in the collection list
+FISH_ATLAS_BACKGROUND_BUILD = True  # Build the fish atlas on a worker thread at startup
+LOOT_TABLE_CACHE_SIZE = 64  # Catch distributions kept per environment/rod state (least recently used are evicted)
+
+# Particles
+PARTICLE_CAPACITY = 4096  # Hard limit on live particles (rows are preallocated)
+PARTICLE_OVERFLOW_POLICY = 'drop_oldest'  # When full: 'drop_oldest', 'drop_smallest' or 'reject' new ones
+PARTICLE_EMITTER_BUDGETS = {  # Max live particles per effect, so one burst type can't starve the rest
+    'catch': 1536,
+    'level_up': 1024,
+    'achievement': 1024,
+    'splash': 512,
+    'ripple': 256,
+    'stars': 512
+}
+PARTICLE_GRAVITY = 0.2  # Downward acceleration per tick at 1080p
+PARTICLE_COLOR_STEP = 8  # Color channel bucket width for cached particle sprites (1 = exact colors)
+PARTICLE_ALPHA_STEP = 16  # Alpha bucket width for cached particle sprites (1 = exact fades)
+PARTICLE_SPRITE_CACHE_SIZE = 4096  # Cached particle sprites before the cache is flushed
 
 # Fishing mechanics constants
-BITE_WINDOW_FRAMES = 90  # 1.5 seconds at 60 FPS to react to bite
-FAILED_MESSAGE_DURATION = 60  # 1 second to show "got away" message
-CATCH_DISPLAY_DURATION = 180  # 3 seconds to show catch notification
+BITE_WINDOW_FRAMES = round(1.5 * SIMULATION_RATE)  # 1.5 seconds (in ticks) to react to bite
+FAILED_MESSAGE_DURATION = SIMULATION_RATE  # 1 second to show "got away" message
+CATCH_DISPLAY_DURATION = 3 * SIMULATION_RATE  # 3 seconds to show catch notification
+CATCH_LOG_SIZE = 500  # Recent catches kept in memory (totals live in the collection and statistics)
 
 # Render layers (higher = drawn on top)
 LAYER_BACKGROUND = 0
@@ -40,3 +92,6 @@ LAYER_UI_BASE = 4
 LAYER_FISHING_ELEMENTS = 5  # Bobber/line drawn after base UI
 LAYER_UI_OVERLAY = 6  # Popups, notifications
 LAYER_UI_TOP = 7  # Pause screen, daily rewards
+
+# Layers that move with the camera (screen shake); the UI layers stay steady
+CAMERA_LAYERS = (LAYER_BACKGROUND, LAYER_WORLD, LAYER_PLAYER, LAYER_PARTICLES, LAYER_FISHING_ELEMENTS)
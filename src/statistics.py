@@ -6,12 +6,18 @@ import pygame
 import json
 import os
 from datetime import datetime
+from render import DirtyTracker
+from game_clock import game_clock
+from utils import scaled, get_overlay
+from fonts import get_font, render_text
 
 
 class StatisticsTracker:
     """Track all player statistics"""
 
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock or game_clock
+
         # Catch statistics
         self.total_catches = 0
         self.total_shinies = 0
@@ -26,7 +32,7 @@ class StatisticsTracker:
 
         # Time statistics
         self.total_playtime = 0  # in seconds
-        self.session_start_time = datetime.now()
+        self.session_start_time = self.clock.monotonic()  # Game seconds at session start
         self.longest_session = 0
         self.total_sessions = 0
 
@@ -72,7 +78,7 @@ class StatisticsTracker:
         # Daily/Weekly records
         self.catches_today = 0
         self.gold_today = 0
-        self.last_daily_reset = datetime.now().date()
+        self.last_daily_reset = self.clock.today()
 
         # Load saved stats
         self.load()
@@ -90,7 +96,7 @@ class StatisticsTracker:
         if fish.is_shiny:
             self.total_shinies += 1
             if self.first_shiny_time is None:
-                self.first_shiny_time = datetime.now()
+                self.first_shiny_time = self.clock.now()
 
         # Gold tracking
         self.total_gold_earned += fish.points
@@ -124,11 +130,11 @@ class StatisticsTracker:
 
         # First catch milestone
         if self.first_catch_time is None:
-            self.first_catch_time = datetime.now()
+            self.first_catch_time = self.clock.now()
 
         # Mythic milestone
         if fish.rarity == "mythic" and self.first_mythic_time is None:
-            self.first_mythic_time = datetime.now()
+            self.first_mythic_time = self.clock.now()
 
     def record_miss(self):
         """Record a missed catch"""
@@ -141,13 +147,13 @@ class StatisticsTracker:
 
     def update_playtime(self):
         """Update total playtime"""
-        current_session = (datetime.now() - self.session_start_time).total_seconds()
+        current_session = self.clock.monotonic() - self.session_start_time
         if current_session > self.longest_session:
             self.longest_session = current_session
 
     def check_daily_reset(self):
         """Reset daily statistics if new day"""
-        today = datetime.now().date()
+        today = self.clock.today()
         if today != self.last_daily_reset:
             self.catches_today = 0
             self.gold_today = 0
@@ -228,46 +234,48 @@ class StatisticsUI:
     """UI for displaying statistics"""
 
     def __init__(self):
-        self.font = pygame.font.Font(None, 20)
-        self.title_font = pygame.font.Font(None, 32)
-        self.small_font = pygame.font.Font(None, 16)
+        self.font = get_font(scaled(20))
+        self.title_font = get_font(scaled(32))
+        self.small_font = get_font(scaled(16))
+
+        # Regions changed since last frame (dirty-rect rendering)
+        self.dirty = DirtyTracker()
 
     def draw_box(self, screen, x, y, width, height, color=(60, 50, 70)):
         """Draw a styled box"""
-        pygame.draw.rect(screen, (0, 0, 0, 50), (x + 3, y + 3, width, height))
+        pygame.draw.rect(screen, (0, 0, 0), (x + scaled(3), y + scaled(3), width, height))
         pygame.draw.rect(screen, color, (x, y, width, height))
         pygame.draw.rect(screen, (101, 67, 33), (x, y, width, height), 3)
-        pygame.draw.rect(screen, (205, 133, 63), (x + 3, y + 3, width - 6, height - 6), 1)
+        pygame.draw.rect(screen, (205, 133, 63), (x + scaled(3), y + scaled(3), width - scaled(6), height - scaled(6)), 1)
 
     def draw(self, screen, stats, screen_width, screen_height):
         """Draw statistics screen"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(200)
-        overlay.fill((15, 15, 25))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_overlay((screen_width, screen_height), (15, 15, 25, 200)), (0, 0))
+        stats_key = ('stats', stats.total_catches, stats.total_casts, stats.catches_today, stats.gold_today)
+        self.dirty.add((0, 0, screen_width, screen_height), stats_key)
 
         # Main stats box
-        box_width = 700
-        box_height = 500
+        box_width = scaled(700)
+        box_height = scaled(500)
         box_x = screen_width // 2 - box_width // 2
         box_y = screen_height // 2 - box_height // 2
 
         self.draw_box(screen, box_x, box_y, box_width, box_height)
 
         # Title
-        title_text = self.title_font.render("Statistics & Records", True, (255, 215, 0))
-        title_rect = title_text.get_rect(center=(box_x + box_width // 2, box_y + 20))
+        title_text = render_text(self.title_font, "Statistics & Records", (255, 215, 0))
+        title_rect = title_text.get_rect(center=(box_x + box_width // 2, box_y + scaled(20)))
         screen.blit(title_text, title_rect)
 
         # Two column layout
-        left_x = box_x + 20
-        right_x = box_x + box_width // 2 + 10
-        current_y = box_y + 50
+        left_x = box_x + scaled(20)
+        right_x = box_x + box_width // 2 + scaled(10)
+        current_y = box_y + scaled(50)
 
         # Left column - Catch Statistics
         self.draw_section_title(screen, left_x, current_y, "Catch Statistics")
-        current_y += 25
+        current_y += scaled(25)
 
         catch_stats = [
             f"Total Catches: {stats.total_catches}",
@@ -279,14 +287,14 @@ class StatisticsUI:
         ]
 
         for stat in catch_stats:
-            stat_text = self.font.render(stat, True, (200, 200, 200))
+            stat_text = render_text(self.font, stat, (200, 200, 200))
             screen.blit(stat_text, (left_x, current_y))
-            current_y += 20
+            current_y += scaled(20)
 
         # Rarity breakdown
-        current_y += 10
+        current_y += scaled(10)
         self.draw_section_title(screen, left_x, current_y, "By Rarity")
-        current_y += 25
+        current_y += scaled(25)
 
         rarity_colors = {
             "common": (200, 200, 200),
@@ -299,14 +307,14 @@ class StatisticsUI:
 
         for rarity, count in stats.catches_by_rarity.items():
             color = rarity_colors.get(rarity, (255, 255, 255))
-            rarity_text = self.font.render(f"{rarity.title()}: {count}", True, color)
+            rarity_text = render_text(self.font, f"{rarity.title()}: {count}", color)
             screen.blit(rarity_text, (left_x, current_y))
-            current_y += 18
+            current_y += scaled(18)
 
         # Right column - Economic & Time Stats
-        current_y = box_y + 50
+        current_y = box_y + scaled(50)
         self.draw_section_title(screen, right_x, current_y, "Economic Stats")
-        current_y += 25
+        current_y += scaled(25)
 
         econ_stats = [
             f"Total Gold: {stats.total_gold_earned:,}",
@@ -317,14 +325,14 @@ class StatisticsUI:
         ]
 
         for stat in econ_stats:
-            stat_text = self.font.render(stat, True, (255, 215, 0))
+            stat_text = render_text(self.font, stat, (255, 215, 0))
             screen.blit(stat_text, (right_x, current_y))
-            current_y += 20
+            current_y += scaled(20)
 
         # Time stats
-        current_y += 10
+        current_y += scaled(10)
         self.draw_section_title(screen, right_x, current_y, "Time Stats")
-        current_y += 25
+        current_y += scaled(25)
 
         time_stats = [
             f"Total Casts: {stats.total_casts}",
@@ -337,38 +345,38 @@ class StatisticsUI:
             time_stats.append(f"Slowest: {stats.slowest_catch:.1f}s")
 
         for stat in time_stats:
-            stat_text = self.font.render(stat, True, (144, 238, 144))
+            stat_text = render_text(self.font, stat, (144, 238, 144))
             screen.blit(stat_text, (right_x, current_y))
-            current_y += 20
+            current_y += scaled(20)
 
         # Bottom section - Environment breakdown
-        bottom_y = box_y + box_height - 100
-        self.draw_section_title(screen, box_x + 20, bottom_y, "Environmental Catches")
-        bottom_y += 20
+        bottom_y = box_y + box_height - scaled(100)
+        self.draw_section_title(screen, box_x + scaled(20), bottom_y, "Environmental Catches")
+        bottom_y += scaled(20)
 
         # Weather breakdown
-        weather_x = box_x + 20
-        weather_text = self.small_font.render("Weather:", True, (180, 180, 180))
+        weather_x = box_x + scaled(20)
+        weather_text = render_text(self.small_font, "Weather:", (180, 180, 180))
         screen.blit(weather_text, (weather_x, bottom_y))
-        bottom_y += 15
+        bottom_y += scaled(15)
 
         for weather, count in stats.catches_by_weather.items():
             if count > 0:
-                w_text = self.small_font.render(f"{weather}: {count}", True, (150, 150, 200))
+                w_text = render_text(self.small_font, f"{weather}: {count}", (150, 150, 200))
                 screen.blit(w_text, (weather_x, bottom_y))
-                bottom_y += 14
+                bottom_y += scaled(14)
 
         # Instructions
-        inst_text = self.small_font.render(
-            "Press T to close | ESC to return to menu",
-            True, (180, 180, 180)
+        inst_text = render_text(
+            self.small_font, "Press T to close | ESC to return to menu",
+            (180, 180, 180)
         )
-        inst_rect = inst_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - 15))
+        inst_rect = inst_text.get_rect(center=(box_x + box_width // 2, box_y + box_height - scaled(15)))
         screen.blit(inst_text, inst_rect)
 
     def draw_section_title(self, screen, x, y, title):
         """Draw a section title"""
-        title_surf = self.font.render(title, True, (255, 215, 0))
+        title_surf = render_text(self.font, title, (255, 215, 0))
         screen.blit(title_surf, (x, y))
         # Underline
-        pygame.draw.line(screen, (255, 215, 0), (x, y + 18), (x + 200, y + 18), 1)
+        pygame.draw.line(screen, (255, 215, 0), (x, y + scaled(18)), (x + scaled(200), y + scaled(18)), 1)
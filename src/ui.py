@@ -1,135 +1,173 @@
 import pygame
-from settings import SCREEN_WIDTH, UI_BG, UI_TEXT, UI_ACCENT, UI_BORDER, CATCH_DISPLAY_DURATION
+import math
+from settings import SCREEN_WIDTH, UI_BG, UI_TEXT, UI_ACCENT, UI_BORDER, CATCH_DISPLAY_DURATION, SIMULATION_RATE
+from render import DirtyTracker, union_rects
+from utils import scaled
+from fonts import get_font, render_text, get_outline_offsets
+from fish import fish_atlas
 
 class UI:
     def __init__(self):
-        # Scaled fonts for 1080p
-        self.font = pygame.font.Font(None, 64)
-        self.small_font = pygame.font.Font(None, 44)
-        self.title_font = pygame.font.Font(None, 56)
+        # Fonts scaled to the render resolution
+        self.font = get_font(scaled(64))
+        self.small_font = get_font(scaled(44))
+        self.title_font = get_font(scaled(56))
         self.score = 0
         self.fish_caught = 0
         self.last_catch = None
         self.catch_display_timer = 0
 
+        # Regions changed since last frame (dirty-rect rendering)
+        self.dirty = DirtyTracker()
+
     def update(self):
         # Countdown catch display timer
         if self.catch_display_timer > 0:
             self.catch_display_timer -= 1
 
-    def add_score(self, points, fish_name="Fish", rarity_color=(255, 255, 255), is_shiny=False):
+    def add_score(self, points, fish_name="Fish", rarity_color=(255, 255, 255), is_shiny=False, fish_id=None):
         """Add points to the score"""
         self.score += points
         self.fish_caught += 1
         self.last_catch = fish_name
+        self.last_catch_fish_id = fish_id
         self.last_catch_points = points
         self.last_catch_color = rarity_color
         self.last_catch_shiny = is_shiny
         self.catch_display_timer = CATCH_DISPLAY_DURATION
 
+    def get_draw_key(self, player=None, progression=None):
+        """Get a value that changes whenever draw() would draw something different"""
+        key = (self.score, self.fish_caught)
+        if progression:
+            key += (progression.level, progression.experience, progression.experience_to_next_level)
+        if self.catch_display_timer > 0:
+            key += (self.last_catch, self.last_catch_points, self.last_catch_color, self.last_catch_shiny)
+            if self.last_catch_shiny:
+                key += (int(scaled(10) * abs(math.sin(self.catch_display_timer / 10))),)
+        if player:
+            key += (player.fishing_state,)
+            if player.fishing_state == 'waiting':
+                key += ((player.bite_timer // (SIMULATION_RATE // 2)) % 4,)
+        return key
+
     def draw_box(self, screen, x, y, width, height):
         """Draw a Stardew Valley style box"""
+        shadow = scaled(3)
+        border = max(1, scaled(3))
         # Shadow
-        pygame.draw.rect(screen, (0, 0, 0, 50), (x + 3, y + 3, width, height))
+        pygame.draw.rect(screen, (0, 0, 0), (x + shadow, y + shadow, width, height))
         # Background
         pygame.draw.rect(screen, UI_BG, (x, y, width, height))
         # Border
-        pygame.draw.rect(screen, UI_BORDER, (x, y, width, height), 3)
+        pygame.draw.rect(screen, UI_BORDER, (x, y, width, height), border)
         # Inner highlight
-        pygame.draw.rect(screen, UI_ACCENT, (x + 3, y + 3, width - 6, height - 6), 1)
+        pygame.draw.rect(screen, UI_ACCENT, (x + border, y + border, width - 2 * border, height - 2 * border), 1)
 
     def draw(self, screen, player=None, progression=None):
-        # Top left info box (taller for level) - scaled for 1080p
-        box_height = 210 if progression else 160
-        self.draw_box(screen, 20, 20, 360, box_height)
+        # Top left info box (taller for level) - scaled to render size
+        box_x, box_y = scaled(20), scaled(20)
+        box_width = scaled(360)
+        box_height = scaled(210) if progression else scaled(160)
+        self.draw_box(screen, box_x, box_y, box_width, box_height)
+        hud_key = (self.score, self.fish_caught)
+        if progression:
+            hud_key += (progression.level, progression.experience, progression.experience_to_next_level)
+        self.dirty.add((box_x, box_y, box_width + scaled(3), box_height + scaled(3)), hud_key)
 
         # Score
-        score_text = self.title_font.render("Gold", True, UI_ACCENT)
-        screen.blit(score_text, (40, 36))
-        score_value = self.font.render(f"{self.score}", True, (255, 215, 0))
-        screen.blit(score_value, (40, 84))
+        score_text = render_text(self.title_font, "Gold", UI_ACCENT)
+        screen.blit(score_text, (scaled(40), scaled(36)))
+        score_value = render_text(self.font, f"{self.score}", (255, 215, 0))
+        screen.blit(score_value, (scaled(40), scaled(84)))
 
         # Fish caught
-        fish_icon = self.small_font.render("Fish:", True, UI_ACCENT)
-        screen.blit(fish_icon, (220, 40))
-        fish_value = self.title_font.render(f"{self.fish_caught}", True, (100, 200, 255))
-        screen.blit(fish_value, (240, 90))
+        fish_icon = render_text(self.small_font, "Fish:", UI_ACCENT)
+        screen.blit(fish_icon, (scaled(220), scaled(40)))
+        fish_value = render_text(self.title_font, f"{self.fish_caught}", (100, 200, 255))
+        screen.blit(fish_value, (scaled(240), scaled(90)))
 
         # Level display if progression exists
         if progression:
-            level_text = self.small_font.render("Level:", True, UI_ACCENT)
-            screen.blit(level_text, (40, 140))
-            level_value = self.title_font.render(f"{progression.level}", True, (144, 238, 144))
-            screen.blit(level_value, (140, 136))
+            level_text = render_text(self.small_font, "Level:", UI_ACCENT)
+            screen.blit(level_text, (scaled(40), scaled(140)))
+            level_value = render_text(self.title_font, f"{progression.level}", (144, 238, 144))
+            screen.blit(level_value, (scaled(140), scaled(136)))
 
             # Mini EXP bar (scaled)
             exp_progress = progression.experience / progression.experience_to_next_level
-            bar_width = 160
-            bar_height = 16
-            bar_x = 220
-            bar_y = 150
+            bar_width = scaled(160)
+            bar_height = scaled(16)
+            bar_x = scaled(220)
+            bar_y = scaled(150)
 
             pygame.draw.rect(screen, (40, 40, 40), (bar_x, bar_y, bar_width, bar_height))
             pygame.draw.rect(screen, (100, 200, 100), (bar_x, bar_y, int(bar_width * exp_progress), bar_height))
-            pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), 2)
+            pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_y, bar_width, bar_height), max(1, scaled(2)))
 
-        # Show last catch notification with rarity color (scaled for 1080p)
+        # Show last catch notification with rarity color (scaled to render size)
         if self.catch_display_timer > 0:
-            catch_width = 560
-            catch_height = 180
+            catch_width = scaled(560)
+            catch_height = scaled(180)
             catch_x = SCREEN_WIDTH // 2 - catch_width // 2
-            catch_y = 160
+            catch_y = scaled(160)
 
             self.draw_box(screen, catch_x, catch_y, catch_width, catch_height)
+            sparkle_offset = int(scaled(10) * abs(math.sin(self.catch_display_timer / 10)))
+            catch_key = (self.last_catch, self.last_catch_points, self.last_catch_shiny and sparkle_offset)
+            self.dirty.add((catch_x, catch_y, catch_width + scaled(3), catch_height + scaled(3)), catch_key)
+
+            # Fish sprite from the shared atlas
+            fish_id = getattr(self, 'last_catch_fish_id', None)
+            if fish_id:
+                fish_sprite = fish_atlas.get(fish_id, self.last_catch_shiny)
+                screen.blit(fish_sprite, fish_sprite.get_rect(center=(catch_x + scaled(60), catch_y + scaled(35))))
 
             # "Caught!" text (scaled)
-            caught_text = self.small_font.render("Caught!", True, UI_ACCENT)
-            caught_rect = caught_text.get_rect(center=(catch_x + catch_width // 2, catch_y + 30))
+            caught_text = render_text(self.small_font, "Caught!", UI_ACCENT)
+            caught_rect = caught_text.get_rect(center=(catch_x + catch_width // 2, catch_y + scaled(30)))
             screen.blit(caught_text, caught_rect)
 
             # Fish name with rarity color (with subtle outline for emphasis)
             fish_color = getattr(self, 'last_catch_color', (255, 255, 255))
-            # Draw outline/shadow for better readability (scaled)
-            outline_offsets = [(-2, -2), (2, -2), (-2, 2), (2, 2)]
-            fish_outline = self.title_font.render(self.last_catch, True, (20, 20, 20))
-            for offset_x, offset_y in outline_offsets:
-                outline_rect = fish_outline.get_rect(center=(catch_x + catch_width // 2 + offset_x, catch_y + 80 + offset_y))
-                screen.blit(fish_outline, outline_rect)
-            # Main fish name
-            fish_text = self.title_font.render(self.last_catch, True, fish_color)
-            fish_rect = fish_text.get_rect(center=(catch_x + catch_width // 2, catch_y + 80))
+            fish_center = (catch_x + catch_width // 2, catch_y + scaled(80))
+            # Outline/shadow for better readability is composited into the cached surface (scaled)
+            outline_offsets = get_outline_offsets(max(1, scaled(2)))
+            fish_text = render_text(self.title_font, self.last_catch, fish_color, (20, 20, 20), outline_offsets)
+            fish_rect = fish_text.get_rect(center=fish_center)
             screen.blit(fish_text, fish_rect)
 
             # Points (scaled)
-            points_text = self.title_font.render(f"+{self.last_catch_points} Gold", True, (255, 215, 0))
-            points_rect = points_text.get_rect(center=(catch_x + catch_width // 2, catch_y + 130))
+            points_text = render_text(self.title_font, f"+{self.last_catch_points} Gold", (255, 215, 0))
+            points_rect = points_text.get_rect(center=(catch_x + catch_width // 2, catch_y + scaled(130)))
             screen.blit(points_text, points_rect)
 
             # Shiny sparkle effect (scaled)
             if getattr(self, 'last_catch_shiny', False):
-                import math
-                sparkle_offset = int(10 * abs(math.sin(self.catch_display_timer / 10)))
-                sparkle_text = self.font.render("✨", True, (255, 255, 255))
-                screen.blit(sparkle_text, (catch_x + 20 + sparkle_offset, catch_y + 60))
-                screen.blit(sparkle_text, (catch_x + catch_width - 80 - sparkle_offset, catch_y + 60))
+                sparkle_text = render_text(self.font, "✨", (255, 255, 255))
+                screen.blit(sparkle_text, (catch_x + scaled(20) + sparkle_offset, catch_y + scaled(60)))
+                screen.blit(sparkle_text, (catch_x + catch_width - scaled(80) - sparkle_offset, catch_y + scaled(60)))
 
-        # Show Pokemon-style fishing status (scaled for 1080p)
+        # Show Pokemon-style fishing status (scaled to render size)
         if player:
             if player.fishing_state == 'waiting':
                 # Show dots like Pokemon (... ... ...)
-                dots = "." * ((player.bite_timer // 30) % 4)
-                status_text = self.title_font.render(f"...{dots}", True, (255, 255, 255))
-                screen.blit(status_text, (SCREEN_WIDTH // 2 - 60, 940))
+                dots = "." * ((player.bite_timer // (SIMULATION_RATE // 2)) % 4)
+                status_text = render_text(self.title_font, f"...{dots}", (255, 255, 255))
+                status_rect = screen.blit(status_text, (SCREEN_WIDTH // 2 - scaled(60), scaled(940)))
+                self.dirty.add(status_rect, dots)
             elif player.fishing_state == 'bite':
                 # Show "Oh! A bite!" message
-                status_text = self.font.render("Oh! A bite!", True, (255, 255, 100))
-                screen.blit(status_text, (SCREEN_WIDTH // 2 - 140, 930))
-                prompt_text = self.small_font.render("Press SPACE!", True, (255, 255, 255))
-                screen.blit(prompt_text, (SCREEN_WIDTH // 2 - 100, 990))
+                status_text = render_text(self.font, "Oh! A bite!", (255, 255, 100))
+                status_rect = screen.blit(status_text, (SCREEN_WIDTH // 2 - scaled(140), scaled(930)))
+                prompt_text = render_text(self.small_font, "Press SPACE!", (255, 255, 255))
+                prompt_rect = screen.blit(prompt_text, (SCREEN_WIDTH // 2 - scaled(100), scaled(990)))
+                self.dirty.add(union_rects([status_rect, prompt_rect]), 'bite')
             elif player.fishing_state == 'failed':
                 # Show "It got away!" message
-                status_text = self.font.render("It got away...", True, (200, 100, 100))
-                screen.blit(status_text, (SCREEN_WIDTH // 2 - 160, 940))
+                status_text = render_text(self.font, "It got away...", (200, 100, 100))
+                status_rect = screen.blit(status_text, (SCREEN_WIDTH // 2 - scaled(160), scaled(940)))
+                self.dirty.add(status_rect, 'failed')
 
         # Bottom right controls (subtle, organized by category)
         controls = [
@@ -152,17 +190,20 @@ class UI:
             ])
         ]
 
-        y_offset = 580  # Fixed position for 1080p
+        y_offset = scaled(580)  # Just below the shore line
+        controls_drawn = []
         for category, category_controls in controls:
             # Category header (slightly brighter) - scaled
-            header_text = self.small_font.render(category, True, (255, 215, 0))
-            screen.blit(header_text, (SCREEN_WIDTH - 300, y_offset))
-            y_offset += 40
+            header_text = render_text(self.small_font, category, (255, 215, 0))
+            controls_drawn.append(screen.blit(header_text, (SCREEN_WIDTH - scaled(300), y_offset)))
+            y_offset += scaled(40)
 
             # Controls in category - scaled
             for control in category_controls:
-                control_text = self.small_font.render(control, True, (180, 180, 180))
-                screen.blit(control_text, (SCREEN_WIDTH - 290, y_offset))
-                y_offset += 36
+                control_text = render_text(self.small_font, control, (180, 180, 180))
+                controls_drawn.append(screen.blit(control_text, (SCREEN_WIDTH - scaled(290), y_offset)))
+                y_offset += scaled(36)
+
+            y_offset += scaled(10)  # Extra spacing between categories
 
-            y_offset += 10  # Extra spacing between categories
+        self.dirty.add(union_rects(controls_drawn), 'controls')
@@ -1,6 +1,38 @@
 import pygame
+from settings import LAYOUT_SCALE
+from fonts import get_font, render_text
+
+def scaled(value):
+    """Scale a 1080p layout value to the internal render resolution"""
+    return int(round(value * LAYOUT_SCALE))
+
+# Full-screen translucent overlays, built once per (size, color) and shared
+overlay_cache = {}
+
+def get_overlay(size, color):
+    """Get the shared full-screen dim surface for a size and RGBA color"""
+    key = (tuple(size), tuple(color))
+    overlay = overlay_cache.get(key)
+    if overlay is None:
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            overlay = overlay.convert_alpha()
+        overlay.fill(color)
+        overlay_cache[key] = overlay
+    return overlay
 
 def draw_text(screen, text, size, color, x, y):
-    font = pygame.font.Font(None, size)
-    text_surface = font.render(text, True, color)
+    font = get_font(size)
+    text_surface = render_text(font, text, color)
     screen.blit(text_surface, (x, y))
+
+def load_sprite_sheet(path, frame_size):
+    """Load a sprite sheet as rows of frames (frame_size is (width, height))"""
+    sheet = pygame.image.load(path)
+    if pygame.display.get_surface() is not None:
+        sheet = sheet.convert_alpha()
+    width, height = frame_size
+    return [
+        [sheet.subsurface((x, y, width, height)).copy() for x in range(0, sheet.get_width() - width + 1, width)]
+        for y in range(0, sheet.get_height() - height + 1, height)
+    ]
@@ -0,0 +1,187 @@
+"""
+Water rendering: pre-rendered scrolling wave strips and batched sparkles
+"""
+import math
+import numpy as np
+import pygame
+from settings import (WATER_COLOR, WATER_DEEP, SCREEN_WIDTH, SCREEN_HEIGHT, WATER_WAVE_LAYERS,
+                      WATER_CACHE_BUDGET_MB, SPARKLE_DENSITY, LAYOUT_SCALE)
+
+
+# Wave dot layout at 1080p (matches the original procedural waves)
+WAVE_START_X = -100  # First dot x position
+WAVE_DOT_SPACING = 12  # Horizontal distance between dots
+WAVE_DOT_RADIUS = 3
+WAVE_BASE_Y = 100  # Baseline of the top layer
+WAVE_LAYER_SPACING = 80  # Vertical distance between layers
+WAVE_AMPLITUDE_1 = 12  # sin(0.02x) term
+WAVE_AMPLITUDE_2 = 6  # cos(0.03x) term
+
+# sin(0.02x + o) and cos(0.03x + 1.5o) both travel 50px per unit of offset,
+# so every layer is a pure horizontal scroll of one fixed wave shape
+WAVE_SCROLL_SPEED = 50
+# Common period of sin(0.02x) and cos(0.03x)
+WAVE_PERIOD = 200 * math.pi
+
+# Colorkey for transparent strip pixels
+STRIP_COLORKEY = (255, 0, 255)
+
+
+class WaterRenderer:
+    """Draws animated wave layers by blitting pre-rendered strips"""
+
+    def __init__(self, width=SCREEN_WIDTH, water_bottom=SCREEN_HEIGHT // 2,
+                 layers=WATER_WAVE_LAYERS, budget_mb=WATER_CACHE_BUDGET_MB, scale=LAYOUT_SCALE):
+        self.width = width
+        self.water_bottom = water_bottom
+        self.layers = layers
+
+        # Wave geometry scaled to the render resolution
+        self.start_x = round(WAVE_START_X * scale)
+        self.dot_spacing = max(1, round(WAVE_DOT_SPACING * scale))
+        self.dot_radius = max(1, round(WAVE_DOT_RADIUS * scale))
+        self.base_y = round(WAVE_BASE_Y * scale)
+        self.layer_spacing = round(WAVE_LAYER_SPACING * scale)
+        self.amplitude_1 = WAVE_AMPLITUDE_1 * scale
+        self.amplitude_2 = WAVE_AMPLITUDE_2 * scale
+        self.amplitude = int(self.amplitude_1) + int(self.amplitude_2)
+        self.frequency = 1 / scale  # Wavelengths stretch with the resolution
+        self.scroll_speed = WAVE_SCROLL_SPEED * scale
+        self.period = WAVE_PERIOD * scale
+
+        # Strips cover one full wave period plus the visible width
+        self.origin = -(self.dot_radius + 1)
+        self.strip_width = width + int(math.ceil(self.period)) + 2 * (self.dot_radius + 1)
+        self.strip_height = 2 * (self.amplitude + self.dot_radius) + 1
+
+        # One strip per dot phase (sub-spacing offset); fewer phases when the budget is tight
+        self.phases = self.phases_for_budget(budget_mb)
+        self.strips = [
+            [self.build_strip(layer, phase) for phase in range(self.phases)]
+            for layer in range(layers)
+        ]
+
+    def strip_bytes(self):
+        """Get the memory used by a single strip"""
+        return self.strip_width * self.strip_height * 4
+
+    def phases_for_budget(self, budget_mb):
+        """Get how many dot phases fit in the memory budget"""
+        per_phase = self.strip_bytes() * max(1, self.layers)
+        phases = int(budget_mb * 1024 * 1024) // per_phase
+        return max(1, min(self.dot_spacing, phases))
+
+    def get_cache_size(self):
+        """Get total memory used by the strip cache in bytes"""
+        return self.strip_bytes() * self.layers * self.phases
+
+    def get_layer_color(self, layer):
+        """Get the wave color for a layer (deeper layers are darker)"""
+        wave_alpha = 40 - layer * 6
+        return (
+            min(255, WATER_DEEP[0] + wave_alpha),
+            min(255, WATER_DEEP[1] + wave_alpha),
+            min(255, WATER_DEEP[2] + wave_alpha)
+        )
+
+    def get_layer_top(self, layer):
+        """Get the screen y of a layer's strip"""
+        return self.base_y + layer * self.layer_spacing - self.amplitude - self.dot_radius
+
+    def build_strip(self, layer, phase):
+        """Pre-render one layer's wave dots for a single dot phase"""
+        surface = pygame.Surface((self.strip_width, self.strip_height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(STRIP_COLORKEY)
+        surface.set_colorkey(STRIP_COLORKEY, pygame.RLEACCEL)
+
+        color = self.get_layer_color(layer)
+        center_y = self.amplitude + self.dot_radius
+        baseline = self.base_y + layer * self.layer_spacing
+        dot_offset = phase * self.dot_spacing // self.phases
+
+        # Dots sit at wave coordinate u = x + scroll, one every dot_spacing
+        first_u = self.origin - self.dot_radius
+        u = first_u + (dot_offset - first_u) % self.dot_spacing
+        last_u = self.origin + self.strip_width + self.dot_radius
+        while u <= last_u:
+            y = (int(self.amplitude_1 * math.sin(u * 0.02 * self.frequency)) +
+                 int(self.amplitude_2 * math.cos(u * 0.03 * self.frequency)))
+            if baseline + y < self.water_bottom:  # Keep within water zone
+                pygame.draw.circle(surface, color, (u - self.origin, center_y + y), self.dot_radius)
+            u += self.dot_spacing
+
+        return surface
+
+    def draw(self, screen, anim_frame):
+        """Draw all wave layers for the given animation frame"""
+        for layer, strips in enumerate(self.strips):
+            wave_offset = anim_frame * (1 + layer * 0.3)
+            scroll = int(round((wave_offset * self.scroll_speed) % self.period))
+
+            # Screen dots sit at start_x + n * spacing, i.e. u = that + scroll
+            dot_phase = (self.start_x + scroll) % self.dot_spacing
+            strip = strips[dot_phase * self.phases // self.dot_spacing]
+
+            area = (scroll - self.origin, 0, self.width, self.strip_height)
+            screen.blit(strip, (0, self.get_layer_top(layer)), area)
+
+
+class SparkleField:
+    """Water surface sparkles computed as arrays and written in one batch"""
+
+    def __init__(self, width=SCREEN_WIDTH, water_bottom=SCREEN_HEIGHT // 2, density=SPARKLE_DENSITY, scale=LAYOUT_SCALE):
+        self.width = width
+        self.water_bottom = water_bottom
+        self.margin = round(30 * scale)  # Keep sparkles away from the water edges
+        self.set_density(density)
+
+    def set_density(self, density):
+        """Change how many sparkles are simulated"""
+        self.density = density
+        self.index = np.arange(density, dtype=np.int64)
+        self.seed_base = self.index * 100
+        self.life_base = self.index * 10
+
+    def draw(self, screen, anim_frame):
+        """Write all visible sparkles for the given animation frame"""
+        if self.density == 0:
+            return
+
+        seed = self.seed_base + int(anim_frame * 10)
+        x = (seed * 73) % self.width
+        y = (seed * 31) % (self.water_bottom - 2 * self.margin) + self.margin
+
+        # Clip to the target as well, since set_at used to ignore off-surface pixels
+        max_x = min(self.width, screen.get_width())
+        max_y = min(self.water_bottom, screen.get_height())
+
+        # Sparkle fades in and out
+        life = (anim_frame * 20 + self.life_base) % 100
+        visible = (life < 30) & (x > 0) & (y > 0) & (x < max_x) & (y < max_y)
+        if not visible.any():
+            return
+
+        x, y, life = x[visible], y[visible], life[visible]
+        brightness = (255 * (life / 30)).astype(np.int64)
+        colors = np.minimum(255, np.add.outer(brightness // 2, WATER_COLOR))
+
+        pixels = pygame.surfarray.pixels3d(screen)
+        pixels[x, y] = colors
+
+        # Brightest sparkles get extra pixels
+        bright = life > 15
+        right = bright & (x + 1 < max_x)
+        pixels[x[right] + 1, y[right]] = colors[right]
+        below = bright & (y + 1 < max_y)
+        pixels[x[below], y[below] + 1] = colors[below]
+        del pixels  # Unlock the surface
+
+        if screen.get_flags() & pygame.SRCALPHA:
+            # On a transparent layer the sparkle pixels must become opaque too
+            alpha = pygame.surfarray.pixels_alpha(screen)
+            alpha[x, y] = 255
+            alpha[x[right] + 1, y[right]] = 255
+            alpha[x[below], y[below] + 1] = 255
+            del alpha